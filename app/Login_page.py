@@ -1,6 +1,6 @@
 import sys
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QEvent
 from PyQt6.QtGui import QColor
 
 from interfaces.login_ui import Ui_Form
@@ -85,7 +85,7 @@ class LoginWindow(FramelessWindow, Ui_Form):
         """登录验证"""
         # 如果是访客模式，直接登录
         if self.pushButton_2.isChecked():
-            self.login_success("访客")
+            self.login_success(self.tr("访客"))
             return
             
         # 获取用户名和密码
@@ -94,23 +94,23 @@ class LoginWindow(FramelessWindow, Ui_Form):
         
         # 验证用户名和密码
         if not username:
-            self.show_error_message("请输入用户名")
+            self.show_error_message(self.tr("请输入用户名"))
             return
             
         if not password:
-            self.show_error_message("请输入密码")
+            self.show_error_message(self.tr("请输入密码"))
             return
             
         # 验证用户名和密码是否正确
         if username == self.valid_username and password == self.valid_password:
             self.login_success(username)
         else:
-            self.show_error_message("用户名或密码错误")
+            self.show_error_message(self.tr("用户名或密码错误"))
             
     def show_error_message(self, message):
         """显示错误消息"""
         InfoBar.error(
-            title="登录失败",
+            title=self.tr("登录失败"),
             content=message,
             orient=Qt.Orientation.Horizontal,
             isClosable=True,
@@ -119,6 +119,12 @@ class LoginWindow(FramelessWindow, Ui_Form):
             parent=self
         )
             
+    def changeEvent(self, e):
+        """切换语言时重设界面文本"""
+        if e.type() == QEvent.Type.LanguageChange:
+            self.retranslateUi(self)
+        super().changeEvent(e)
+
     def login_success(self, username):
         """登录成功后的操作"""
         # 获取应用控制器实例
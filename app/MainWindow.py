@@ -1,22 +1,33 @@
+import logging
 import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QSize, QTimer
-from PyQt6.QtGui import QKeySequence, QShortcut, QIcon
+from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
+from PyQt6.QtCore import Qt, QSize, QTimer, QEvent, QTime
+from PyQt6.QtGui import QIcon
 
 from qfluentwidgets import (
     FluentWindow, FluentIcon, 
-    NavigationItemPosition, InfoBar, InfoBarPosition, SplashScreen, 
-    isDarkTheme, RoundMenu, Action, 
-    MenuAnimationType, FluentTranslator
+    NavigationItemPosition, InfoBarPosition, SplashScreen, 
+    isDarkTheme, Action, SystemTrayMenu,
+    MenuAnimationType
 )
 from focus_interface import FocusInterface
 from stop_watch_interface import StopWatchInterface
 from setting_interface import SettingInterface
+from lazy_interface import LazyInterface
+from command_palette import CommandPalette
+from memory_trim import MemoryTrimmer
 from config import cfg
+from action_registry import ActionRegistry, ReusableRoundMenu, shortcutLabel
+from notification import notificationService
+from style_sheet import styleSheetManager
+from i18n import languageManager
+from reminder_scheduler import reminderScheduler
 from utils import signalBus, showHelpMessageBox
 
 from paths import icon_path 
 
+logger = logging.getLogger(__name__)
+
 
 class MainWindow(FluentWindow):
     def __init__(self, username="游客"):
@@ -28,6 +39,14 @@ class MainWindow(FluentWindow):
 
         self.connectSignalToSlot() # 连接信号槽
 
+        self._initContextMenu() # 初始化右键菜单
+
+        self._initCommandPalette() # 初始化命令面板
+
+        self._initSystemTray() # 初始化系统托盘
+
+        self._initMemoryTrimmer() # 初始化内存回收
+
         self._initNavigation() # 初始化导航栏
         
         self.splashScreen.finish() # 关闭闪屏
@@ -74,19 +93,23 @@ class MainWindow(FluentWindow):
         
     def _initSubInterface(self):
         """初始化子页面"""
+        styleSheetManager.preload() # 预先读入亮色和暗色样式表
+
         self.focusInterface = FocusInterface(self) # 专注
         self.addSubInterface(self.focusInterface, FluentIcon.RINGER, self.tr('Focus Time'))
 
         self.stopWatchInterface = StopWatchInterface(self) # 计时
         self.addSubInterface(self.stopWatchInterface, FluentIcon.STOP_WATCH, self.tr('Stop Watch'))
 
-        self.settingInterface = SettingInterface(self) # 设置
+        self.settingInterface = LazyInterface(SettingInterface, 'settingInterface', self) # 设置（延迟创建）
         self.addSubInterface(
             self.settingInterface, FluentIcon.SETTING, self.tr('Settings'), NavigationItemPosition.BOTTOM)
 
     def connectSignalToSlot(self):
         """连接信号槽"""
         signalBus.micaEnableChanged.connect(self.setMicaEffectEnabled)
+        signalBus.minimizeToTrayChanged.connect(self.setMinimizeToTray)
+        cfg.themeChanged.connect(styleSheetManager.switchTheme) # 主题改变信号，设置页可能被回收，在主窗口连接
 
     def _initNavigation(self):
         """初始化导航栏"""
@@ -101,76 +124,235 @@ class MainWindow(FluentWindow):
 
     def show_welcome_message(self, username):
         """显示欢迎消息"""
-        InfoBar.success(
-            title="Welcome",
-            content=f"Welcome back, {username}!",
-            orient=Qt.Orientation.Horizontal,
-            isClosable=True,
+        notificationService.success(
+            title=self.tr("Welcome"),
+            content=self.tr("Welcome back, {0}!").format(username),
             position=InfoBarPosition.TOP_RIGHT,
             duration=4000, 
             parent=self
         )
     
-    def contextMenuEvent(self, e):
-        """右键菜单"""
-        menu = RoundMenu(parent=self)
+    def _initContextMenu(self):
+        """初始化右键菜单（只构建一次，之后复用）"""
+        registry = ActionRegistry.of(self)
+        self.contextMenu = ReusableRoundMenu(parent=self)
+        menu = self.contextMenu
 
         # NOTE: 隐藏快捷键
         # menu.view.setItemDelegate(MenuItemDelegate())
 
         # add actions
-        menu.addAction(Action(FluentIcon.COPY, 'Copy'))
-        menu.addAction(Action(FluentIcon.CUT, 'Cut'))
+        menu.addAction(Action(FluentIcon.COPY, 'Copy', self))
+        menu.addAction(Action(FluentIcon.CUT, 'Cut', self))
         menu.actions()[0].setCheckable(True)
         menu.actions()[0].setChecked(True)
 
         # add sub menu
-        submenu = RoundMenu("Add to", self)
+        submenu = ReusableRoundMenu("Add to", menu)
         submenu.setIcon(FluentIcon.ADD)
         submenu.addActions([
-            Action(FluentIcon.VIDEO, 'Video'),
-            Action(FluentIcon.MUSIC, 'Music'),
+            Action(FluentIcon.VIDEO, 'Video', self),
+            Action(FluentIcon.MUSIC, 'Music', self),
         ])
         menu.addMenu(submenu)
 
         # add actions
         menu.addActions([
-            Action(FluentIcon.PASTE, 'Paste'),
-            Action(FluentIcon.CANCEL, 'Undo')
+            Action(FluentIcon.PASTE, 'Paste', self),
+            Action(FluentIcon.CANCEL, 'Undo', self)
         ])
 
         menu.addSeparator() # 添加分隔符
 
-        menu.addAction(Action(f'Select all', shortcut='Ctrl+A'))
+        menu.addAction(Action(f'Select all', self, shortcut='Ctrl+A'))
 
-        
-        helpShortcut = QShortcut(QKeySequence("Ctrl+H"), self)
-        helpAction = Action(FluentIcon.HELP, "帮助", self, shortcut="Ctrl+H")
-        helpAction.triggered.connect(lambda: showHelpMessageBox(self))
-        helpShortcut.activated.connect(lambda: showHelpMessageBox(self))
+        # 帮助快捷键在注册表中只创建一次
+        registry.shortcut("Ctrl+H", lambda: showHelpMessageBox(self))
+        helpAction = registry.action("help", self._createHelpAction)
 
         # 插入操作
         menu.insertAction(
-            menu.actions()[-1], Action(FluentIcon.SETTING, 'Settings', shortcut='Ctrl+S'))
+            menu.actions()[-1], Action(FluentIcon.SETTING, 'Settings', self, shortcut='Ctrl+S'))
         menu.insertActions(
             menu.actions()[-1],
             [helpAction,
-             Action(FluentIcon.FEEDBACK, 'Feedback', shortcut='Ctrl+F')]
+             Action(FluentIcon.FEEDBACK, 'Feedback', self, shortcut='Ctrl+F')]
         )
         menu.actions()[-2].setCheckable(True)
         menu.actions()[-2].setChecked(True)
 
-        # 显示菜单
-        menu.exec(e.globalPos(), aniType=MenuAnimationType.DROP_DOWN)
+    def _initCommandPalette(self):
+        """初始化命令面板，Ctrl+K 打开/关闭"""
+        self.commandPalette = CommandPalette(self)
+        ActionRegistry.of(self).shortcut("Ctrl+K", self.commandPalette.toggle)
+
+    def _initSystemTray(self):
+        """初始化系统托盘"""
+        self.isQuitting = False  # 是否真正退出（而不是最小化到托盘）
+        self.isBackground = False  # 窗口是否不可见
+
+        self.trayIcon = QSystemTrayIcon(QIcon(icon_path), self)
+        self.trayIcon.setToolTip("Penguin Stride")
+
+        self.trayMenu = SystemTrayMenu(parent=self)
+        self.showAction = showAction = Action(FluentIcon.HOME, self.tr("Show main window"), self)
+        showAction.triggered.connect(self.showFromTray)
+        self.quitAction = quitAction = Action(FluentIcon.CLOSE, self.tr("Quit"), self)
+        quitAction.triggered.connect(self.quitApp)
+        self.trayMenu.addActions([showAction, quitAction])
+        self.trayIcon.setContextMenu(self.trayMenu)
+
+        self.trayIcon.activated.connect(self._onTrayActivated)
+        self.focusInterface.sessionStateChanged.connect(self._updateTrayToolTip)
+        reminderScheduler.reminderDue.connect(self._showReminderInTray)
+
+        self.setMinimizeToTray(cfg.get(cfg.minimizeToTray))
+
+    def _showReminderInTray(self, reminder, occurrence, missed):
+        """窗口隐藏时通过托盘气泡显示任务提醒"""
+        if self.isBackground and self.trayIcon.isVisible():
+            title = self.tr("Missed reminder") if missed else self.tr("Task reminder")
+            self.trayIcon.showMessage(title, reminder.payload.name, QSystemTrayIcon.MessageIcon.Information)
+
+    def _initMemoryTrimmer(self):
+        """初始化内存回收：后台时释放图片、任务卡片和不可见的重页面"""
+        self.memoryTrimmer = MemoryTrimmer(self)
+        self.memoryTrimmer.addTarget(
+            self.focusInterface.releaseResources, self.focusInterface.restoreResources)
+        self.memoryTrimmer.addTarget(self.stopWatchInterface.releaseResources)
+        self.memoryTrimmer.addTarget(self._releaseHiddenPages)
+        self.memoryTrimmer.trimmed.connect(self._logMemoryTrim)
+
+    def _logMemoryTrim(self, before, after):
+        """记录回收前后的常驻内存"""
+        logger.info("memory trimmed: rss %.1f MiB -> %.1f MiB (freed %.1f MiB)",
+                    before / 1048576, after / 1048576, (before - after) / 1048576)
+
+    def _releaseHiddenPages(self):
+        """销毁当前不在显示的延迟页面，下次切换过去时再创建"""
+        if self.stackedWidget.currentWidget() is not self.settingInterface:
+            self.settingInterface.release()
+
+    def setMinimizeToTray(self, enabled):
+        """开启/关闭最小化到托盘"""
+        enabled = enabled and QSystemTrayIcon.isSystemTrayAvailable()
+        self.trayIcon.setVisible(enabled)
+
+        # 托盘模式下隐藏窗口不应退出应用
+        QApplication.instance().setQuitOnLastWindowClosed(not enabled)
+
+    def _updateTrayToolTip(self):
+        """更新托盘提示，显示当前阶段的结束时刻
+
+        只在状态切换时更新，后台不为刷新提示而唤醒，因此显示绝对时刻而非剩余时间，
+        悬停时看到的文字不会过时。
+        """
+        focus = self.focusInterface
+        remaining = focus.remainingSeconds()
+        if not focus.isFocusing:
+            text = "Penguin Stride"
+        elif remaining is None:
+            text = "Penguin Stride - " + self.tr("Focusing")
+        else:
+            state = self.tr("On break") if focus.isBreaking else self.tr("Focusing")
+            endTime = QTime.currentTime().addSecs(round(remaining)).toString("HH:mm")
+            text = "Penguin Stride - " + self.tr("{0} until {1}").format(state, endTime)
+
+        self.trayIcon.setToolTip(text)
+
+    def _onTrayActivated(self, reason):
+        """托盘图标被点击"""
+        if reason == QSystemTrayIcon.ActivationReason.Trigger:
+            if self.isHidden() or self.isMinimized():
+                self.showFromTray()
+            else:
+                self.hide()
+        else:
+            self._updateTrayToolTip()
+
+    def showFromTray(self):
+        """从托盘恢复窗口"""
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def quitApp(self):
+        """退出应用"""
+        self.isQuitting = True
+        self.trayIcon.hide()
+        self.close()
+        QApplication.quit()
+
+    def _updateBackgroundMode(self):
+        """窗口可见性改变时切换后台模式"""
+        background = self.isHidden() or self.isMinimized()
+        if background != self.isBackground:
+            self.isBackground = background
+            signalBus.backgroundModeChanged.emit(background)
+
+    def _createHelpAction(self):
+        """创建帮助动作"""
+        helpAction = Action(FluentIcon.HELP, shortcutLabel(self.tr("Help"), "Ctrl+H"), self)
+        helpAction.triggered.connect(lambda: showHelpMessageBox(self))
+        return helpAction
+
+    def contextMenuEvent(self, e):
+        """右键菜单"""
+        self.contextMenu.exec(e.globalPos(), aniType=MenuAnimationType.DROP_DOWN)
 
     def resizeEvent(self, e):
         """窗口大小改变事件"""
         super().resizeEvent(e)
         if hasattr(self, 'splashScreen'):
             self.splashScreen.resize(self.size())
+        if hasattr(self, 'commandPalette') and self.commandPalette.isVisible():
+            self.commandPalette.reposition()
+
+    def showEvent(self, e):
+        """显示窗口事件"""
+        super().showEvent(e)
+        if hasattr(self, 'trayIcon'):
+            self._updateBackgroundMode()
+
+    def hideEvent(self, e):
+        """隐藏窗口事件"""
+        super().hideEvent(e)
+        if hasattr(self, 'trayIcon'):
+            self._updateBackgroundMode()
+
+    def changeEvent(self, e):
+        """窗口状态改变事件（最小化/还原、切换语言）"""
+        super().changeEvent(e)
+        if e.type() == QEvent.Type.WindowStateChange and hasattr(self, 'trayIcon'):
+            self._updateBackgroundMode()
+        elif e.type() == QEvent.Type.LanguageChange and hasattr(self, 'trayIcon'):
+            self.retranslateUi()
+
+    def retranslateUi(self):
+        """切换语言时重设导航栏、托盘和帮助动作的文本，子页面各自处理 LanguageChange"""
+        texts = {
+            self.focusInterface: self.tr('Focus Time'),
+            self.stopWatchInterface: self.tr('Stop Watch'),
+            self.settingInterface: self.tr('Settings'),
+        }
+        for interface, text in texts.items():
+            self.navigationInterface.widget(interface.objectName()).setText(text)
+        self.navigationInterface.widget('HelpInterface').setText(self.tr('Help'))
+
+        self.showAction.setText(self.tr("Show main window"))
+        self.quitAction.setText(self.tr("Quit"))
+        ActionRegistry.of(self).action("help", self._createHelpAction).setText(
+            shortcutLabel(self.tr("Help"), "Ctrl+H"))
+        self._updateTrayToolTip()
 
     def closeEvent(self, e):
         """关闭窗口"""
+        # 最小化到托盘
+        if not self.isQuitting and self.trayIcon.isVisible():
+            e.ignore()
+            self.hide()
+            return
+
         super().closeEvent(e)
 
     def _onThemeChangedFinished(self):
@@ -187,10 +369,8 @@ if __name__ == '__main__':
     app.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
 
     # 语言设置
-    locale = cfg.get(cfg.language).value
-    translator = FluentTranslator(locale)
-
-    app.installTranslator(translator)
+    languageManager.setLanguage(cfg.get(cfg.language))
+    cfg.language.valueChanged.connect(languageManager.setLanguage)
 
     # 创建窗口
     w = MainWindow()
@@ -0,0 +1,86 @@
+from PyQt6.QtCore import QObject, Qt
+from PyQt6.QtGui import QKeySequence, QShortcut
+
+from qfluentwidgets import RoundMenu, MenuAnimationType
+from qfluentwidgets.components.widgets.menu import MenuAnimationManager
+
+
+def shortcutLabel(text, key):
+    """ 在动作文本后附上快捷键，只用于显示
+
+    快捷键统一由注册表中的 QShortcut 响应，动作本身不再绑定同一按键，
+    否则菜单中的动作和窗口的快捷键会产生歧义，两边都不触发。
+    """
+    return f"{text} ({QKeySequence(key).toString(QKeySequence.SequenceFormat.NativeText)})"
+
+
+class ActionRegistry(QObject):
+    """ 快捷键/动作注册表
+
+    每个窗口持有一个注册表，同一个快捷键、同一个动作只会创建一次，
+    之后的右键菜单只复用已有对象，避免 QObject 数量随点击次数增长。
+    """
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.setObjectName("actionRegistry")
+        self._window = window
+        self._shortcuts = {}  # 按键序列 -> QShortcut
+        self._actions = {}    # 名称 -> QAction
+
+    @classmethod
+    def of(cls, widget):
+        """ 获取部件所在窗口的注册表，不存在时创建 """
+        window = widget.window()
+        registry = window.findChild(
+            cls, "actionRegistry", Qt.FindChildOption.FindDirectChildrenOnly)
+        if registry is None:
+            registry = cls(window)
+        return registry
+
+    def shortcut(self, key, slot):
+        """ 注册快捷键，同一按键只创建一次并只连接第一次传入的槽 """
+        shortcut = self._shortcuts.get(key)
+        if shortcut is None:
+            shortcut = QShortcut(QKeySequence(key), self._window)
+            shortcut.activated.connect(slot)
+            self._shortcuts[key] = shortcut
+        return shortcut
+
+    def action(self, name, factory):
+        """ 获取已缓存的动作，不存在时通过 factory 创建 """
+        action = self._actions.get(name)
+        if action is None:
+            action = factory()
+            self._actions[name] = action
+        return action
+
+    def shortcuts(self):
+        """ 已注册的快捷键 """
+        return dict(self._shortcuts)
+
+
+class ReusableRoundMenu(RoundMenu):
+    """ 可复用的圆角菜单
+
+    RoundMenu.exec 每次都会新建一个以菜单为父对象的动画管理器，
+    菜单反复弹出时子对象会越积越多，这里按动画类型缓存管理器。
+    """
+
+    def __init__(self, title="", parent=None):
+        super().__init__(title, parent)
+        self._aniManagers = {}  # 动画类型 -> 动画管理器
+
+    def exec(self, pos, ani=True, aniType=MenuAnimationType.DROP_DOWN):
+        """ 显示菜单 """
+        manager = self._aniManagers.get(aniType)
+        if manager is None:
+            manager = MenuAnimationManager.make(self, aniType)
+            self._aniManagers[aniType] = manager
+
+        self.aniManager = manager
+        manager.exec(pos)
+        self.show()
+
+        if self.isSubMenu:
+            self.menuItem.setSelected(True)
@@ -0,0 +1,438 @@
+""" 本地自动化接口
+
+在后台线程的 asyncio 事件循环中提供一个只监听 127.0.0.1 的 HTTP 服务：
+    GET  /state    当前状态（专注/休息、剩余时间、每日进度、任务）
+    GET  /tasks    任务列表
+    GET  /events   focusStarted / focusEnded 事件流（server-sent events）
+    POST /rpc      JSON-RPC 2.0，例如 {"jsonrpc": "2.0", "id": 1, "method": "focus.start", "params": [25]}
+
+读取接口只读取界面线程发布的不可变快照，不会进入界面线程；
+命令通过排队信号交给界面线程上的 CommandDispatcher 执行。
+
+只接受本机程序的请求：带 Origin 头或 Host 不是回环地址的请求（网页发起的请求、DNS 重绑定）一律拒绝。
+/rpc 还要求 Content-Type: application/json，以及 Authorization: Bearer <令牌>，
+令牌每次启动服务时随机生成，写入数据目录下的 automation.token，只有本机用户可以读取。
+"""
+# 标准库导入
+import asyncio
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import Future
+from typing import NamedTuple, Optional
+
+# 第三方库导入
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# 本地模块导入
+from commands import CommandError
+from config import cfg
+from notification import notificationService
+from paths import data_path
+
+MAX_BODY = 1024 * 1024     # 请求体上限（字节）
+KEEPALIVE_INTERVAL = 15    # 事件流心跳间隔（秒）
+SUBSCRIBER_QUEUE = 64      # 每个订阅者缓存的事件上限，超出视为慢连接并断开
+COMMAND_TIMEOUT = 10       # 等待界面线程执行命令的超时（秒）
+
+READ_METHODS = ("state", "status", "tasks", "tasks.list")
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "[::1]")
+TOKEN_PATH = os.path.join(data_path, "automation.token")
+
+
+class StateSnapshot(NamedTuple):
+    """ 状态快照
+
+    由界面线程创建后整体替换，创建后不再修改，因此后台线程可以不加锁读取。
+    剩余时间以截止时间戳保存，读取时再计算，快照不需要每秒刷新。
+    """
+    version: int = 0
+    focusing: bool = False
+    breaking: bool = False
+    focusStartedAt: Optional[float] = None   # 专注开始时间戳
+    deadline: Optional[float] = None         # 当前专注段或休息的结束时间戳
+    dailyCompleted: int = 0
+    dailyTarget: int = 0
+    tasks: tuple = ()                        # ((名称, 是否完成), ...)
+
+    def toDict(self, now=None):
+        now = time.time() if now is None else now
+        remaining = None if self.deadline is None else max(self.deadline - now, 0)
+        return {
+            "version": self.version,
+            "session": "break" if self.breaking else "focus" if self.focusing else "idle",
+            "focusing": self.focusing,
+            "breaking": self.breaking,
+            "focusStartedAt": self.focusStartedAt,
+            "elapsedSeconds": None if self.focusStartedAt is None else now - self.focusStartedAt,
+            "remainingSeconds": remaining,
+            "dailyCompleted": self.dailyCompleted,
+            "dailyTarget": self.dailyTarget,
+            "tasks": self.tasksToList(),
+        }
+
+    def tasksToList(self):
+        return [{"name": name, "completed": completed} for name, completed in self.tasks]
+
+
+class AutomationBridge(QObject):
+    """ 界面线程一侧的桥接对象
+
+    监听 FocusInterface 的信号发布状态快照和事件，并在界面线程中执行后台线程提交的命令。
+    """
+    commandRequested = pyqtSignal(object, object)  # (参数列表, concurrent.futures.Future)
+
+    def __init__(self, dispatcher, focusInterface, parent=None):
+        super().__init__(parent)
+        self.dispatcher = dispatcher
+        self.focusInterface = focusInterface
+        self.server = None
+        self.snapshot = StateSnapshot()
+
+        # 后台线程发射，自动排队到界面线程执行
+        self.commandRequested.connect(self._executeCommand)
+
+        focusInterface.sessionStateChanged.connect(self.publishSnapshot)
+        focusInterface.tasksChanged.connect(self.publishSnapshot)
+        focusInterface.progressChanged.connect(self.publishSnapshot)
+        focusInterface.focusStarted.connect(
+            lambda seconds: self.publishEvent("focusStarted", {"durationSeconds": seconds}))
+        focusInterface.focusEnded.connect(
+            lambda seconds: self.publishEvent("focusEnded", {"elapsedSeconds": seconds}))
+        self.publishSnapshot()
+
+    def publishSnapshot(self):
+        """ 在界面线程中生成新快照，整体替换引用 """
+        f = self.focusInterface
+        now = time.time()
+        remaining = f.remainingSeconds()
+        self.snapshot = StateSnapshot(
+            version=self.snapshot.version + 1,
+            focusing=f.isFocusing,
+            breaking=f.isBreaking,
+            focusStartedAt=f.focusStartTime.timestamp() if f.isFocusing else None,
+            deadline=None if remaining is None else now + remaining,
+            dailyCompleted=f.dailyCompleted,
+            dailyTarget=f.dailyTarget,
+            tasks=tuple((task.name, task.is_completed) for task in f.tasks),
+        )
+
+    def publishEvent(self, name, data):
+        """ 向事件流订阅者广播事件 """
+        self.publishSnapshot()
+        if self.server:
+            self.server.broadcast(name, dict(data, state=self.snapshot.toDict()))
+
+    def submit(self, argv):
+        """ 后台线程调用：提交命令，返回 Future """
+        future = Future()
+        self.commandRequested.emit(list(argv), future)
+        return future
+
+    def _executeCommand(self, argv, future):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(self.dispatcher.execute(argv))
+        except Exception as e:
+            future.set_exception(e)
+
+
+class AutomationServer:
+    """ 后台线程中的 asyncio HTTP 服务 """
+
+    def __init__(self, bridge, host="127.0.0.1", port=8765):
+        self.bridge = bridge
+        self.host = host
+        self.port = port
+        self.loop = None
+        self.thread = None
+        self._server = None
+        self._subscribers = set()   # asyncio.Queue 集合，只在事件循环线程中访问
+        self._ready = threading.Event()
+        self.error = None
+        self.token = None
+
+    # ================ 生命周期 ================
+    def start(self):
+        """ 启动后台线程，等待端口监听完成，失败时返回 False """
+        if self.thread:
+            return True
+
+        try:
+            self._writeToken()
+        except OSError as e:
+            self.error = e
+            return False
+
+        self.bridge.server = self
+        self._ready.clear()
+        self.thread = threading.Thread(target=self._run, name="AutomationServer", daemon=True)
+        self.thread.start()
+        self._ready.wait(5)
+        if self.error:
+            self.thread = None
+            self.bridge.server = None
+            self._removeToken()
+            return False
+        return True
+
+    def stop(self):
+        """ 停止服务并等待线程退出 """
+        if not self.thread:
+            return
+
+        self.bridge.server = None
+        if self.loop and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._shutdown)
+        self.thread.join(5)
+        self.thread = None
+        self._removeToken()
+
+    def _writeToken(self):
+        """ 生成本次会话的令牌，写入只有当前用户可读的文件 """
+        self.token = secrets.token_urlsafe(32)
+        os.makedirs(data_path, exist_ok=True)
+        tmpPath = TOKEN_PATH + ".tmp"
+        fd = os.open(tmpPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding='utf-8') as f:
+            f.write(self.token)
+        os.replace(tmpPath, TOKEN_PATH)
+
+    def _removeToken(self):
+        self.token = None
+        try:
+            os.remove(TOKEN_PATH)
+        except OSError:
+            pass
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self._server = self.loop.run_until_complete(
+                asyncio.start_server(self._handleClient, self.host, self.port))
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as e:
+            self.error = e
+            self._ready.set()
+            self.loop.close()
+            return
+
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    def _shutdown(self):
+        self._server.close()
+        for queue in list(self._subscribers):
+            queue.put_nowait(None)
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        self.loop.call_soon(self.loop.stop)
+
+    # ================ 事件流 ================
+    def broadcast(self, name, data):
+        """ 界面线程调用：把事件交给事件循环广播 """
+        if self.loop and self.loop.is_running():
+            payload = f"event: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8')
+            self.loop.call_soon_threadsafe(self._broadcast, payload)
+
+    def _broadcast(self, payload):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # 慢连接直接断开，避免事件无限堆积
+                self._subscribers.discard(queue)
+                queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def _streamEvents(self, writer):
+        writer.write(b"HTTP/1.1 200 OK\r\n"
+                     b"Content-Type: text/event-stream; charset=utf-8\r\n"
+                     b"Cache-Control: no-cache\r\n"
+                     b"Connection: keep-alive\r\n\r\n"
+                     b": connected\n\n")
+        await writer.drain()
+
+        queue = asyncio.Queue(SUBSCRIBER_QUEUE)
+        self._subscribers.add(queue)
+        try:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    payload = b": keepalive\n\n"
+                if payload is None:
+                    break
+                writer.write(payload)
+                await writer.drain()
+        finally:
+            self._subscribers.discard(queue)
+
+    def subscriberCount(self):
+        return len(self._subscribers)
+
+    # ================ HTTP ================
+    async def _handleClient(self, reader, writer):
+        try:
+            method, path, headers, body = await self._readRequest(reader)
+            denied = self._checkRequest(method, path, headers)
+            if denied:
+                self._writeJson(writer, *denied)
+                await writer.drain()
+                return
+
+            if method == "GET" and path == "/events":
+                await self._streamEvents(writer)
+                return
+
+            status, result = await self._route(method, path, body)
+            self._writeJson(writer, status, result)
+            await writer.drain()
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            self._writeJson(writer, 400, {"error": str(e) or "bad request"})
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _readRequest(self, reader):
+        requestLine = (await reader.readline()).decode('latin-1').split()
+        if len(requestLine) != 3:
+            raise ValueError("bad request line")
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0))
+        if length > MAX_BODY:
+            raise ValueError("request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return requestLine[0].upper(), requestLine[1].split("?")[0], headers, body
+
+    def _checkRequest(self, method, path, headers):
+        """ 检查请求是否来自本机程序，拒绝时返回 (状态码, 错误信息) """
+        # 浏览器发起的跨域请求总会带 Origin；Host 不是回环地址说明经过了 DNS 重绑定
+        if "origin" in headers:
+            return 403, {"error": "cross-origin requests are not allowed"}
+        host = headers.get("host", "")
+        if host.rfind(":") > host.rfind("]"):
+            host = host.rsplit(":", 1)[0]   # 去掉端口，IPv6 地址在方括号内
+        if host.lower() not in LOOPBACK_HOSTS:
+            return 403, {"error": "host must be a loopback address"}
+
+        if method == "POST" and path == "/rpc":
+            contentType = headers.get("content-type", "").split(";")[0].strip().lower()
+            if contentType != "application/json":
+                return 415, {"error": "Content-Type must be application/json"}
+            scheme, _, token = headers.get("authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not hmac.compare_digest(
+                    token.strip().encode('latin-1'), (self.token or "").encode('latin-1')):
+                return 401, {"error": f"missing or invalid token, see {TOKEN_PATH}"}
+        return None
+
+    async def _route(self, method, path, body):
+        snapshot = self.bridge.snapshot
+        if method == "GET" and path == "/state":
+            return 200, snapshot.toDict()
+        if method == "GET" and path == "/tasks":
+            return 200, snapshot.tasksToList()
+        if method == "POST" and path == "/rpc":
+            try:
+                request = json.loads(body.decode('utf-8'))
+            except ValueError:
+                return 200, self._rpcError(None, -32700, "Parse error")
+            if isinstance(request, list):
+                if not request:
+                    return 200, self._rpcError(None, -32600, "Invalid Request")
+                return 200, [await self._handleRpc(item) for item in request]
+            return 200, await self._handleRpc(request)
+        return 404, {"error": "not found"}
+
+    @staticmethod
+    def _writeJson(writer, status, result):
+        body = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        reason = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden",
+                  404: "Not Found", 415: "Unsupported Media Type"}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\n"
+                     f"Content-Type: application/json; charset=utf-8\r\n"
+                     f"Content-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode('latin-1') + body)
+
+    # ================ JSON-RPC ================
+    @staticmethod
+    def _rpcError(requestId, code, message):
+        return {"jsonrpc": "2.0", "id": requestId, "error": {"code": code, "message": message}}
+
+    async def _handleRpc(self, request):
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self._rpcError(None, -32600, "Invalid Request")
+
+        requestId = request.get("id")
+        method = request["method"]
+        params = request.get("params", [])
+        if isinstance(params, dict):
+            params = list(params.values())
+        if not isinstance(params, list):
+            return self._rpcError(requestId, -32602, "Invalid params")
+
+        # 读取直接使用快照，不进入界面线程
+        snapshot = self.bridge.snapshot
+        if method in READ_METHODS:
+            result = snapshot.tasksToList() if method.startswith("tasks") else snapshot.toDict()
+            return {"jsonrpc": "2.0", "id": requestId, "result": result}
+
+        argv = method.split(".") + [str(p) for p in params]
+        if not self.bridge.dispatcher.hasCommand(argv):
+            return self._rpcError(requestId, -32601, f"Method not found: {method}")
+
+        try:
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(self.bridge.submit(argv)), COMMAND_TIMEOUT)
+        except CommandError as e:
+            return self._rpcError(requestId, -32000, str(e))
+        except asyncio.TimeoutError:
+            return self._rpcError(requestId, -32001, "界面线程没有及时响应")
+        except Exception as e:
+            return self._rpcError(requestId, -32603, f"Internal error: {e}")
+        return {"jsonrpc": "2.0", "id": requestId, "result": result}
+
+
+class AutomationService(QObject):
+    """ 自动化接口开关，按配置启动或停止后台服务 """
+
+    def __init__(self, dispatcher, focusInterface, port=8765, parent=None):
+        super().__init__(parent)
+        self.bridge = AutomationBridge(dispatcher, focusInterface, self)
+        self.server = None
+        self.port = port
+
+    def setEnabled(self, enabled):
+        if enabled and not self.server:
+            self.server = AutomationServer(self.bridge, port=self.port)
+            if not self.server.start():
+                # 在主窗口上提示，并关闭开关，避免设置页显示一个并未运行的服务
+                notificationService.error(
+                    "自动化接口启动失败", str(self.server.error),
+                    self.bridge.focusInterface.window(), duration=5000)
+                self.server = None
+                cfg.set(cfg.automationEnabled, False)
+        elif not enabled and self.server:
+            self.server.stop()
+            self.server = None
+
+    def isEnabled(self):
+        return self.server is not None
@@ -0,0 +1,24 @@
+""" 命令行控制正在运行的 PenguinStride
+
+用法:
+    python app/cli.py focus start 25
+    python app/cli.py focus stop
+    python app/cli.py stopwatch lap
+    python app/cli.py tasks add "写周报"
+"""
+import sys
+
+from single_instance import sendCommand, printReply
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    reply = sendCommand(argv or ["help"])
+    if reply is None:
+        print("PenguinStride 未运行，请先执行 python app/main.py")
+        return 2
+    return printReply(reply)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import time
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+
+
+class ClockSubscription:
+    """ 时钟订阅，调用 cancel() 取消 """
+
+    def __init__(self, service, callback, interval):
+        self.service = service
+        self.callback = callback
+        self.interval = interval    # 触发间隔（毫秒），0 表示跟随屏幕刷新
+        self.due = 0.0              # 下一次触发的时间（毫秒，与 time.time() 同一时间轴）
+        self.active = True
+
+    def cancel(self):
+        self.service.unsubscribe(self)
+
+
+class ClockService(QObject):
+    """ 全局时钟服务
+
+    整个应用只持有一个单次定时器。各订阅者按需要的频率订阅，
+    所有触发点都落在同一时间网格上（1 Hz 对齐到显示秒的边界，10 Hz 对齐到 100 毫秒边界），
+    同一时刻到期的订阅者在一次唤醒中依次回调。没有订阅者时定时器完全停止。
+
+    网格基于墙上时钟，墙上时钟向后调整时各订阅的下一次触发点会重新对齐，不会停摆。
+    """
+    wokeUp = pyqtSignal()  # 每次唤醒、回调订阅者之前发出，供计时基准顺便检查时钟
+    HZ_1 = 1000     # 每秒一次，对齐秒边界
+    HZ_10 = 100     # 每秒十次
+    VSYNC = 0       # 跟随主屏幕刷新率
+
+    SLACK = 1.0     # 提前唤醒的容差（毫秒），避免定时器误差导致错过同一网格点
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscriptions = []
+        self._timer = None
+        self.wakeups = 0   # 唤醒次数，便于观察合并效果
+
+    def subscribe(self, callback, interval=HZ_1):
+        """ 订阅时钟，返回 ClockSubscription """
+        subscription = ClockSubscription(self, callback, interval)
+        subscription.due = self._nextDue(interval, self._now())
+        self._subscriptions.append(subscription)
+        self._schedule()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """ 取消订阅，最后一个订阅者取消后定时器停止 """
+        if subscription is None or not subscription.active:
+            return
+        subscription.active = False
+        self._subscriptions.remove(subscription)
+        self._schedule()
+
+    def isSleeping(self):
+        """ 定时器是否已停止 """
+        return self._timer is None or not self._timer.isActive()
+
+    def subscriberCount(self):
+        return len(self._subscriptions)
+
+    # ================ 调度 ================
+    @staticmethod
+    def _now():
+        return time.time() * 1000
+
+    def _frameInterval(self):
+        """ 主屏幕一帧的时长（毫秒） """
+        screen = QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 0
+        return 1000 / rate if rate > 0 else 1000 / 60
+
+    def _nextDue(self, interval, now):
+        """ now 之后的下一个网格点 """
+        interval = interval or self._frameInterval()
+        return (now // interval + 1) * interval
+
+    def _schedule(self):
+        """ 按最早到期的订阅重新设置定时器 """
+        if not self._subscriptions:
+            if self._timer:
+                self._timer.stop()
+            return
+
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._timer.timeout.connect(self._onTimeout)
+
+        now = self._now()
+        for subscription in self._subscriptions:
+            # 墙上时钟被向后调整后，原来的触发点会远在未来
+            if subscription.due - now > (subscription.interval or self._frameInterval()) + self.SLACK:
+                subscription.due = self._nextDue(subscription.interval, now)
+
+        due = min(s.due for s in self._subscriptions)
+        self._timer.start(max(int(due - now + 0.999), 0))
+
+    def _onTimeout(self):
+        self.wakeups += 1
+        self.wokeUp.emit()
+        now = self._now()
+
+        # 先确定本次到期的订阅者，回调中新增或取消的订阅不影响本轮
+        due = [s for s in self._subscriptions if s.due <= now + self.SLACK]
+        for subscription in due:
+            subscription.due = self._nextDue(subscription.interval, max(now, subscription.due))
+        for subscription in due:
+            if subscription.active:
+                subscription.callback()
+
+        self._schedule()
+
+
+clockService = ClockService()
@@ -0,0 +1,216 @@
+""" 命令面板
+
+Ctrl+K 在主窗口顶部打开，输入关键字即可在页面、操作、主题、语言和任务名称中模糊查找，
+上下键选择，回车执行，Esc 关闭。每个候选项除了显示文本，还带有中英文别名，
+用哪种语言输入都能找到。
+
+候选项交给 FuzzyMatcher 缓存，任务列表或界面语言变化时只把对应的来源标记为待更新，
+面板打开时才重新生成；没有变化的候选项不会重新处理。
+"""
+from functools import partial
+
+from PyQt6.QtCore import Qt, QEvent, QTimer
+from PyQt6.QtWidgets import QApplication, QVBoxLayout, QListWidgetItem
+from qfluentwidgets import SimpleCardWidget, SearchLineEdit, ListWidget, FluentIcon, Theme
+
+from config import cfg, Language
+from fuzzy_matcher import FuzzyMatcher
+from i18n import languageManager
+from utils import showHelpMessageBox
+
+MAX_RESULTS = 50
+PALETTE_WIDTH = 560
+PALETTE_TOP = 48
+
+
+class CommandPalette(SimpleCardWidget):
+    """ 主窗口的命令面板 """
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.mainWindow = window
+        self.matcher = FuzzyMatcher()
+        self._commands = {}                 # 来源 -> {键: (图标, 显示文本, 槽)}
+        self._dirty = {"static", "tasks"}   # 需要重新生成的候选项
+
+        self.searchLineEdit = SearchLineEdit(self)
+        self.searchLineEdit.setPlaceholderText(self.tr("Search pages, actions and tasks"))
+        self.listWidget = ListWidget(self)
+        self.listWidget.setUniformItemSizes(True)
+        self.listWidget.setFixedHeight(360)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.addWidget(self.searchLineEdit)
+        layout.addWidget(self.listWidget)
+
+        self.searchLineEdit.textChanged.connect(self._updateResults)
+        self.searchLineEdit.installEventFilter(self)
+        self.listWidget.itemClicked.connect(self._runItem)
+
+        focus = window.focusInterface
+        focus.tasksChanged.connect(lambda: self._markDirty("tasks"))
+        focus.sessionStateChanged.connect(lambda: self._markDirty("static"))
+        languageManager.languageChanged.connect(lambda: self._markDirty("static"))
+
+        self.hide()
+
+    # ================ 候选项 ================
+    def _markDirty(self, group):
+        self._dirty.add(group)
+        if self.isVisible():
+            self._refresh()
+            self._updateResults(self.searchLineEdit.text())
+
+    def _refresh(self):
+        """ 重新生成标记为待更新的候选项 """
+        if "static" in self._dirty:
+            for source, commands in self._staticCommands().items():
+                self._setCommands(source, commands)
+        if "tasks" in self._dirty:
+            self._setCommands("tasks", self._taskCommands())
+        self._dirty.clear()
+
+    def _setCommands(self, source, commands):
+        """ commands: [(键, 图标, 显示文本, 别名, 槽)] """
+        self._commands[source] = {key: (icon, text, slot) for key, icon, text, aliases, slot in commands}
+        self.matcher.setCandidates(source, [(key, f"{text} {aliases}") for key, _, text, aliases, _ in commands])
+
+    def _staticCommands(self):
+        window = self.mainWindow
+        focus, stopWatch = window.focusInterface, window.stopWatchInterface
+
+        def on(interface, slot):
+            """ 先切换到所在页面再执行 """
+            def run():
+                window.switchTo(interface)
+                slot()
+            return run
+
+        pages = [
+            ("focus", FluentIcon.RINGER, self.tr("Focus Time"), "focus pomodoro 专注 番茄",
+             partial(window.switchTo, focus)),
+            ("stopwatch", FluentIcon.STOP_WATCH, self.tr("Stop Watch"), "stopwatch timer 秒表 计时",
+             partial(window.switchTo, stopWatch)),
+            ("settings", FluentIcon.SETTING, self.tr("Settings"), "settings preferences options 设置 选项",
+             partial(window.switchTo, window.settingInterface)),
+        ]
+        actions = [
+            ("focus", FluentIcon.PAUSE if focus.isFocusing else FluentIcon.PLAY,
+             self.tr("End focus") if focus.isFocusing else self.tr("Start focus"),
+             "focus start stop end 开始 结束 专注", on(focus, focus.toggleFocus)),
+            ("addTask", FluentIcon.ADD, self.tr("Add task"), "add new task todo 添加 新建 任务",
+             on(focus, focus.showAddTaskDialog)),
+            ("clearCompleted", FluentIcon.BROOM, self.tr("Clear completed tasks"), "clear completed tasks 清除 已完成 任务",
+             on(focus, focus.clearCompletedTasks)),
+            ("archive", FluentIcon.HISTORY, self.tr("View archived tasks"), "archive history tasks 归档 历史 任务",
+             focus.showArchiveDialog),
+            ("stopwatchToggle", FluentIcon.STOP_WATCH, self.tr("Start or pause stopwatch"),
+             "stopwatch start pause 秒表 开始 暂停", on(stopWatch, stopWatch.toggleTimer)),
+            ("stopwatchLap", FluentIcon.FLAG, self.tr("Record lap"), "stopwatch lap flag 秒表 标记 计次",
+             on(stopWatch, stopWatch.recordFlag)),
+            ("stopwatchReset", FluentIcon.CANCEL, self.tr("Reset stopwatch"), "stopwatch reset 秒表 重置",
+             on(stopWatch, stopWatch.resetTimer)),
+            ("help", FluentIcon.HELP, self.tr("Help"), "help about 帮助", partial(showHelpMessageBox, window)),
+        ]
+        themes = [
+            (theme.value, FluentIcon.CONSTRACT, text, "theme mode 主题 " + aliases,
+             partial(cfg.set, cfg.themeMode, theme))
+            for theme, text, aliases in [
+                (Theme.LIGHT, self.tr("Light theme"), "light 浅色 亮色"),
+                (Theme.DARK, self.tr("Dark theme"), "dark night 深色 暗色"),
+                (Theme.AUTO, self.tr("Use system theme"), "auto system 跟随系统"),
+            ]
+        ]
+        languages = [
+            (language.name, FluentIcon.LANGUAGE, text, "language 语言 " + aliases,
+             partial(cfg.set, cfg.language, language))
+            for language, text, aliases in [
+                (Language.CHINESE_SIMPLIFIED, "简体中文", "chinese simplified zh"),
+                (Language.CHINESE_TRADITIONAL, "繁體中文", "chinese traditional 繁体 zh"),
+                (Language.ENGLISH, "English", "english 英文 英语 en"),
+                (Language.AUTO, self.tr("Use system language"), "auto system 跟随系统"),
+            ]
+        ]
+        return {"pages": pages, "actions": actions, "themes": themes, "languages": languages}
+
+    def _taskCommands(self):
+        focus = self.mainWindow.focusInterface
+        return [
+            (task.id, FluentIcon.CHECKBOX if task.is_completed else FluentIcon.TAG, task.name,
+             " ".join(f"#{tag}" for tag in task.tags), partial(self._revealTask, task.id))
+            for _, task in focus.orderedTasks()
+        ]
+
+    def _revealTask(self, taskId):
+        focus = self.mainWindow.focusInterface
+        self.mainWindow.switchTo(focus)
+        focus.revealTask(taskId)
+
+    # ================ 显示 ================
+    def toggle(self):
+        if self.isVisible():
+            self.hide()
+        else:
+            self.open()
+
+    def open(self):
+        self._refresh()
+        self.reposition()
+        self.searchLineEdit.clear()
+        self._updateResults("")
+        self.show()
+        self.raise_()
+        self.searchLineEdit.setFocus()
+
+    def reposition(self):
+        """ 水平居中于主窗口标题栏下方 """
+        width = min(PALETTE_WIDTH, self.mainWindow.width() - 40)
+        self.resize(width, self.sizeHint().height())
+        self.move((self.mainWindow.width() - width) // 2, PALETTE_TOP)
+
+    def _updateResults(self, text):
+        self.listWidget.clear()
+        for source, key in self.matcher.match(text, MAX_RESULTS):
+            icon, label, _ = self._commands[source][key]
+            item = QListWidgetItem(icon.icon(), label)
+            item.setData(Qt.ItemDataRole.UserRole, (source, key))
+            self.listWidget.addItem(item)
+        if self.listWidget.count():
+            self.listWidget.setCurrentRow(0)
+
+    def _runItem(self, item):
+        source, key = item.data(Qt.ItemDataRole.UserRole)
+        _, _, slot = self._commands[source][key]
+        self.hide()
+        slot()
+
+    def _moveCurrent(self, step):
+        count = self.listWidget.count()
+        if count:
+            self.listWidget.setCurrentRow((self.listWidget.currentRow() + step) % count)
+
+    def eventFilter(self, obj, e):
+        if obj is getattr(self, 'searchLineEdit', None):
+            if e.type() == QEvent.Type.KeyPress:
+                key = e.key()
+                if key == Qt.Key.Key_Escape:
+                    self.hide()
+                    return True
+                if key in (Qt.Key.Key_Up, Qt.Key.Key_Down):
+                    self._moveCurrent(-1 if key == Qt.Key.Key_Up else 1)
+                    return True
+                if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+                    item = self.listWidget.currentItem()
+                    if item is not None:
+                        self._runItem(item)
+                    return True
+            elif e.type() == QEvent.Type.FocusOut:
+                # 焦点离开面板（点击了窗口其他位置）时关闭
+                QTimer.singleShot(0, self._hideIfInactive)
+        return super().eventFilter(obj, e)
+
+    def _hideIfInactive(self):
+        focused = QApplication.focusWidget()
+        if self.isVisible() and not (focused is not None and self.isAncestorOf(focused)):
+            self.hide()
@@ -0,0 +1,192 @@
+from PyQt6.QtCore import QTime
+
+from stopwatch_group import formatTime
+
+
+class CommandError(Exception):
+    """ 命令执行错误 """
+
+
+class CommandDispatcher:
+    """ 命令分发器
+
+    把 `focus start 25`、`stopwatch lap`、`tasks add "..."` 这样的参数列表
+    分发到主窗口各页面的方法上，供单实例转发、命令行和自动化接口共用。
+    """
+
+    USAGE = (
+        "用法:\n"
+        "  show                    显示窗口\n"
+        "  status                  查看当前状态\n"
+        "  focus start [分钟]      开始专注\n"
+        "  focus stop              结束专注\n"
+        "  stopwatch start|pause|lap|reset [名称]\n"
+        "  stopwatch list          列出秒表\n"
+        "  tasks list              列出任务\n"
+        "  tasks add <名称>        添加任务\n"
+    )
+
+    def __init__(self, controller):
+        self.controller = controller
+        self._commands = {
+            ("show",): self.show,
+            ("status",): self.status,
+            ("help",): self.help,
+            ("focus", "start"): self.focusStart,
+            ("focus", "stop"): self.focusStop,
+            ("stopwatch", "start"): self.stopWatchStart,
+            ("stopwatch", "pause"): self.stopWatchPause,
+            ("stopwatch", "lap"): self.stopWatchLap,
+            ("stopwatch", "reset"): self.stopWatchReset,
+            ("stopwatch", "list"): self.stopWatchList,
+            ("tasks", "list"): self.tasksList,
+            ("tasks", "add"): self.tasksAdd,
+        }
+
+    def hasCommand(self, argv):
+        """ 参数列表是否对应一个已知命令 """
+        return any(tuple(argv[:size]) in self._commands for size in (2, 1))
+
+    def execute(self, argv):
+        """ 执行命令，返回可以序列化为 JSON 的结果 """
+        argv = list(argv) or ["show"]
+        for size in (2, 1):
+            handler = self._commands.get(tuple(argv[:size]))
+            if handler:
+                return handler(*argv[size:])
+
+        raise CommandError(f"未知命令: {' '.join(argv)}\n{self.USAGE}")
+
+    # ================ 窗口 ================
+    def _mainWindow(self):
+        """ 获取主窗口，未登录时报错 """
+        window = self.controller.main_window
+        if window is None:
+            raise CommandError("尚未登录，请先在登录窗口中登录")
+        return window
+
+    def show(self):
+        """ 显示窗口 """
+        window = self.controller.main_window or self.controller.login_window
+        if hasattr(window, 'showFromTray'):
+            window.showFromTray()
+        else:
+            window.showNormal()
+            window.raise_()
+            window.activateWindow()
+        return "ok"
+
+    def help(self):
+        return self.USAGE
+
+    def status(self):
+        """ 当前状态 """
+        window = self._mainWindow()
+        focus = window.focusInterface
+        stopWatch = window.stopWatchInterface
+        return {
+            "focusing": focus.isFocusing,
+            "breaking": focus.isBreaking,
+            "remainingSeconds": focus.remainingSeconds(),
+            "dailyCompleted": focus.dailyCompleted,
+            "dailyTarget": focus.dailyTarget,
+            "stopwatchRunning": stopWatch.isRunning,
+            "stopwatchElapsed": stopWatch.elapsedTime,
+            "laps": len(stopWatch.flagRecords),
+        }
+
+    # ================ 专注 ================
+    def focusStart(self, minutes=None):
+        """ 开始专注，可指定专注分钟数 """
+        focus = self._mainWindow().focusInterface
+        if focus.isFocusing:
+            raise CommandError("专注已在进行中")
+
+        if minutes is not None:
+            try:
+                minutes = int(minutes)
+            except ValueError:
+                raise CommandError(f"无效的分钟数: {minutes}")
+            if not 0 < minutes < 24 * 60:
+                raise CommandError(f"无效的分钟数: {minutes}")
+            focus.timePicker.setTime(QTime(minutes // 60, minutes % 60, 0))
+
+        focus.startFocus()
+        return "ok"
+
+    def focusStop(self):
+        """ 结束专注（不弹出确认框） """
+        focus = self._mainWindow().focusInterface
+        if not focus.isFocusing:
+            raise CommandError("当前没有进行中的专注")
+        focus.endFocus()
+        return "ok"
+
+    # ================ 秒表 ================
+    def _stopWatchIndex(self, words, create=False):
+        """ 按名称查找秒表，不指定名称时为主秒表 """
+        stopWatch = self._mainWindow().stopWatchInterface
+        if not words:
+            return stopWatch, 0
+
+        name = " ".join(words)
+        index = stopWatch.group.indexOf(name)
+        if index < 0:
+            if not create:
+                raise CommandError(f"没有名为 {name} 的秒表")
+            index = stopWatch.addStopWatch(name)
+        return stopWatch, index
+
+    def stopWatchStart(self, *name):
+        """ 开始秒表，指定的名称不存在时新建 """
+        stopWatch, index = self._stopWatchIndex(name, create=True)
+        if index == 0:
+            if not stopWatch.isRunning:
+                stopWatch.toggleTimer()
+        else:
+            stopWatch.group.start(index)
+        return "ok"
+
+    def stopWatchPause(self, *name):
+        stopWatch, index = self._stopWatchIndex(name)
+        if index == 0:
+            if stopWatch.isRunning:
+                stopWatch.toggleTimer()
+        else:
+            stopWatch.group.pause(index)
+        return "ok"
+
+    def stopWatchLap(self, *name):
+        stopWatch, index = self._stopWatchIndex(name)
+        if not stopWatch.group.watches[index].isRunning:
+            raise CommandError("秒表未在运行")
+        if index == 0:
+            stopWatch.recordFlag()
+        else:
+            stopWatch.group.lap(index)
+        return formatTime(stopWatch.group.watches[index].laps[-1], True)
+
+    def stopWatchReset(self, *name):
+        stopWatch, index = self._stopWatchIndex(name)
+        if index == 0:
+            stopWatch.resetTimer()
+        else:
+            stopWatch.group.reset(index)
+        return "ok"
+
+    def stopWatchList(self):
+        group = self._mainWindow().stopWatchInterface.group
+        now = group.now()
+        return [{"name": w.name, "running": w.isRunning, "elapsed": w.elapsed(now), "laps": len(w.laps)}
+                for w in group.watches]
+
+    # ================ 任务 ================
+    def tasksList(self):
+        focus = self._mainWindow().focusInterface
+        return [{"name": task.name, "completed": task.is_completed} for task in focus.tasks]
+
+    def tasksAdd(self, *words):
+        name = " ".join(words)
+        if not self._mainWindow().focusInterface.addTask(name):
+            raise CommandError("任务名称不能为空")
+        return "ok"
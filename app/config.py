@@ -3,8 +3,8 @@ from enum import Enum
 import sys
 from PyQt6.QtCore import QLocale
 from qfluentwidgets import (
-    qconfig, QConfig, ConfigItem, OptionsConfigItem, 
-    BoolValidator, OptionsValidator, ConfigSerializer
+    qconfig, QConfig, ConfigItem, OptionsConfigItem, RangeConfigItem,
+    BoolValidator, OptionsValidator, RangeValidator, ConfigSerializer
 )
 
 def isWin11():
@@ -32,11 +32,25 @@ class LanguageSerializer(ConfigSerializer):
 class Config(QConfig):
     """ 配置类 """
     language = OptionsConfigItem( # 语言
-        "MainWindow", "Language", Language.AUTO, OptionsValidator(Language), LanguageSerializer(), restart=True)
+        "MainWindow", "Language", Language.AUTO, OptionsValidator(Language), LanguageSerializer())
     minimizeToTray = ConfigItem( # 最小化到托盘
         "MainWindow", "MinimizeToTray", True, BoolValidator())  
     micaEnabled = ConfigItem( # 亚克力效果
         "MainWindow", "MicaEnabled", isWin11(), BoolValidator())  
+    automationEnabled = ConfigItem( # 本地自动化接口
+        "Automation", "Enabled", False, BoolValidator())
+    automationPort = RangeConfigItem( # 自动化接口端口（只监听 127.0.0.1）
+        "Automation", "Port", 8765, RangeValidator(1024, 65535))
+    archiveAfterDays = RangeConfigItem( # 已完成任务归档的天数，0 表示不归档
+        "Tasks", "ArchiveAfterDays", 7, RangeValidator(0, 90))
+    shortBreakMinutes = RangeConfigItem( # 短休息分钟数
+        "Focus", "ShortBreakMinutes", 5, RangeValidator(1, 30))
+    longBreakMinutes = RangeConfigItem( # 长休息分钟数
+        "Focus", "LongBreakMinutes", 15, RangeValidator(5, 60))
+    longBreakInterval = RangeConfigItem( # 每几轮专注之后长休息一次
+        "Focus", "LongBreakInterval", 4, RangeValidator(2, 8))
+    focusCycles = RangeConfigItem( # 每次专注的轮数
+        "Focus", "Cycles", 8, RangeValidator(1, 16))
 
 
 HELP_URL = "https://qfluentwidgets.com/zh/pages/about"
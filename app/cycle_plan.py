@@ -0,0 +1,94 @@
+""" 番茄钟循环计划
+
+一个计划由每轮专注时长、短休息、长休息、每几轮一次长休息和总轮数组成。
+开始专注前把计划编译成时间线：按顺序排列的各段（专注 / 短休息 / 长休息）的结束偏移，
+以及每段的类型和所属的轮次。
+
+专注进行中只需要用已经过的秒数在结束偏移中二分查找当前段，
+不再每秒根据取模重新推算是否该休息；段的切换时刻也可以直接读出，后台时只需一个定时器。
+"""
+from bisect import bisect_right
+from enum import Enum
+from typing import NamedTuple
+
+
+class SegmentKind(Enum):
+    FOCUS = 0
+    SHORT_BREAK = 1
+    LONG_BREAK = 2
+
+
+class CyclePlan(NamedTuple):
+    """ 循环计划，时长均为秒 """
+    focusSeconds: int
+    shortBreakSeconds: int
+    longBreakSeconds: int
+    longBreakInterval: int  # 每几轮专注之后长休息一次
+    cycles: int
+
+    def breakAfter(self, cycle):
+        """ 第 cycle 轮（从 1 开始）专注之后的休息类型和时长，最后一轮之后没有休息 """
+        if cycle >= self.cycles:
+            return None, 0
+        if self.longBreakInterval and cycle % self.longBreakInterval == 0:
+            return SegmentKind.LONG_BREAK, self.longBreakSeconds
+        return SegmentKind.SHORT_BREAK, self.shortBreakSeconds
+
+    def compile(self):
+        return CycleTimeline(self)
+
+
+class CycleTimeline:
+    """ 编译后的时间线 """
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.ends = []           # 每段的结束偏移（从专注开始算起的秒数），递增
+        self.kinds = []          # 每段的类型
+        self.cycles = []         # 每段所属的轮次，从 1 开始
+        self.focusEnds = []      # 到每段结束为止累计的专注秒数（不含休息）
+
+        end = 0
+        for cycle in range(1, plan.cycles + 1):
+            end += plan.focusSeconds
+            self._append(SegmentKind.FOCUS, cycle, end)
+
+            kind, seconds = plan.breakAfter(cycle)
+            if seconds > 0:
+                end += seconds
+                self._append(kind, cycle, end)
+
+    def _append(self, kind, cycle, end):
+        focused = self.focusEnds[-1] if self.focusEnds else 0
+        if kind is SegmentKind.FOCUS:
+            focused += end - (self.ends[-1] if self.ends else 0)
+        self.ends.append(end)
+        self.kinds.append(kind)
+        self.cycles.append(cycle)
+        self.focusEnds.append(focused)
+
+    def __len__(self):
+        return len(self.ends)
+
+    @property
+    def total(self):
+        """ 整个计划的时长 """
+        return self.ends[-1] if self.ends else 0
+
+    def startOf(self, index):
+        return self.ends[index - 1] if index > 0 else 0
+
+    def segmentAt(self, elapsed):
+        """ elapsed 秒所在段的序号，计划已经结束时返回段数 """
+        return bisect_right(self.ends, elapsed)
+
+    def focusedAt(self, elapsed):
+        """ 前 elapsed 秒中处于专注段的秒数，休息段不计 """
+        index = self.segmentAt(elapsed)
+        if index >= len(self.ends):
+            return self.focusEnds[-1] if self.focusEnds else 0
+
+        focused = self.focusEnds[index - 1] if index > 0 else 0
+        if self.kinds[index] is SegmentKind.FOCUS:
+            focused += elapsed - self.startOf(index)
+        return focused
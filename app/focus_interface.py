@@ -1,23 +1,42 @@
 # 标准库导入
+import os
 import sys
 import time
-from datetime import datetime, timedelta
+import itertools
+from contextlib import contextmanager
+from datetime import datetime, timedelta, date
 
 # 第三方库导入
-from PyQt6.QtWidgets import QApplication, QWidget
-from PyQt6.QtCore import Qt, QTimer, QTime, pyqtSignal
-from PyQt6.QtGui import QIntValidator, QCursor, QKeySequence, QShortcut, QPixmap, QMovie
+from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QHBoxLayout
+from PyQt6.QtCore import Qt, QTimer, QTime, QDate, QEvent, QMimeData, QRectF, QT_TRANSLATE_NOOP, pyqtSignal
+from PyQt6.QtGui import QIntValidator, QCursor, QPixmap, QMovie, QDrag, QColor, QPainter
 
 # 本地模块导入
 from interfaces.FocusInterface_ui import Ui_FocusInterface
 from qfluentwidgets import (
-    FluentIcon, InfoBarIcon, InfoBar, InfoBarPosition, MessageBox, 
+    FluentIcon, InfoBarIcon, InfoBarPosition, MessageBox, 
     StateToolTip, LineEdit, MessageBoxBase, SubtitleLabel,
-    RoundMenu, Action,
+    Action, CalendarPicker, TimePicker, ComboBox, BodyLabel, SpinBox, themeColor, isDarkTheme,
+    FlowLayout, PillPushButton, TreeView, PushButton, CommandBar, CheckBox, ListView,
     )
-from utils import showHelpMessageBox
+from utils import signalBus, showHelpMessageBox
+from action_registry import ActionRegistry, ReusableRoundMenu, shortcutLabel
+from notification import notificationService
+from clock_service import clockService
+from reminder_scheduler import reminderScheduler
+from recurrence import RecurrenceRule, Frequency
+from session_checkpoint import SessionCheckpoint, SessionSnapshot
+from timekeeper import timekeeper, splitByDay
+from fractional_index import keyBetween, keysBetween, evenKeys
+from tag_index import TagIndex, parseTags
+from task_tree import TaskTreeModel
+from task_archive import TaskArchive, ArchiveModel
+from cycle_plan import CyclePlan, SegmentKind
+from mini_timer import MiniTimerWindow
+from config import cfg
+from stopwatch_group import formatTime
 
-from paths import jpg_path, gif_path
+from paths import jpg_path, gif_path, data_path
 
 
 class EditDailyTargetMB(MessageBox):
@@ -25,64 +44,380 @@ class EditDailyTargetMB(MessageBox):
     def __init__(self, title, content, parent=None):
         super().__init__(title, content, parent)
         self.LineEdit = LineEdit(self)
-        self.LineEdit.setPlaceholderText("每日目标分钟数")
+        self.LineEdit.setPlaceholderText(self.tr("每日目标分钟数"))
         self.LineEdit.setValidator(QIntValidator(0, 10000))
         self.LineEdit.setAlignment(Qt.AlignmentFlag.AlignCenter)
         # 添加输入框到按钮上方
         self.vBoxLayout.insertWidget(1, self.LineEdit)
-        self.yesButton.setText("确定")
-        self.cancelButton.setText("取消")
+        self.yesButton.setText(self.tr("确定"))
+        self.cancelButton.setText(self.tr("取消"))
         self.widget.setMinimumWidth(300)
         # 添加回车键响应
         self.LineEdit.returnPressed.connect(self.accept)
 
 class AddTaskMessageBox(MessageBoxBase):
     """ 添加任务对话框 """
+    REPEATS = [(QT_TRANSLATE_NOOP("AddTaskMessageBox", "不重复"), None),
+               (QT_TRANSLATE_NOOP("AddTaskMessageBox", "每天"), Frequency.DAILY),
+               (QT_TRANSLATE_NOOP("AddTaskMessageBox", "工作日"), Frequency.WEEKDAYS),
+               (QT_TRANSLATE_NOOP("AddTaskMessageBox", "每 N 天"), Frequency.EVERY_N_DAYS),
+               (QT_TRANSLATE_NOOP("AddTaskMessageBox", "每月今天"), Frequency.MONTHLY)]
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.titleLabel = SubtitleLabel('添加任务', self)
+        self.titleLabel = SubtitleLabel(self.tr('添加任务'), self)
         self.LineEdit = LineEdit()
-        self.LineEdit.setPlaceholderText('输入任务名称')
+        self.LineEdit.setPlaceholderText(self.tr('输入任务名称'))
         self.LineEdit.setClearButtonEnabled(True)
+        self.tagLineEdit = LineEdit()
+        self.tagLineEdit.setPlaceholderText(self.tr('标签（可选，用空格或逗号分隔）'))
+        self.tagLineEdit.setClearButtonEnabled(True)
+
+        # 重复方式
+        self.repeatComboBox = ComboBox(self)
+        self.repeatComboBox.addItems([self.tr(text) for text, _ in self.REPEATS])
+        self.intervalSpinBox = SpinBox(self)
+        self.intervalSpinBox.setRange(2, 365)
+        self.intervalSpinBox.setValue(2)
+        self.intervalSpinBox.setVisible(False)
+        self.repeatComboBox.currentIndexChanged.connect(
+            lambda i: self.intervalSpinBox.setVisible(self.REPEATS[i][1] == Frequency.EVERY_N_DAYS))
 
         # 将组件添加到布局中
         self.viewLayout.addWidget(self.titleLabel)
         self.viewLayout.addWidget(self.LineEdit)
+        self.viewLayout.addWidget(self.tagLineEdit)
+        self.viewLayout.addWidget(self.repeatComboBox)
+        self.viewLayout.addWidget(self.intervalSpinBox)
 
         # 设置对话框的最小宽度
         self.widget.setMinimumWidth(350)
         # 添加回车键响应
         self.LineEdit.returnPressed.connect(self.accept)
+        self.tagLineEdit.returnPressed.connect(self.accept)
+
+    def tags(self):
+        return parseTags(self.tagLineEdit.text())
+
+    def rule(self):
+        """选择了重复方式时返回重复规则，否则返回 None"""
+        frequency = self.REPEATS[self.repeatComboBox.currentIndex()][1]
+        name = self.LineEdit.text().strip()
+        if frequency is None or not name:
+            return None
+        rule = RecurrenceRule(name, frequency, interval=self.intervalSpinBox.value())
+        rule.tags = self.tags()
+        return rule
 
 class EditTaskMessageBox(MessageBoxBase):
     """ 编辑任务对话框 """
-    def __init__(self, task_name, parent=None):
+    def __init__(self, task_name, tags=(), estimate=0, parent=None):
         super().__init__(parent)
-        self.titleLabel = SubtitleLabel('编辑任务', self)
+        self.titleLabel = SubtitleLabel(self.tr('编辑任务'), self)
         self.LineEdit = LineEdit()
         self.LineEdit.setPlaceholderText(f'{task_name}')
         self.LineEdit.setClearButtonEnabled(True)
+        self.tagLineEdit = LineEdit()
+        self.tagLineEdit.setPlaceholderText(self.tr('标签（用空格或逗号分隔）'))
+        self.tagLineEdit.setText(" ".join(sorted(tags)))
+        self.tagLineEdit.setClearButtonEnabled(True)
+
+        # 预计专注时长，0 表示不预估
+        self.estimateSpinBox = SpinBox(self)
+        self.estimateSpinBox.setRange(0, 6000)
+        self.estimateSpinBox.setSingleStep(5)
+        self.estimateSpinBox.setSpecialValueText(self.tr('不预估时长'))
+        self.estimateSpinBox.setSuffix(self.tr(' 分钟'))
+        self.estimateSpinBox.setValue(estimate)
 
         # 将组件添加到布局中
         self.viewLayout.addWidget(self.titleLabel)
         self.viewLayout.addWidget(self.LineEdit)
+        self.viewLayout.addWidget(self.tagLineEdit)
+        self.viewLayout.addWidget(self.estimateSpinBox)
 
         # 设置对话框的最小宽度
         self.widget.setMinimumWidth(350)
         # 添加回车键响应
         self.LineEdit.returnPressed.connect(self.accept)
+        self.tagLineEdit.returnPressed.connect(self.accept)
+
+    def tags(self):
+        return parseTags(self.tagLineEdit.text())
+
+class SubtaskMessageBox(MessageBoxBase):
+    """ 子任务对话框，子任务按需加载，展开时才读取下一层 """
+    def __init__(self, task, parent=None):
+        super().__init__(parent)
+        self.titleLabel = SubtitleLabel(self.tr('子任务'), self)
+        self.taskLabel = BodyLabel(task.name, self)
+
+        self.model = TaskTreeModel(task, self)
+        self.treeView = TreeView(self)
+        self.treeView.setModel(self.model)
+        self.treeView.setHeaderHidden(True)
+        self.treeView.setUniformRowHeights(True)
+        self.treeView.setMinimumHeight(260)
+
+        # 新子任务添加到选中的任务下，没有选中时添加到顶层
+        self.LineEdit = LineEdit(self)
+        self.LineEdit.setPlaceholderText(self.tr('输入子任务名称，添加到选中的任务下'))
+        self.LineEdit.setClearButtonEnabled(True)
+        self.LineEdit.returnPressed.connect(self.addSubtask)
+        self.addButton = PushButton(self.tr('添加'), self, FluentIcon.ADD)
+        self.addButton.clicked.connect(self.addSubtask)
+        self.deleteButton = PushButton(self.tr('删除'), self, FluentIcon.DELETE)
+        self.deleteButton.clicked.connect(self.deleteSubtask)
+
+        inputLayout = QHBoxLayout()
+        inputLayout.addWidget(self.LineEdit, 1)
+        inputLayout.addWidget(self.addButton)
+        inputLayout.addWidget(self.deleteButton)
+
+        # 将组件添加到布局中
+        self.viewLayout.addWidget(self.titleLabel)
+        self.viewLayout.addWidget(self.taskLabel)
+        self.viewLayout.addWidget(self.treeView)
+        self.viewLayout.addLayout(inputLayout)
+
+        self.yesButton.setText(self.tr("完成"))
+        self.cancelButton.hide()
+        self.widget.setMinimumWidth(420)
+
+    def selectedTask(self):
+        index = self.treeView.currentIndex()
+        return self.model.taskAt(index) if index.isValid() else self.model.root
+
+    def addSubtask(self):
+        name = self.LineEdit.text().strip()
+        if not name:
+            return
+        parent = self.selectedTask()
+        self.model.addTask(parent, Task(name))
+        self.treeView.expand(self.model.indexOf(parent))
+        self.LineEdit.clear()
+
+    def deleteSubtask(self):
+        index = self.treeView.currentIndex()
+        if index.isValid():
+            self.model.removeTask(self.model.taskAt(index))
+
+class BulkTagMessageBox(MessageBoxBase):
+    """ 批量修改标签对话框 """
+    def __init__(self, count, parent=None):
+        super().__init__(parent)
+        self.titleLabel = SubtitleLabel(self.tr('修改标签'), self)
+        self.countLabel = BodyLabel(self.tr('已选择 {0} 个任务').format(count), self)
+        self.addLineEdit = LineEdit()
+        self.addLineEdit.setPlaceholderText(self.tr('添加的标签（用空格或逗号分隔）'))
+        self.addLineEdit.setClearButtonEnabled(True)
+        self.removeLineEdit = LineEdit()
+        self.removeLineEdit.setPlaceholderText(self.tr('移除的标签（用空格或逗号分隔）'))
+        self.removeLineEdit.setClearButtonEnabled(True)
+
+        # 将组件添加到布局中
+        self.viewLayout.addWidget(self.titleLabel)
+        self.viewLayout.addWidget(self.countLabel)
+        self.viewLayout.addWidget(self.addLineEdit)
+        self.viewLayout.addWidget(self.removeLineEdit)
+
+        self.widget.setMinimumWidth(350)
+        self.addLineEdit.returnPressed.connect(self.accept)
+        self.removeLineEdit.returnPressed.connect(self.accept)
+
+    def addedTags(self):
+        return parseTags(self.addLineEdit.text())
+
+    def removedTags(self):
+        return parseTags(self.removeLineEdit.text())
+
+class ArchiveMessageBox(MessageBoxBase):
+    """ 已归档任务对话框，滚动时逐页读取 """
+    def __init__(self, archive, parent=None):
+        super().__init__(parent)
+        self.model = ArchiveModel(archive, self)
+        self.titleLabel = SubtitleLabel(self.tr('已归档任务'), self)
+        self.countLabel = BodyLabel(self.tr('共 {0} 个任务').format(self.model.total), self)
+
+        self.listView = ListView(self)
+        self.listView.setUniformItemSizes(True)
+        self.listView.setModel(self.model)
+        self.listView.setMinimumHeight(320)
+
+        # 将组件添加到布局中
+        self.viewLayout.addWidget(self.titleLabel)
+        self.viewLayout.addWidget(self.countLabel)
+        self.viewLayout.addWidget(self.listView)
+
+        self.yesButton.setText(self.tr("关闭"))
+        self.cancelButton.hide()
+        self.widget.setMinimumWidth(480)
+
+class ReminderMessageBox(MessageBoxBase):
+    """ 设置任务截止时间与提醒对话框 """
+    LEADS = [(QT_TRANSLATE_NOOP("ReminderMessageBox", "准时提醒"), timedelta(0)),
+             (QT_TRANSLATE_NOOP("ReminderMessageBox", "提前 5 分钟"), timedelta(minutes=5)),
+             (QT_TRANSLATE_NOOP("ReminderMessageBox", "提前 15 分钟"), timedelta(minutes=15)),
+             (QT_TRANSLATE_NOOP("ReminderMessageBox", "提前 1 小时"), timedelta(hours=1))]
+    REPEATS = [(QT_TRANSLATE_NOOP("ReminderMessageBox", "不重复"), None),
+               (QT_TRANSLATE_NOOP("ReminderMessageBox", "每天"), timedelta(days=1)),
+               (QT_TRANSLATE_NOOP("ReminderMessageBox", "每周"), timedelta(weeks=1))]
+
+    def __init__(self, task, parent=None):
+        super().__init__(parent)
+        self.titleLabel = SubtitleLabel(self.tr('设置提醒'), self)
+        self.taskLabel = BodyLabel(task.name, self)
+
+        # 截止日期和时间，默认为一小时后
+        due = task.due_time or datetime.now().replace(second=0, microsecond=0) + timedelta(hours=1)
+        self.datePicker = CalendarPicker(self)
+        self.datePicker.setDate(QDate(due.year, due.month, due.day))
+        self.timePicker = TimePicker(self)
+        self.timePicker.setTime(QTime(due.hour, due.minute))
+
+        self.leadComboBox = ComboBox(self)
+        self.leadComboBox.addItems([self.tr(text) for text, _ in self.LEADS])
+        self.leadComboBox.setCurrentIndex(
+            next((i for i, (_, lead) in enumerate(self.LEADS) if lead == task.remind_before), 0))
+
+        self.repeatComboBox = ComboBox(self)
+        self.repeatComboBox.addItems([self.tr(text) for text, _ in self.REPEATS])
+        self.repeatComboBox.setCurrentIndex(
+            next((i for i, (_, repeat) in enumerate(self.REPEATS) if repeat == task.repeat), 0))
+
+        # 将组件添加到布局中
+        self.viewLayout.addWidget(self.titleLabel)
+        self.viewLayout.addWidget(self.taskLabel)
+        self.viewLayout.addWidget(self.datePicker)
+        self.viewLayout.addWidget(self.timePicker)
+        self.viewLayout.addWidget(self.leadComboBox)
+        self.viewLayout.addWidget(self.repeatComboBox)
+
+        self.yesButton.setText(self.tr("确定"))
+        self.cancelButton.setText(self.tr("取消"))
+        self.widget.setMinimumWidth(350)
+
+    def dueTime(self):
+        """选择的截止时间"""
+        date, time_ = self.datePicker.date, self.timePicker.time
+        return datetime(date.year(), date.month(), date.day(), time_.hour(), time_.minute())
+
+    def remindBefore(self):
+        return self.LEADS[self.leadComboBox.currentIndex()][1]
+
+    def repeat(self):
+        return self.REPEATS[self.repeatComboBox.currentIndex()][1]
+
+class CycleTimelineBar(QWidget):
+    """ 循环计划的时间线预览：按时长比例绘制各段，专注进行中已经过的部分高亮
+
+    各段的矩形只在时间线或尺寸变化时计算，进度只在高亮边界移动了至少一个像素时才重绘。
+    """
+    GAP = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timeline = None
+        self._rects = []      # (矩形, 段类型)
+        self._progressX = None  # 已经过部分的右边界，None 表示没有在专注
+        self.setFixedSize(280, 8)
+
+    def setTimeline(self, timeline):
+        self.timeline = timeline
+        self._progressX = None
+        self._layoutSegments()
+        self.update()
+
+    def setElapsed(self, elapsed):
+        """ 设置已经过的秒数，None 表示不在专注 """
+        x = None
+        if elapsed is not None and self.timeline and self.timeline.total:
+            x = round(min(elapsed / self.timeline.total, 1) * self.width())
+        if x != self._progressX:
+            self._progressX = x
+            self.update()
+
+    def _layoutSegments(self):
+        self._rects = []
+        timeline = self.timeline
+        if not timeline or not timeline.total:
+            return
+
+        scale = self.width() / timeline.total
+        for index, kind in enumerate(timeline.kinds):
+            left = round(timeline.startOf(index) * scale)
+            right = round(timeline.ends[index] * scale) - self.GAP
+            self._rects.append((QRectF(left, 0, max(right - left, 1), self.height()), kind))
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._layoutSegments()
+
+    def _segmentColor(self, kind):
+        if kind is SegmentKind.FOCUS:
+            return themeColor()
+        if kind is SegmentKind.LONG_BREAK:
+            return QColor(16, 137, 62)
+        return QColor(255, 255, 255, 90) if isDarkTheme() else QColor(0, 0, 0, 60)
+
+    def paintEvent(self, e):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        radius = self.height() / 2
+
+        # 专注进行中：先把全部段画成浅色，再在已经过的范围内画实色
+        passes = [(None, 1.0)] if self._progressX is None else [(None, 0.35), (self._progressX, 1.0)]
+        for clipX, opacity in passes:
+            if clipX is not None:
+                painter.setClipRect(0, 0, clipX, self.height())
+            painter.setOpacity(opacity)
+            for rect, kind in self._rects:
+                painter.setBrush(self._segmentColor(kind))
+                painter.drawRoundedRect(rect, radius, radius)
+
 
 class Task:
     """ 任务类 """
+    _ids = itertools.count(1)
+
     def __init__(self, name, is_completed=False):
+        self.id = next(Task._ids)  # 任务编号，用作提醒等索引的键
         self.name = name
         self.is_completed = is_completed
         self.created_time = datetime.now()
+        self.completed_time = None  # 完成时间，用于判断是否归档
+        self.due_time = None  # 截止时间
+        self.remind_before = timedelta(0)  # 提前提醒的时长
+        self.repeat = None  # 重复间隔，None 表示不重复
+        self.rule_id = None  # 所属重复规则，None 表示普通任务
+        self.occurrence_date = None  # 重复任务对应的日期
+        self.order = ""  # 分数排序键，列表按它升序显示
+        self.tags = set()  # 标签
+        self.parent = None  # 父任务，顶层任务为 None
+        self.children = []  # 子任务
+        self.row = 0  # 在父任务 children 中的位置
+        self.totalCount = 0  # 子树中的任务数（不含自身），随增删沿祖先链增量更新
+        self.doneCount = 0  # 子树中已完成的任务数
+        self.estimateMinutes = 0  # 预计专注分钟数，0 表示不预估
+        self.focusedSeconds = 0  # 实际专注秒数，每段专注结束或切换任务时累加
+
+    def remindTime(self):
+        """提醒时间"""
+        return self.due_time - self.remind_before if self.due_time else None
 
 class FocusInterface(QWidget, Ui_FocusInterface):
     # 定义信号
     focusStarted = pyqtSignal(int)  # 专注开始信号，参数为专注时长(秒)
     focusEnded = pyqtSignal(int)    # 专注结束信号，参数为实际专注时长(秒)
+    sessionStateChanged = pyqtSignal()  # 专注/休息状态切换信号
+    tasksChanged = pyqtSignal()  # 任务列表变化信号
+    progressChanged = pyqtSignal()  # 每日进度或目标变化信号
+
+    CHECKPOINT_INTERVAL = 5000  # 专注期间保存检查点的间隔（毫秒）
+    ORDER_KEY_LIMIT = 24  # 排序键超过该长度时在空闲时整体重排
+    TASK_MIME_TYPE = "application/x-penguin-stride-task"
+    RULE_PREVIEW_DAYS = 7  # 重复任务提示中预览的天数
     
     def __init__(self, parent=None):
         super().__init__(parent=parent)
@@ -97,21 +432,47 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         """初始化所有变量"""
         # 专注相关变量
         self.isFocusing = False  # 是否正在专注
-        self.focusStartTime = None  # 专注开始时间
-        self.focusTimer = QTimer(self)  # 专注计时器
-        self.focusTimer.timeout.connect(self.updateFocusTime) 
-        self.breakTimer = QTimer(self)  # 休息计时器
-        self.breakTimer.timeout.connect(self.updateBreakTime)
-        self.stateTooltip = None  # 状态提示
+        self.focusStartTime = None  # 专注开始时间（墙上时钟，只用于显示和对外报告）
+        self.focusStartActive = 0.0  # 专注开始时的清醒时钟读数，时长都由它计算
+        self.timeline = None  # 由循环计划编译出的时间线，专注期间保持不变
+        self.segmentIndex = -1  # 当前所在的时间线段
+        self.miniTimer = None  # 置顶的迷你计时器，第一次点击固定按钮时创建
+        self._resourcesReleased = False  # 图片和任务卡片是否已被回收
+        self.creditedSeconds = 0  # 本次专注中已经计入前一天的专注秒数（跨零点时，不含休息）
+        self.tickSubscription = None  # 全局时钟的每秒订阅（专注或休息倒计时）
+        self.deadlineTimer = QTimer(self)  # 后台截止定时器，只在下一次状态切换时唤醒
+        self.deadlineTimer.setSingleShot(True)
+        self.deadlineTimer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.deadlineTimer.timeout.connect(self._onDeadline)
+        self.isBreaking = False  # 是否正在休息
+        self.isBackground = False  # 窗口是否不可见（最小化或托盘）
+        self.stateTooltip = None  # 状态提示，第一次显示时创建，之后一直复用
+        self.checkpoint = SessionCheckpoint(os.path.join(data_path, "session.ckpt"))  # 崩溃恢复用的会话检查点
+        self.checkpointSubscription = None  # 专注期间定期保存检查点
+        self.archive = TaskArchive(data_path)  # 完成较久的任务移到这里
+        self.focusTask = None  # 本次专注绑定的任务
+        self.focusTaskSince = 0  # 从本次专注的第几秒开始计入 focusTask
         
         # 每日进度相关变量
         self.dailyTarget = 120  # 每日目标专注分钟数
         self.dailyCompleted = 5  # 已完成分钟数
         self.continuousDays = 6  # 连续达标天数
         self.yesterdayMinutes = 30  # 昨天专注分钟数
+        self.progressDate = date.today()  # 每日进度所属的日期
         
         # 任务相关变量
         self.tasks = []  # 任务列表
+        self.rules = {}  # 重复规则，规则编号 -> RecurrenceRule，只在显示日期时展开
+        self._rebalancePending = False  # 是否已安排排序键重排
+        self._dragStart = None  # 按下鼠标的卡片和位置，用于区分点击和拖动
+        self.tagIndex = TagIndex()  # 标签 -> 任务编号位图，随任务增删改增量维护
+        self.tagFilter = set()  # 选中的筛选标签，为空表示不筛选
+        self.tagMatchAll = True  # True 为全部匹配，False 为任一匹配
+        self.selectedTaskIds = set()  # 多选的任务编号
+        self._selectionAnchor = None  # Shift 连续选择的起点任务编号
+        self._transactionDepth = 0  # 批量操作的嵌套层数，期间只记录列表需要刷新
+        self._taskListDirty = False
+        self.expandedDate = None  # 已展开重复任务的日期
     
     def _initUI(self):
         """初始化所有UI元素"""
@@ -120,9 +481,14 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         
         # 设置默认时间
         self.timePicker.setTime(QTime(0, 25, 0))  # 默认25分钟
-        
-        # 初始化休息提示
-        self.updateBreakHint()
+
+        # 循环计划的时间线预览，放在休息提示下方
+        self.timelineBar = CycleTimelineBar(self.focusCard)
+        self.verticalLayout.insertWidget(
+            self.verticalLayout.indexOf(self.bottomHintLabel) + 1, self.timelineBar, 0, Qt.AlignmentFlag.AlignHCenter)
+
+        # 编译循环计划并初始化休息提示
+        self.compileTimeline()
         
         # 初始化进度界面
         self.initProgressUI()
@@ -130,11 +496,15 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         # 初始化任务界面
         self.initTaskUI()
 
+        # 初始化任务菜单
+        self.initTaskMenus()
+
         # 初始化图片卡片
         self.initImageCard()
 
     def setIcons(self):
         self.pinButton.setIcon(FluentIcon.PIN)
+        self.pinButton.setToolTip(self.tr("迷你计时器"))
         self.moreButton.setIcon(FluentIcon.MORE)
         self.editButton.setIcon(FluentIcon.EDIT)
         self.addTaskButton.setIcon(FluentIcon.ADD)
@@ -153,13 +523,77 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         # 设置文本
         self.yesterdayTimeLabel.setText(str(self.yesterdayMinutes))
         self.compianceDayLabel.setText(str(self.continuousDays))
-        self.finishTimeLabel.setText(f"已完成：{self.dailyCompleted} 分钟")
+        self.finishTimeLabel.setText(self.tr("已完成：{0} 分钟").format(self.dailyCompleted))
 
     def initTaskUI(self):
         """初始化任务界面"""
-        self.addTask("完成专注功能开发")
-        self.addTask("阅读《深度工作》一章")
-        self.addTask("整理今日笔记")
+        self.initSelectionBar()
+        self.initTagFilterBar()
+        self.addTask(self.tr("完成专注功能开发"))
+        self.addTask(self.tr("阅读《深度工作》一章"))
+        self.addTask(self.tr("整理今日笔记"))
+
+    def initTaskMenus(self):
+        """初始化任务菜单（只构建一次，之后复用）"""
+        registry = ActionRegistry.of(self)
+        self._menuTaskIndex = -1  # 右键菜单当前绑定的任务索引
+
+        # 任务卡片右键菜单
+        self.roundTaskMenu = ReusableRoundMenu(parent=self)
+
+        self.editAction = editAction = Action(FluentIcon.EDIT, self.tr("修改"), self)
+        editAction.triggered.connect(lambda: self.editTask(self._menuTaskIndex))
+
+        self.deleteAction = deleteAction = Action(FluentIcon.DELETE, self.tr("删除"), self)
+        deleteAction.triggered.connect(lambda: self.deleteTask(self._menuTaskIndex))
+
+        self.reminderAction = reminderAction = Action(FluentIcon.RINGER, self.tr("设置提醒"), self)
+        reminderAction.triggered.connect(lambda: self.showReminderDialog(self._menuTaskIndex))
+
+        self.clearReminderAction = clearReminderAction = Action(FluentIcon.CANCEL, self.tr("取消提醒"), self)
+        clearReminderAction.triggered.connect(lambda: self.clearTaskReminder(self._menuTaskIndex))
+
+        self.focusTaskAction = focusTaskAction = Action(FluentIcon.STOP_WATCH, self.tr("专注此任务"), self)
+        focusTaskAction.triggered.connect(lambda: self.focusOnTask(self._menuTaskIndex))
+
+        self.subtaskAction = subtaskAction = Action(FluentIcon.TILES, self.tr("子任务"), self)
+        subtaskAction.triggered.connect(lambda: self.showSubtaskDialog(self._menuTaskIndex))
+
+        self.stopRepeatAction = stopRepeatAction = Action(FluentIcon.SYNC, self.tr("停止重复"), self)
+        stopRepeatAction.triggered.connect(lambda: self.stopRecurringTask(self._menuTaskIndex))
+
+        self.helpAction = helpAction = Action(FluentIcon.HELP, shortcutLabel(self.tr("帮助"), "Ctrl+H"), self)
+        helpAction.triggered.connect(lambda: showHelpMessageBox(self))
+        registry.shortcut("Ctrl+H", lambda: showHelpMessageBox(self.window()))
+
+        self.roundTaskMenu.addAction(focusTaskAction)
+        self.roundTaskMenu.addSeparator()
+        self.roundTaskMenu.addAction(editAction)
+        self.roundTaskMenu.addAction(deleteAction)
+        self.roundTaskMenu.addAction(subtaskAction)
+        self.roundTaskMenu.addSeparator()
+        self.roundTaskMenu.addAction(reminderAction)
+        self.roundTaskMenu.addAction(clearReminderAction)
+        self.roundTaskMenu.addAction(stopRepeatAction)
+        self.roundTaskMenu.addSeparator()
+        self.roundTaskMenu.addAction(helpAction)
+
+        # 任务更多菜单
+        self.taskMenu = ReusableRoundMenu(parent=self)
+
+        self.clearCompletedAction = clearCompletedAction = Action(FluentIcon.BROOM, self.tr("清除已完成任务"), self)
+        clearCompletedAction.triggered.connect(self.clearCompletedTasks)
+
+        self.clearAllAction = clearAllAction = Action(FluentIcon.DELETE, self.tr("清除所有任务"), self)
+        clearAllAction.triggered.connect(self.clearAllTasks)
+
+        self.archiveAction = archiveAction = Action(FluentIcon.LIBRARY, self.tr("已归档任务"), self)
+        archiveAction.triggered.connect(self.showArchiveDialog)
+
+        self.taskMenu.addAction(clearCompletedAction)
+        self.taskMenu.addAction(clearAllAction)
+        self.taskMenu.addSeparator()
+        self.taskMenu.addAction(archiveAction)
 
     def initImageCard(self):
         """初始化图片卡片"""
@@ -173,31 +607,97 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         """连接信号和槽"""
         # 专注时段部分
         self.startFocusButton.clicked.connect(self.toggleFocus)
-        self.skipRelaxCheckBox.toggled.connect(self.updateBreakHint)
-        self.timePicker.timeChanged.connect(self.updateBreakHint)
+        self.pinButton.clicked.connect(self.toggleMiniTimer)
+        self.skipRelaxCheckBox.toggled.connect(self.compileTimeline)
+        self.timePicker.timeChanged.connect(self.compileTimeline)
+        for item in (cfg.focusCycles, cfg.shortBreakMinutes, cfg.longBreakMinutes, cfg.longBreakInterval):
+            item.valueChanged.connect(self.compileTimeline)
         
         # 每日进度部分
         self.editButton.clicked.connect(self.editDailyTarget)
 
+        # 后台模式
+        signalBus.backgroundModeChanged.connect(self.setBackgroundMode)
+
+        # 任务提醒
+        reminderScheduler.reminderDue.connect(self._onReminderDue)
+
+        # 睡眠、时钟跳变和零点换日
+        timekeeper.suspended.connect(self._onClockChanged)
+        timekeeper.clockJumped.connect(self._onClockChanged)
+        timekeeper.dayChanged.connect(self.rolloverDay)
+        timekeeper.start()
+
         # 任务部分
         self.addTaskButton.clicked.connect(self.showAddTaskDialog)
         self.moreTaskButton.clicked.connect(self.showTaskMenu)
+
+        # 已完成任务归档
+        cfg.archiveAfterDays.valueChanged.connect(lambda _: self.archiveCompletedTasks())
+        self.archiveCompletedTasks()
         
     # ================ 专注功能相关方法 ================    
+    def currentPlan(self, focusSeconds=None, skipBreak=None):
+        """由时间选择器（每轮专注时长）和设置生成循环计划，跳过休息时各轮之间没有休息
+
+        恢复检查点时传入会话保存的专注时长和是否跳过休息。
+        """
+        if focusSeconds is None:
+            focusTime = self.timePicker.time
+            focusSeconds = focusTime.hour() * 3600 + focusTime.minute() * 60 + focusTime.second()
+        if skipBreak is None:
+            skipBreak = self.skipRelaxCheckBox.isChecked()
+        return CyclePlan(
+            focusSeconds=focusSeconds,
+            shortBreakSeconds=0 if skipBreak else cfg.get(cfg.shortBreakMinutes) * 60,
+            longBreakSeconds=0 if skipBreak else cfg.get(cfg.longBreakMinutes) * 60,
+            longBreakInterval=cfg.get(cfg.longBreakInterval),
+            cycles=cfg.get(cfg.focusCycles),
+        )
+
+    def compileTimeline(self, *args):
+        """计划变化时重新编译时间线；专注期间沿用开始时的时间线，结束后再编译"""
+        if self.isFocusing:
+            return
+
+        self.timeline = self.currentPlan().compile()
+        self.timelineBar.setTimeline(self.timeline)
+        self.updateBreakHint()
+
+    def _durationText(self, seconds):
+        minutes, seconds = divmod(seconds, 60)
+        if seconds:
+            return self.tr("{0} 分 {1} 秒").format(minutes, seconds)
+        return self.tr("{0} 分钟").format(minutes)
+
     def updateBreakHint(self):
-        """更新休息提示"""
-        focusTime = self.timePicker.time
-        minutes = focusTime.minute()
-        seconds = focusTime.second()
+        """更新休息提示：空闲时描述计划，专注中描述当前段（只在段切换时更新）"""
+        plan = self.timeline.plan
+        focusText = self._durationText(plan.focusSeconds)
 
-        if self.skipRelaxCheckBox.isChecked():
-            self.bottomHintLabel.setText("你将没有休息时间。")
-        else:
-            if minutes >= 25:
-                breakTime = 5
+        if self.isFocusing:
+            kind = self.timeline.kinds[self.segmentIndex]
+            cycle = self.timeline.cycles[self.segmentIndex]
+            if kind is SegmentKind.FOCUS:
+                state = self.tr("第 {0}/{1} 轮专注").format(cycle, plan.cycles)
+            elif kind is SegmentKind.LONG_BREAK:
+                state = self.tr("第 {0}/{1} 轮后的长休息").format(cycle, plan.cycles)
             else:
-                breakTime = 3
-            self.bottomHintLabel.setText(f"每 {minutes} 分钟 {seconds} 秒 休息 {breakTime} 分钟。")
+                state = self.tr("第 {0}/{1} 轮后的休息").format(cycle, plan.cycles)
+            endAt = datetime.now() + timedelta(seconds=self.timeline.total - self.focusElapsed())
+            self.bottomHintLabel.setText(self.tr("{0}，预计 {1} 结束。").format(state, f"{endAt:%H:%M}"))
+        elif self.skipRelaxCheckBox.isChecked() or plan.cycles == 1:
+            self.bottomHintLabel.setText(
+                self.tr("共 {0} 轮，每轮专注 {1}，你将没有休息时间。").format(plan.cycles, focusText))
+        elif plan.cycles > plan.longBreakInterval:
+            self.bottomHintLabel.setText(
+                self.tr("共 {0} 轮，每轮专注 {1}，休息 {2} 分钟，每 {3} 轮长休息 {4} 分钟。").format(
+                    plan.cycles, focusText, plan.shortBreakSeconds // 60,
+                    plan.longBreakInterval, plan.longBreakSeconds // 60))
+        else:
+            self.bottomHintLabel.setText(
+                self.tr("共 {0} 轮，每轮专注 {1}，休息 {2} 分钟。").format(
+                    plan.cycles, focusText, plan.shortBreakSeconds // 60))
     
     def toggleFocus(self):
         """切换专注状态"""
@@ -206,17 +706,15 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         else:
             self.confirmEndFocus()
     
-    def startFocus(self):
-        """开始专注"""
+    def startFocus(self, elapsed=0):
+        """开始专注，elapsed 为恢复中断的会话时已经经过的秒数"""
         focusTime = self.timePicker.time
         totalSeconds = focusTime.hour() * 3600 + focusTime.minute() * 60 + focusTime.second()
         
         if totalSeconds <= 0:
-            InfoBar.error(
-                title="错误",
-                content="请设置有效的专注时间",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
+            notificationService.error(
+                title=self.tr("错误"),
+                content=self.tr("请设置有效的专注时间"),
                 position=InfoBarPosition.TOP,
                 duration=3000,
                 parent=self
@@ -225,110 +723,343 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         
         # 更新UI状态
         self.isFocusing = True
-        self.focusStartTime = datetime.now()
-        self.startFocusButton.setText("结束专注")
+        self.focusStartTime = datetime.now() - timedelta(seconds=elapsed)
+        self.focusStartActive = timekeeper.activeTime() - elapsed
+        self.creditedSeconds = 0
+        self.focusTaskSince = elapsed
+        self.startFocusButton.setText(self.tr("结束专注"))
         self.startFocusButton.setIcon(FluentIcon.CANCEL)
 
-        self.ImageLabel.setMovie(QMovie(gif_path))
-        self.ImageLabel.movie().start()
+        self._updateImage()
         
         # 禁用控件
         self.timePicker.setEnabled(False)
         self.skipRelaxCheckBox.setEnabled(False)
         
         # 显示状态提示
-        self.stateTooltip = StateToolTip("专注进行中", "保持专注，不要分心", self.window())
-        self.stateTooltip.move(self.stateTooltip.getSuitablePos())
-        self.stateTooltip.show()
+        self._showStateTooltip(self.tr("专注进行中"), self.tr("保持专注，不要分心"))
         
-        # 启动定时器
-        self.focusTimer.start(1000)  # 每秒更新一次
+        # 按时间线进入当前段并启动定时器（恢复的会话可能正处于休息）
+        self.segmentIndex = -1
+        self._enterSegment(self.timeline.segmentAt(elapsed))
         
         # 发送信号
-        self.focusStarted.emit(totalSeconds)
+        if self.isFocusing:
+            self.focusStarted.emit(totalSeconds)
     
     def updateFocusTime(self):
-        """更新专注时间"""
+        """每秒刷新：在时间线中二分查找当前段，段变化时切换专注/休息，否则只更新计时"""
         if not self.focusStartTime:
             return
-        
-        elapsed = datetime.now() - self.focusStartTime
-        elapsed_seconds = int(elapsed.total_seconds())
-        
-        # 更新状态提示
-        hours, remainder = divmod(elapsed_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        self.stateTooltip.setContent(f"已专注: {time_str}")
-        
-        # 检查是否需要休息
-        if not self.skipRelaxCheckBox.isChecked():
-            focusTime = self.timePicker.time
-            focus_minutes = focusTime.minute()
-            
-            if focus_minutes > 0 and elapsed_seconds > 0 and elapsed_seconds % (focus_minutes * 60) < 1:
-                self.startBreak()
+
+        elapsed = self.focusElapsed()
+        index = self.timeline.segmentAt(elapsed)
+        if index != self.segmentIndex:
+            self._enterSegment(index)
+            return
+
+        self.timelineBar.setElapsed(elapsed)
+        if self.isBreaking:
+            minutes, seconds = divmod(int(self.timeline.ends[index] - elapsed), 60)
+            self.stateTooltip.setContent(self.tr("剩余休息时间: {0}").format(f"{minutes:02d}:{seconds:02d}"))
+        else:
+            hours, remainder = divmod(int(elapsed), 3600)
+            minutes, seconds = divmod(remainder, 60)
+            time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            self.stateTooltip.setContent(self.tr("已专注: {0}").format(time_str))
     
-    def startBreak(self):
-        """开始休息"""
-        # 暂停专注计时器
-        self.focusTimer.stop()
-        
-        # 计算休息时间
+    def _enterSegment(self, index):
+        """进入时间线的第 index 段，越过最后一段时本次专注完成"""
+        if index >= len(self.timeline):
+            self.endFocus()
+            return
+
+        wasBreaking = self.isBreaking
+        kind = self.timeline.kinds[index]
+        self.segmentIndex = index
+        self.isBreaking = kind is not SegmentKind.FOCUS
+
+        # 显示提示
+        if kind is SegmentKind.LONG_BREAK:
+            self._showStateTooltip(self.tr("长休息时间"), self.tr("离开屏幕走一走，好好恢复精力"))
+        elif kind is SegmentKind.SHORT_BREAK:
+            self._showStateTooltip(self.tr("休息时间"), self.tr("站起来活动一下，放松眼睛"))
+        elif wasBreaking:
+            self._showStateTooltip(self.tr("专注进行中"), self.tr("休息结束，继续专注"))
+
+        self.timelineBar.setElapsed(self.focusElapsed())
+        self.updateBreakHint()
+        self._armTimers()
+    
+    def toggleMiniTimer(self):
+        """固定按钮：弹出置顶的迷你计时器并最小化主窗口，再次点击时收起"""
+        if self.miniTimer is None:
+            self.miniTimer = MiniTimerWindow(self)
+
+        if self.miniTimer.isVisible():
+            self.miniTimer.hide()
+        else:
+            self.miniTimer.popOut()
+
+    # ================ 内存回收相关方法 ================
+    def releaseResources(self):
+        """释放解码后的图片、动画和任务卡片，显示时再重建"""
+        self._releaseMovie()
+        self.ImageLabel.setImage(None)
+        self._clearTaskArea()
+        self._resourcesReleased = True
+
+    def restoreResources(self):
+        """恢复被释放的资源，页面不可见时等到显示再恢复"""
+        if self.isVisible():
+            self._ensureResources()
+
+    def _ensureResources(self):
+        """按需重建图片和任务卡片"""
+        if not self._resourcesReleased:
+            return
+
+        self._resourcesReleased = False
+        self._updateImage()
+        self.updateTaskList()
+
+    def _updateImage(self):
+        """根据专注状态显示动画或静态图片，资源已回收时等恢复显示再加载"""
+        if self._resourcesReleased:
+            return
+
+        self._releaseMovie()
+        if self.isFocusing:
+            self.ImageLabel.setMovie(QMovie(gif_path, parent=self))
+            self.ImageLabel.movie().setPaused(self.isBackground)
+        else:
+            self.ImageLabel.setPixmap(QPixmap(jpg_path))
+
+    def _releaseMovie(self):
+        """停止并销毁当前动画"""
+        movie = self.ImageLabel.movie()
+        if movie:
+            movie.stop()
+            QLabel.setMovie(self.ImageLabel, None)
+            movie.deleteLater()
+
+    def showEvent(self, e):
+        self.expandRules()
+        self._ensureResources()
+        super().showEvent(e)
+
+    def changeEvent(self, e):
+        if e.type() == QEvent.Type.LanguageChange:
+            self.retranslateUi()
+        super().changeEvent(e)
+
+    def retranslateUi(self, *args):
+        """切换界面语言
+
+        界面文件中的示例任务卡片已被移除，不能直接调用 Ui_FocusInterface.retranslateUi，
+        这里只重设仍然存在的标签，再恢复运行时生成的文本。
+        """
+        if not hasattr(self, 'taskMenu'):
+            # setupUi 期间
+            super().retranslateUi(*args)
+            return
+
+        self.dailyProgressLabel.setText(self.tr("每日进度"))
+        self.yesterdayLabel.setText(self.tr("昨天"))
+        self.minuteLabel1.setText(self.tr("分钟"))
+        self.targetLabel.setText(self.tr("今日计划"))
+        self.continousComplianceDayLabel.setText(self.tr("连续达标日"))
+        self.dayLabel.setText(self.tr("天"))
+        self.taskLabel.setText(self.tr("任务"))
+        self.focusPeriodLabel.setText(self.tr("专注时段"))
+        self.prepareFocusLabel.setText(self.tr("准备专注"))
+        self.hintLabel.setText(self.tr("我们将在每个会话期间关闭通知和应用警报。对于较长的会话，我们将添加简短的休息时间，以便你可以恢复精力。"))
+        self.skipRelaxCheckBox.setText(self.tr("跳过休息"))
+        self.pinButton.setToolTip(self.tr("迷你计时器"))
+
+        self.updateBreakHint()
+        self.progressRing.setFormat(self.tr("目标 {0} 分钟").format(self.dailyTarget))
+        self.yesterdayTimeLabel.setText(str(self.yesterdayMinutes))
+        self.compianceDayLabel.setText(str(self.continuousDays))
+        self.finishTimeLabel.setText(self.tr("已完成：{0} 分钟").format(self.dailyCompleted))
+        self.startFocusButton.setText(self.tr("结束专注") if self.isFocusing else self.tr("启动专注时段"))
+        self.updateTaskList()
+
+        self.editAction.setText(self.tr("修改"))
+        self.deleteAction.setText(self.tr("删除"))
+        self.reminderAction.setText(self.tr("设置提醒"))
+        self.clearReminderAction.setText(self.tr("取消提醒"))
+        self.stopRepeatAction.setText(self.tr("停止重复"))
+        self.subtaskAction.setText(self.tr("子任务"))
+        self.focusTaskAction.setText(self.tr("专注此任务"))
+        for (action, _), text in zip(self.bulkActions, (self.tr("标记完成"), self.tr("重新打开"), self.tr("修改标签"),
+                                                        self.tr("移到顶部"), self.tr("移到底部"), self.tr("删除"),
+                                                        self.tr("取消选择"))):
+            action.setText(text)
+            action.setToolTip(text)
+        self.helpAction.setText(shortcutLabel(self.tr("帮助"), "Ctrl+H"))
+        self.clearCompletedAction.setText(self.tr("清除已完成任务"))
+        self.clearAllAction.setText(self.tr("清除所有任务"))
+        self.archiveAction.setText(self.tr("已归档任务"))
+        self.tagMatchComboBox.setItemText(0, self.tr("全部匹配"))
+        self.tagMatchComboBox.setItemText(1, self.tr("任一匹配"))
+
+    # ================ 后台模式相关方法 ================
+    def setBackgroundMode(self, background):
+        """切换后台模式：窗口不可见时停止界面刷新，只保留截止定时器"""
+        if background == self.isBackground:
+            return
+
+        self.isBackground = background
+
+        # 暂停/恢复专注动画
+        movie = self.ImageLabel.movie()
+        if movie and self.isFocusing:
+            movie.setPaused(background)
+
+        self._armTimers()
+
+        # 回到前台时立即刷新一次
+        if not background and self.isFocusing:
+            self.updateFocusTime()
+
+    def _armTimers(self):
+        """根据当前状态订阅全局时钟刷新界面，后台时只启动截止定时器"""
+        clockService.unsubscribe(self.tickSubscription)
+        self.tickSubscription = None
+        self.deadlineTimer.stop()
+
+        if self.isFocusing:
+            if not self.isBackground:
+                self.tickSubscription = clockService.subscribe(self.updateFocusTime, clockService.HZ_1)  # 每秒更新一次
+            else:
+                # 下一次段切换的时刻直接从时间线读出
+                self.deadlineTimer.start(max(int(self.remainingSeconds() * 1000), 0))
+
+        self._updateCheckpoint()
+        self.sessionStateChanged.emit()
+
+    # ================ 崩溃恢复相关方法 ================
+    def _updateCheckpoint(self):
+        """状态切换时同步保存检查点，并按需订阅定期保存；专注结束时清除检查点"""
+        if self.isFocusing:
+            self._saveCheckpoint(sync=True)
+            if self.checkpointSubscription is None:
+                self.checkpointSubscription = clockService.subscribe(
+                    self._saveCheckpoint, self.CHECKPOINT_INTERVAL)
+        else:
+            clockService.unsubscribe(self.checkpointSubscription)
+            self.checkpointSubscription = None
+            self.checkpoint.clear()
+
+    def _saveCheckpoint(self, sync=False):
+        """把当前会话写入检查点（只改写映射的内存页，sync 时才落盘）"""
         focusTime = self.timePicker.time
-        minutes = focusTime.minute()
-        if minutes >= 25:
-            breakTime = 5 * 60  # 5分钟休息
+        now = time.time()
+        self.checkpoint.save(SessionSnapshot(
+            startedAt=now - self.focusElapsed(),
+            breakEndAt=now + self.remainingSeconds() if self.isBreaking else 0,
+            savedAt=now,
+            periodSeconds=self.timeline.plan.focusSeconds,
+            plannedSeconds=focusTime.hour() * 3600 + focusTime.minute() * 60 + focusTime.second(),
+            skipBreak=self.skipRelaxCheckBox.isChecked(),
+        ), sync)
+
+    def recoverInterruptedSession(self):
+        """启动时检查上次是否有被中断的专注，询问继续专注还是计入已完成时间"""
+        snapshot = self.checkpoint.load()
+        if snapshot is None or self.isFocusing:
+            return
+
+        # 与正常结束一样只计入专注段，休息段不计
+        timeline = self.currentPlan(snapshot.periodSeconds, snapshot.skipBreak).compile()
+        focused = int(timeline.focusedAt(snapshot.focusedSeconds))
+        interruptedAt = datetime.fromtimestamp(snapshot.savedAt)
+        dialog = MessageBox(
+            self.tr("专注被中断"),
+            self.tr("上次的专注在 {0} 意外中断，已专注 {1}。要继续这次专注，还是把已专注的时间计入今天？").format(
+                f"{interruptedAt:%m-%d %H:%M}", formatTime(focused * 1000)),
+            self.window()
+        )
+        dialog.yesButton.setText(self.tr("继续专注"))
+        dialog.cancelButton.setText(self.tr("计入已完成"))
+
+        if dialog.exec():
+            self.resumeSession(snapshot)
         else:
-            breakTime = 3 * 60  # 3分钟休息
-        
-        # 显示休息提示
-        if self.stateTooltip:
-            self.stateTooltip.close()
-        
-        self.stateTooltip = StateToolTip("休息时间", "站起来活动一下，放松眼睛", self.window())
-        self.stateTooltip.move(self.stateTooltip.getSuitablePos())
-        self.stateTooltip.show()
-        
-        # 设置休息结束时间
-        self.breakEndTime = datetime.now() + timedelta(seconds=breakTime)
-        
-        # 启动休息计时器
-        self.breakTimer.start(1000)  # 每秒更新一次
-    
-    def updateBreakTime(self):
-        """更新休息时间"""
-        remaining = self.breakEndTime - datetime.now()
-        remaining_seconds = int(remaining.total_seconds())
-        
-        if remaining_seconds <= 0:
-            # 休息结束
-            self.breakTimer.stop()
-            
-            # 更新状态提示
-            if self.stateTooltip:
-                self.stateTooltip.close()
-            
-            self.stateTooltip = StateToolTip("专注进行中", "休息结束，继续专注", self.window())
-            self.stateTooltip.move(self.stateTooltip.getSuitablePos())
-            self.stateTooltip.show()
-            
-            # 重新启动专注计时器
-            self.focusTimer.start(1000)
+            # 按本地日期拆分，昨天的部分计入昨天
+            self.checkpoint.clear()
+            perDay, offset = {}, 0
+            for day, seconds in splitByDay(snapshot.startedAt, snapshot.savedAt):
+                perDay[day] = timeline.focusedAt(offset + seconds) - timeline.focusedAt(offset)
+                offset += seconds
+            self.yesterdayMinutes += int(perDay.get(date.today() - timedelta(days=1), 0)) // 60
+            self.yesterdayTimeLabel.setText(str(self.yesterdayMinutes))
+            self.updateProgress(int(perDay.get(date.today(), 0)) // 60)
+
+    def resumeSession(self, snapshot):
+        """从检查点恢复专注，中断期间的时间不计入"""
+        planned = snapshot.plannedSeconds
+        self.timePicker.setTime(QTime(planned // 3600, planned // 60 % 60, planned % 60))
+        self.skipRelaxCheckBox.setChecked(snapshot.skipBreak)
+        # 中断时正在休息的，按时间线直接回到休息段
+        self.startFocus(elapsed=snapshot.focusedSeconds)
+
+    def _onDeadline(self):
+        """后台截止定时器到期：切换到时间线的下一段"""
+        if self.isFocusing:
+            self.updateFocusTime()
+
+    def remainingSeconds(self):
+        """当前专注段或休息的剩余秒数，不在专注时返回 None"""
+        if not self.isFocusing:
+            return None
+
+        return max(self.timeline.ends[self.segmentIndex] - self.focusElapsed(), 0)
+
+    def focusElapsed(self):
+        """本次专注已经过的秒数（不含系统睡眠）"""
+        return timekeeper.activeTime() - self.focusStartActive if self.isFocusing else 0.0
+
+    def _onClockChanged(self, seconds):
+        """系统睡眠或墙上时钟跳变：专注时长不变，重新对齐显示用的开始时间和定时器"""
+        if not self.isFocusing:
+            return
+
+        self.focusStartTime = datetime.now() - timedelta(seconds=self.focusElapsed())
+        self.updateBreakHint()
+        self._armTimers()
+
+    def _showStateTooltip(self, title, content):
+        """显示状态提示，段切换时只替换文本，不再每次新建提示"""
+        tooltip = self.stateTooltip
+        if tooltip is None:
+            tooltip = self.stateTooltip = StateToolTip(title, content, self.window())
         else:
-            # 更新休息倒计时
-            minutes, seconds = divmod(remaining_seconds, 60)
-            self.stateTooltip.setContent(f"剩余休息时间: {minutes:02d}:{seconds:02d}")
-    
+            tooltip.hide()
+            tooltip.setTitle(title)
+            tooltip.setContent(content)
+
+        tooltip.rotateTimer.start()
+        tooltip.move(tooltip.getSuitablePos())
+        tooltip.show()
+        tooltip.raise_()
+
+    def _closeStateTooltip(self):
+        """隐藏状态提示并停止旋转动画，留到下次专注复用"""
+        if self.stateTooltip:
+            self.stateTooltip.hide()
+            self.stateTooltip.rotateTimer.stop()
+
     def confirmEndFocus(self):
         """确认结束专注"""
         dialog = MessageBox(
-            "结束专注",
-            "确定要结束当前的专注吗？",
+            self.tr("结束专注"),
+            self.tr("确定要结束当前的专注吗？"),
             self.window()
         )
-        dialog.yesButton.setText("是，结束专注")
-        dialog.cancelButton.setText("不，继续专注")
+        dialog.yesButton.setText(self.tr("是，结束专注"))
+        dialog.cancelButton.setText(self.tr("不，继续专注"))
 
         if dialog.exec():
             self.endFocus()
@@ -338,44 +1069,50 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         if not self.isFocusing or not self.focusStartTime:
             return
         
-        # 停止计时器
-        self.focusTimer.stop()
-        self.breakTimer.stop()
-        
-        # 计算专注时间
-        elapsed = datetime.now() - self.focusStartTime
-        elapsed_seconds = int(elapsed.total_seconds())
-        elapsed_minutes = elapsed_seconds // 60
+        # 计算专注时间（休息段不计入，与任务累计一致），跨零点时已计入前一天的部分不再重复计入
+        elapsed_seconds = int(self.focusElapsed())
+        focused_seconds = int(self.timeline.focusedAt(elapsed_seconds))
+        focused_minutes = focused_seconds // 60 - self.creditedSeconds // 60
+        task = self.focusTask
+        self._creditFocusTask(elapsed_seconds)
+        self.focusTask = None
         
-        # 更新UI
+        # 停止计时器
         self.isFocusing = False
-        self.startFocusButton.setText("启动专注时段")
+        self.isBreaking = False
+        self.segmentIndex = -1
+        self._armTimers()
+
+        # 更新UI
+        self.startFocusButton.setText(self.tr("启动专注时段"))
         self.startFocusButton.setIcon(FluentIcon.POWER_BUTTON)
-        self.ImageLabel.movie().stop()
-        self.ImageLabel.setPixmap(QPixmap(jpg_path))
+        self._updateImage()
         
-        # 启用控件
+        # 启用控件，按专注期间可能改过的设置重新编译时间线
         self.timePicker.setEnabled(True)
         self.skipRelaxCheckBox.setEnabled(True)
+        self.timelineBar.setElapsed(None)
+        self.compileTimeline()
         
         # 关闭状态提示
-        if self.stateTooltip:
-            self.stateTooltip.close()
-            self.stateTooltip = None
+        self._closeStateTooltip()
         
         # 更新进度
-        self.updateProgress(elapsed_minutes)
+        self.updateProgress(focused_minutes)
+        if task is not None:
+            self.updateTaskList()
         
         # 显示完成提示
-        hours, remainder = divmod(elapsed_seconds, 3600)
+        hours, remainder = divmod(focused_seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
         time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        content = self.tr("本次专注时长: {0}").format(time_str)
+        if task is not None:
+            content += "\n" + self.tr("{0} 累计专注 {1}").format(task.name, self._taskTimeText(task))
         
-        InfoBar.success(
-            title="专注完成",
-            content=f"本次专注时长: {time_str}",
-            orient=Qt.Orientation.Horizontal,
-            isClosable=True,
+        notificationService.success(
+            title=self.tr("专注完成"),
+            content=content,
             position=InfoBarPosition.TOP,
             duration=5000,
             parent=self
@@ -393,46 +1130,172 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         self.progressRing.setValue(min(self.dailyCompleted, self.dailyTarget))
         
         # 更新完成时间文本
-        self.finishTimeLabel.setText(f"已完成：{self.dailyCompleted} 分钟")
+        self.finishTimeLabel.setText(self.tr("已完成：{0} 分钟").format(self.dailyCompleted))
+        self.progressChanged.emit()
         
         # 检查是否达标
         if self.dailyCompleted >= self.dailyTarget and self.dailyCompleted - minutes < self.dailyTarget:
-            InfoBar.success(
-                title="目标达成",
-                content=f"恭喜你完成了今日 {self.dailyTarget} 分钟的专注目标！",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
+            notificationService.success(
+                title=self.tr("目标达成"),
+                content=self.tr("恭喜你完成了今日 {0} 分钟的专注目标！").format(self.dailyTarget),
                 position=InfoBarPosition.TOP,
                 duration=5000,
                 parent=self
             )
     
+    def rolloverDay(self, today):
+        """本地日期变化：结算前一天的进度，开始新的一天
+
+        正在专注时，零点之前的专注段计入前一天，之后的部分留到结束时计入今天；休息段不计入。
+        """
+        if today == self.progressDate:
+            return
+
+        previous = self.dailyCompleted
+        if self.isFocusing:
+            elapsed = int(self.focusElapsed())
+            sinceMidnight = time.time() - datetime.combine(today, datetime.min.time()).timestamp()
+            beforeMidnight = max(elapsed - int(sinceMidnight), 0)
+            credited = max(int(self.timeline.focusedAt(beforeMidnight)), self.creditedSeconds)
+            previous += credited // 60 - self.creditedSeconds // 60
+            self.creditedSeconds = credited
+
+        # 只隔一天时前一天就是昨天，跨多天（例如长时间睡眠）时中间的日子没有专注
+        if (today - self.progressDate).days == 1:
+            self.yesterdayMinutes = previous
+            self.continuousDays = self.continuousDays + 1 if previous >= self.dailyTarget else 0
+        else:
+            self.yesterdayMinutes = 0
+            self.continuousDays = 0
+
+        self.progressDate = today
+        self.dailyCompleted = 0
+        self.progressRing.setValue(0)
+        self.yesterdayTimeLabel.setText(str(self.yesterdayMinutes))
+        self.compianceDayLabel.setText(str(self.continuousDays))
+        self.finishTimeLabel.setText(self.tr("已完成：{0} 分钟").format(self.dailyCompleted))
+        self.progressChanged.emit()
+
+        # 展开新一天的重复任务，归档完成较久的任务
+        self.expandRules(today)
+        self.archiveCompletedTasks()
+
     def editDailyTarget(self):
         """编辑每日目标"""
         dialog = EditDailyTargetMB(
-            "设置每日目标",
-            f"当前目标为 {self.dailyTarget} 分钟，请输入新的每日专注目标分钟数",
+            self.tr("设置每日目标"),
+            self.tr("当前目标为 {0} 分钟，请输入新的每日专注目标分钟数").format(self.dailyTarget),
             self.window()
         )
         
         if dialog.exec():
             new_target = int(dialog.LineEdit.text())
             self.dailyTarget = new_target
-            self.progressRing.setFormat(f"目标 {new_target} 分钟")
+            self.progressRing.setFormat(self.tr("目标 {0} 分钟").format(new_target))
             self.progressRing.setMaximum(self.dailyTarget)
             self.progressRing.setValue(min(self.dailyCompleted, self.dailyTarget))
+            self.progressChanged.emit()
             
-            InfoBar.success(
-                title="目标已更新",
-                content=f"每日目标已设置为 {self.dailyTarget} 分钟",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
+            notificationService.success(
+                title=self.tr("目标已更新"),
+                content=self.tr("每日目标已设置为 {0} 分钟").format(self.dailyTarget),
                 position=InfoBarPosition.TOP_RIGHT,
                 duration=3000,
                 parent=self
             )
 
     # ================ 任务相关方法 ================
+    def _onTaskCardPressed(self, event, card):
+        """左键按下时先记录位置，松开时才算点击；右键直接弹出菜单"""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._dragStart = (card, event.position().toPoint())
+        else:
+            self.onTaskClicked(event, card.taskIndex)
+
+    def _onTaskCardMoved(self, event, card):
+        """按住左键移动超过拖动距离时开始拖动卡片"""
+        if not self._dragStart or self._dragStart[0] is not card:
+            return
+        distance = (event.position().toPoint() - self._dragStart[1]).manhattanLength()
+        if distance < QApplication.startDragDistance():
+            return
+
+        self._dragStart = None
+        task = self.tasks[card.taskIndex]
+        mime = QMimeData()
+        mime.setData(self.TASK_MIME_TYPE, str(task.id).encode())
+        drag = QDrag(card)
+        drag.setMimeData(mime)
+        drag.setPixmap(card.grab())
+        drag.setHotSpot(event.position().toPoint())
+        drag.exec(Qt.DropAction.MoveAction)
+
+    def _onTaskCardReleased(self, event, card):
+        """没有拖动时松开左键视为点击"""
+        if self._dragStart and self._dragStart[0] is card and event.button() == Qt.MouseButton.LeftButton:
+            self._dragStart = None
+            modifiers = event.modifiers()
+            if modifiers & Qt.KeyboardModifier.ShiftModifier:
+                self.selectTaskRange(card.taskIndex)
+            elif modifiers & Qt.KeyboardModifier.ControlModifier or self.selectedTaskIds:
+                # 已经在多选时，单击也只是切换选中
+                self.toggleTaskSelected(card.taskIndex)
+            else:
+                self.onTaskClicked(event, card.taskIndex)
+
+    def eventFilter(self, obj, e):
+        """任务区域的拖放事件"""
+        if obj is self.scrollAreaWidgetContents:
+            if e.type() in (QEvent.Type.DragEnter, QEvent.Type.DragMove):
+                if e.mimeData().hasFormat(self.TASK_MIME_TYPE):
+                    e.acceptProposedAction()
+                    self._showDropIndicator(self._dropSlot(e.position().y()))
+                    return True
+            elif e.type() == QEvent.Type.DragLeave:
+                self._dropIndicator.hide()
+            elif e.type() == QEvent.Type.Drop and e.mimeData().hasFormat(self.TASK_MIME_TYPE):
+                self._dropIndicator.hide()
+                taskId = int(bytes(e.mimeData().data(self.TASK_MIME_TYPE)).decode())
+                self._dropTask(taskId, self._dropSlot(e.position().y()))
+                e.acceptProposedAction()
+                return True
+        return super().eventFilter(obj, e)
+
+    def _dropSlot(self, y):
+        """放下位置对应的插入位置（第几张卡片之前）"""
+        for slot, card in enumerate(self._taskCards):
+            if y < card.geometry().center().y():
+                return slot
+        return len(self._taskCards)
+
+    def _showDropIndicator(self, slot):
+        """在插入位置的两张卡片之间显示指示线"""
+        cards = self._taskCards
+        if not cards:
+            return
+        spacing = self.scrollAreaWidgetContents.layout().spacing()
+        if slot < len(cards):
+            y = cards[slot].geometry().top() - max(spacing, 2) // 2 - 1
+        else:
+            y = cards[-1].geometry().bottom() + max(spacing, 2) // 2
+        geometry = cards[0].geometry()
+        self._dropIndicator.setGeometry(geometry.left(), max(y, 0), geometry.width(), 2)
+        self._dropIndicator.show()
+        self._dropIndicator.raise_()
+
+    def _dropTask(self, taskId, slot):
+        """把任务放到第 slot 张卡片之前"""
+        ordered = [task for _, task in self.visibleTasks()]
+        task = next((t for t in ordered if t.id == taskId), None)
+        if task is None:
+            return
+
+        before = ordered[slot - 1] if slot > 0 else None
+        after = ordered[slot] if slot < len(ordered) else None
+        if task in (before, after):
+            return  # 放回原位
+        self.moveTask(task, before, after)
+
     def onTaskClicked(self, event, index):
         """任务被点击时触发的槽函数"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -444,7 +1307,7 @@ class FocusInterface(QWidget, Ui_FocusInterface):
             """切换任务状态"""
             if 0 <= index < len(self.tasks):
                 task = self.tasks[index]
-                task.is_completed = not task.is_completed
+                self._setTaskCompleted(task, not task.is_completed)
                 self.updateTaskList()
                 
                 status = "已完成" if task.is_completed else "未完成"
@@ -454,67 +1317,52 @@ class FocusInterface(QWidget, Ui_FocusInterface):
     def showTaskStatusMessage(self, status, task):
         """显示任务状态消息框"""
         if status == "已完成":
-            InfoBar.success(
-                title=f"任务已完成",
+            notificationService.success(
+                title=self.tr("任务已完成"),
                 content=f"{task.name}",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
                 position=InfoBarPosition.TOP_RIGHT,
                 duration=2000,
-                parent=self
+                parent=self,
+                key="taskStatus",
+                summary=self.tr("已更新 {count} 个任务状态")
             )
         else:
-            InfoBar.warning(
-                title=f"任务未完成", 
+            notificationService.warning(
+                title=self.tr("任务未完成"), 
                 content=f"{task.name}",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
                 position=InfoBarPosition.TOP_RIGHT,
                 duration=2000,
-                parent=self
+                parent=self,
+                key="taskStatus",
+                summary=self.tr("已更新 {count} 个任务状态")
 
             )
 
     def showRoundTaskMenu(self, index):
         """显示任务卡片右键菜单"""
         if 0 <= index < len(self.tasks):
-            menu = RoundMenu()
-            
-            editAction = Action(FluentIcon.EDIT, "修改")
-            editAction.triggered.connect(lambda: self.editTask(index))
-            
-            deleteAction = Action(FluentIcon.DELETE, "删除")
-            deleteAction.triggered.connect(lambda: self.deleteTask(index))
+            # 复用预先构建的菜单，只重新绑定目标任务索引
+            self._menuTaskIndex = index
 
-            helpShortcut = QShortcut(QKeySequence("Ctrl+H"), self)
-            helpAction = Action(FluentIcon.HELP, "帮助", self, shortcut="Ctrl+H")
-            helpAction.triggered.connect(lambda: showHelpMessageBox(self))
-            helpShortcut.activated.connect(lambda: helpAction.triggered.emit())
-            
-            menu.addAction(editAction)
-            menu.addAction(deleteAction)
-            menu.addSeparator()
-            menu.addAction(helpAction)
-            
-            # 显示菜单在右击位置  
-            menu.exec(QCursor.pos())            
+            # 显示菜单在右击位置
+            self.roundTaskMenu.exec(QCursor.pos())
 
     def editTask(self, index):
         """编辑任务"""
         if 0 <= index < len(self.tasks):
             task = self.tasks[index]
-            dialog = EditTaskMessageBox(task.name, self.window())
+            dialog = EditTaskMessageBox(task.name, task.tags, task.estimateMinutes, parent=self.window())
             if dialog.exec():
-                new_name = dialog.LineEdit.text()
+                new_name = dialog.LineEdit.text() or task.name
                 if new_name and new_name.strip():
                     task.name = new_name.strip()  # 直接修改任务名称
+                    self.setTaskTags(task, dialog.tags())
+                    task.estimateMinutes = dialog.estimateSpinBox.value()
                     self.updateTaskList()  # 更新任务列表显示
                     
-                    InfoBar.success(
-                        title="修改成功",
-                        content=f"任务已修改为：{new_name.strip()}",
-                        orient=Qt.Orientation.Horizontal,
-                        isClosable=True,
+                    notificationService.success(
+                        title=self.tr("修改成功"),
+                        content=self.tr("任务已修改为：{0}").format(task.name),
                         position=InfoBarPosition.TOP_RIGHT,
                         duration=2000,
                         parent=self
@@ -524,17 +1372,17 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         """删除任务"""
         if 0 <= index < len(self.tasks):
             task_name = self.tasks[index].name
-            del self.tasks[index]
+            self._forgetTask(self.tasks.pop(index))
             self.updateTaskList()
             
-            InfoBar.success(
-                title="删除成功",
-                content=f"已删除任务：{task_name}",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
+            notificationService.success(
+                title=self.tr("删除成功"),
+                content=self.tr("已删除任务：{0}").format(task_name),
                 position=InfoBarPosition.TOP_RIGHT,
                 duration=3000,
-                parent=self
+                parent=self,
+                key="taskDelete",
+                summary=self.tr("已删除 {count} 个任务")
             )
 
     def showAddTaskDialog(self):
@@ -542,66 +1390,574 @@ class FocusInterface(QWidget, Ui_FocusInterface):
         messagebox = AddTaskMessageBox(self.window())
         if messagebox.exec():
             task_name = messagebox.LineEdit.text()
-            if self.addTask(task_name):
-                InfoBar.success(
-                title="任务已添加",
-                content=f"已添加任务：{task_name}",                
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
+            rule = messagebox.rule()
+            if rule:
+                self.addRecurringTask(rule)
+                notificationService.success(
+                    title=self.tr("重复任务已添加"),
+                    content=f"{rule.describe()}：{rule.name}",
+                    position=InfoBarPosition.TOP_RIGHT,
+                    duration=3000,
+                    parent=self
+                )
+            elif self.addTask(task_name, messagebox.tags()):
+                notificationService.success(
+                title=self.tr("任务已添加"),
+                content=self.tr("已添加任务：{0}").format(task_name),                
                 position=InfoBarPosition.TOP_RIGHT,
                 duration=3000,
-                parent=self
+                parent=self,
+                key="taskAdd",
+                summary=self.tr("已添加 {count} 个任务")
                 )
 
-    def addTask(self, task_name):
+    def addTask(self, task_name, tags=()):
         """添加任务"""
         if task_name and task_name.strip():
             task = Task(task_name.strip())
-            self.tasks.append(task)
+            task.tags = set(tags)
+            self._appendTask(task)
             self.updateTaskList()
             return True
         return False
+
+    def _appendTask(self, task):
+        """新任务排在列表最前面"""
+        first = min((t.order for t in self.tasks), default=None)
+        task.order = keyBetween(None, first)
+        self.tasks.append(task)
+        self.tagIndex.add(task.id, task.tags)
+        if len(task.order) > self.ORDER_KEY_LIMIT:
+            self._scheduleRebalance()
+
+    # ================ 任务排序相关方法 ================
+    def orderedTasks(self):
+        """按显示顺序排列的 (索引, 任务)"""
+        return sorted(enumerate(self.tasks), key=lambda item: item[1].order)
+
+    def moveTask(self, task, before=None, after=None):
+        """把任务移动到 before 与 after 之间（按显示顺序），只改写被移动任务的排序键"""
+        task.order = keyBetween(before.order if before else None, after.order if after else None)
+        if len(task.order) > self.ORDER_KEY_LIMIT:
+            self._scheduleRebalance()
+        self.updateTaskList()
+
+    def _scheduleRebalance(self):
+        """排序键过长时安排一次重排，在事件循环空闲时执行"""
+        if not self._rebalancePending:
+            self._rebalancePending = True
+            QTimer.singleShot(0, self.rebalanceOrder)
+
+    def rebalanceOrder(self):
+        """按当前顺序重新分配均匀分布的短排序键"""
+        self._rebalancePending = False
+        ordered = [task for _, task in self.orderedTasks()]
+        for task, key in zip(ordered, evenKeys(len(ordered))):
+            task.order = key
+
+    # ================ 多选与批量操作相关方法 ================
+    def initSelectionBar(self):
+        """在任务列表上方添加批量操作栏，有选中的任务时显示"""
+        self.selectionBar = QWidget(self.taskCard)
+        layout = QHBoxLayout(self.selectionBar)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.selectionLabel = BodyLabel(self.selectionBar)
+        self.selectionCommandBar = CommandBar(self.selectionBar)
+        self.selectionCommandBar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
+
+        self.bulkActions = [
+            (Action(FluentIcon.ACCEPT, self.tr("标记完成"), self), lambda: self.setSelectedCompleted(True)),
+            (Action(FluentIcon.RETURN, self.tr("重新打开"), self), lambda: self.setSelectedCompleted(False)),
+            (Action(FluentIcon.TAG, self.tr("修改标签"), self), self.retagSelectedTasks),
+            (Action(FluentIcon.UP, self.tr("移到顶部"), self), lambda: self.moveSelectedTasks(True)),
+            (Action(FluentIcon.DOWN, self.tr("移到底部"), self), lambda: self.moveSelectedTasks(False)),
+            (Action(FluentIcon.DELETE, self.tr("删除"), self), self.deleteSelectedTasks),
+            (Action(FluentIcon.CLOSE, self.tr("取消选择"), self), self.clearTaskSelection),
+        ]
+        for action, slot in self.bulkActions:
+            action.triggered.connect(slot)
+            action.setToolTip(action.text())
+            self.selectionCommandBar.addAction(action)
+
+        layout.addWidget(self.selectionLabel)
+        layout.addWidget(self.selectionCommandBar, 1)
+        self.verticalLayout_7.insertWidget(self.verticalLayout_7.indexOf(self.scrollArea), self.selectionBar)
+        self.selectionBar.hide()
+
+        ActionRegistry.of(self).shortcut("Ctrl+A", self.selectAllTasks)
+
+    def _updateSelectionBar(self):
+        count = len(self.selectedTaskIds)
+        self.selectionBar.setVisible(bool(count))
+        if count:
+            self.selectionLabel.setText(self.tr("已选择 {0} 项").format(count))
+
+    @contextmanager
+    def taskTransaction(self):
+        """批量修改任务：期间的 updateTaskList 都推迟到最外层结束时执行一次，
+        卡片只重绘一次，tasksChanged 也只发出一次"""
+        self._transactionDepth += 1
+        try:
+            yield
+        finally:
+            self._transactionDepth -= 1
+            if not self._transactionDepth and self._taskListDirty:
+                self._taskListDirty = False
+                self.updateTaskList()
+
+    def selectedTasks(self):
+        """选中的任务，按显示顺序"""
+        return [task for _, task in self.orderedTasks() if task.id in self.selectedTaskIds]
+
+    def toggleTaskSelected(self, index):
+        """Ctrl+单击：切换任务的选中状态"""
+        if 0 <= index < len(self.tasks):
+            task = self.tasks[index]
+            self.selectedTaskIds ^= {task.id}
+            self._selectionAnchor = task.id
+            self.updateTaskList()
+
+    def selectTaskRange(self, index):
+        """Shift+单击：选中从上次点击的任务到当前任务之间的所有显示中的任务"""
+        if not 0 <= index < len(self.tasks):
+            return
+
+        visible = [task for _, task in self.visibleTasks()]
+        target = self.tasks[index]
+        anchor = next((i for i, task in enumerate(visible) if task.id == self._selectionAnchor), None)
+        end = visible.index(target)
+        start = end if anchor is None else anchor
+        self.selectedTaskIds |= {task.id for task in visible[min(start, end):max(start, end) + 1]}
+        if anchor is None:
+            self._selectionAnchor = target.id
+        self.updateTaskList()
+
+    def selectAllTasks(self):
+        """Ctrl+A：选中所有显示中的任务"""
+        if self.isVisible() and self.tasks:
+            self.selectedTaskIds = {task.id for _, task in self.visibleTasks()}
+            self.updateTaskList()
+
+    def revealTask(self, taskId):
+        """选中任务并滚动到它的卡片，任务被标签筛选隐藏时先取消筛选"""
+        task = next((task for task in self.tasks if task.id == taskId), None)
+        if task is None:
+            return
+
+        if self.tagFilter and task.id not in self.tagIndex.match(self.tagFilter, self.tagMatchAll):
+            self.tagFilter.clear()
+        self.selectedTaskIds = {task.id}
+        self._selectionAnchor = task.id
+        self.updateTaskList()
+
+        # 卡片可能没有生成（折叠的子任务、卡片已随窗口隐藏回收），此时只保留选中状态
+        card = next((card for card in self._taskCards if self.tasks[card.taskIndex] is task), None)
+        if card is None:
+            return
+
+        # 等布局更新后再滚动
+        QTimer.singleShot(0, lambda: self.scrollArea.ensureWidgetVisible(card))
+
+    def clearTaskSelection(self):
+        self.selectedTaskIds.clear()
+        self._selectionAnchor = None
+        self.updateTaskList()
+
+    def _setTaskCompleted(self, task, completed):
+        """修改完成状态并记录完成时间"""
+        task.is_completed = completed
+        task.completed_time = datetime.now() if completed else None
+        self._scheduleReminder(task)
+
+    def removeTasks(self, tasks):
+        """一次移除多个任务，任务列表只重建一次"""
+        ids = {task.id for task in tasks}
+        if not ids:
+            return
+        for task in tasks:
+            self._forgetTask(task)
+        self.tasks = [task for task in self.tasks if task.id not in ids]
+        self.updateTaskList()
+
+    def setSelectedCompleted(self, completed):
+        """批量完成或重新打开"""
+        tasks = [task for task in self.selectedTasks() if task.is_completed != completed]
+        with self.taskTransaction():
+            for task in tasks:
+                self._setTaskCompleted(task, completed)
+            self.clearTaskSelection()
+
+        notificationService.success(
+            title=self.tr("批量操作完成"),
+            content=(self.tr("已完成 {0} 个任务") if completed else self.tr("已重新打开 {0} 个任务")).format(len(tasks)),
+            position=InfoBarPosition.TOP_RIGHT,
+            duration=2000,
+            parent=self
+        )
+
+    def deleteSelectedTasks(self):
+        """批量删除"""
+        tasks = self.selectedTasks()
+        with self.taskTransaction():
+            self.removeTasks(tasks)
+            self.clearTaskSelection()
+
+        notificationService.success(
+            title=self.tr("删除成功"),
+            content=self.tr("已删除 {0} 个任务").format(len(tasks)),
+            position=InfoBarPosition.TOP_RIGHT,
+            duration=3000,
+            parent=self
+        )
+
+    def retagSelectedTasks(self):
+        """批量添加或移除标签"""
+        tasks = self.selectedTasks()
+        dialog = BulkTagMessageBox(len(tasks), self.window())
+        if not dialog.exec():
+            return
+
+        added, removed = dialog.addedTags(), dialog.removedTags()
+        with self.taskTransaction():
+            for task in tasks:
+                self.setTaskTags(task, (task.tags | added) - removed)
+            self.clearTaskSelection()
+
+    def moveSelectedTasks(self, toTop):
+        """把选中的任务保持相对顺序移到列表顶部或底部，只改写被移动任务的排序键"""
+        tasks = self.selectedTasks()
+        rest = [task for _, task in self.orderedTasks() if task.id not in self.selectedTaskIds]
+        if toTop:
+            keys = keysBetween(None, rest[0].order if rest else None, len(tasks))
+        else:
+            keys = keysBetween(rest[-1].order if rest else None, None, len(tasks))
+
+        with self.taskTransaction():
+            for task, key in zip(tasks, keys):
+                task.order = key
+            if keys and max(map(len, keys)) > self.ORDER_KEY_LIMIT:
+                self._scheduleRebalance()
+            self.clearTaskSelection()
+
+    # ================ 任务标签相关方法 ================
+    def initTagFilterBar(self):
+        """在任务列表上方添加标签筛选栏，没有标签时隐藏"""
+        self.tagFilterBar = QWidget(self.taskCard)
+        layout = QHBoxLayout(self.tagFilterBar)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.tagPillContainer = QWidget(self.tagFilterBar)
+        self.tagPillLayout = FlowLayout(self.tagPillContainer)
+        self.tagPillLayout.setContentsMargins(0, 0, 0, 0)
+        self.tagPillLayout.setHorizontalSpacing(6)
+        self.tagPillLayout.setVerticalSpacing(6)
+        self._tagPills = {}  # 标签 -> 筛选按钮
+
+        self.tagMatchComboBox = ComboBox(self.tagFilterBar)
+        self.tagMatchComboBox.addItems([self.tr("全部匹配"), self.tr("任一匹配")])
+        self.tagMatchComboBox.currentIndexChanged.connect(self.setTagMatchAll)
+
+        layout.addWidget(self.tagPillContainer, 1)
+        layout.addWidget(self.tagMatchComboBox, 0, Qt.AlignmentFlag.AlignTop)
+        self.verticalLayout_7.insertWidget(self.verticalLayout_7.indexOf(self.scrollArea), self.tagFilterBar)
+        self.tagFilterBar.hide()
+
+    def _updateTagFilterBar(self):
+        """按标签索引同步筛选按钮，只增删有变化的按钮"""
+        tags = self.tagIndex.tags()
+        names = {tag for tag, _ in tags}
+        self.tagFilter &= names  # 已经没有任务的标签不再参与筛选
+
+        for tag in set(self._tagPills) - names:
+            pill = self._tagPills.pop(tag)
+            self.tagPillLayout.removeWidget(pill)
+            pill.deleteLater()
+
+        added = names - set(self._tagPills)
+        for tag in added:
+            pill = PillPushButton(self.tagPillContainer)
+            pill.setCheckable(True)
+            pill.toggled.connect(lambda checked, t=tag: self.setTagFiltered(t, checked))
+            self._tagPills[tag] = pill
+
+        if added:
+            # 流式布局不支持插入，有新标签时按名称顺序重新排列
+            for pill in self._tagPills.values():
+                self.tagPillLayout.removeWidget(pill)
+            for tag, _ in tags:
+                self.tagPillLayout.addWidget(self._tagPills[tag])
+                self._tagPills[tag].show()
+
+        for tag, count in tags:
+            pill = self._tagPills[tag]
+            pill.setText(f"#{tag} {count}")
+            if pill.isChecked() != (tag in self.tagFilter):
+                pill.blockSignals(True)
+                pill.setChecked(tag in self.tagFilter)
+                pill.blockSignals(False)
+
+        self.tagFilterBar.setVisible(bool(tags))
+
+    def setTaskTags(self, task, tags):
+        """修改任务标签，同时增量更新标签索引"""
+        tags = set(tags)
+        self.tagIndex.update(task.id, task.tags, tags)
+        task.tags = tags
+
+    def setTagFiltered(self, tag, filtered):
+        """选中或取消筛选标签"""
+        if filtered:
+            self.tagFilter.add(tag)
+        else:
+            self.tagFilter.discard(tag)
+        self.updateTaskList()
+
+    def setTagMatchAll(self, index):
+        """切换全部匹配（0）或任一匹配（1）"""
+        self.tagMatchAll = index == 0
+        if self.tagFilter:
+            self.updateTaskList()
+
+    def visibleTasks(self):
+        """筛选后按显示顺序排列的 (索引, 任务)"""
+        ordered = self.orderedTasks()
+        if not self.tagFilter:
+            return ordered
+
+        matched = self.tagIndex.match(self.tagFilter, self.tagMatchAll)
+        return [(i, task) for i, task in ordered if task.id in matched]
     
+    # ================ 任务计时相关方法 ================
+    def focusOnTask(self, index):
+        """把专注绑定到任务：未在专注时开始专注，专注中则把之后的时间计入该任务"""
+        if not 0 <= index < len(self.tasks):
+            return
+
+        task = self.tasks[index]
+        if self.isFocusing:
+            if task is self.focusTask:
+                return
+            self._creditFocusTask(int(self.focusElapsed()))
+            self.focusTask = task
+            self.updateTaskList()
+            notificationService.info(
+                title=self.tr("已切换专注任务"),
+                content=task.name,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=2000,
+                parent=self
+            )
+        else:
+            self.focusTask = task
+            self.startFocus()
+            if not self.isFocusing:
+                self.focusTask = None
+            self.updateTaskList()
+
+    def _creditFocusTask(self, elapsed):
+        """把本次专注从上次结算到 elapsed 秒之间的专注时间累加到绑定的任务，休息段不计入"""
+        task = self.focusTask
+        if task is not None:
+            focused = self.timeline.focusedAt(elapsed) - self.timeline.focusedAt(self.focusTaskSince)
+            task.focusedSeconds += max(int(focused), 0)
+        self.focusTaskSince = elapsed
+
+    def _taskTimeText(self, task):
+        """任务的实际与预计专注时长"""
+        actual = task.focusedSeconds // 60
+        if task.estimateMinutes:
+            return self.tr("{0}/{1} 分钟").format(actual, task.estimateMinutes)
+        return self.tr("{0} 分钟").format(actual)
+
+    def showSubtaskDialog(self, index):
+        """显示子任务对话框，关闭后刷新卡片上的完成统计"""
+        if 0 <= index < len(self.tasks):
+            SubtaskMessageBox(self.tasks[index], self.window()).exec()
+            self.updateTaskList()
+
+    def showReminderDialog(self, index):
+        """显示设置提醒对话框"""
+        if 0 <= index < len(self.tasks):
+            task = self.tasks[index]
+            dialog = ReminderMessageBox(task, self.window())
+            if dialog.exec():
+                self.setTaskReminder(task, dialog.dueTime(), dialog.remindBefore(), dialog.repeat())
+
+                notificationService.success(
+                    title=self.tr("提醒已设置"),
+                    content=f"{task.name}：{task.remindTime():%m-%d %H:%M}",
+                    position=InfoBarPosition.TOP_RIGHT,
+                    duration=2000,
+                    parent=self
+                )
+
+    def setTaskReminder(self, task, due_time, remind_before=timedelta(0), repeat=None):
+        """设置任务截止时间与提醒"""
+        task.due_time = due_time
+        task.remind_before = remind_before
+        task.repeat = repeat
+        self._scheduleReminder(task)
+        self.updateTaskList()
+
+    def clearTaskReminder(self, index):
+        """取消任务提醒"""
+        if 0 <= index < len(self.tasks):
+            task = self.tasks[index]
+            task.due_time = None
+            task.repeat = None
+            reminderScheduler.cancel(task.id)
+            self.updateTaskList()
+
+    def _scheduleReminder(self, task):
+        """按任务状态登记或取消提醒，已完成或没有截止时间的任务不提醒"""
+        remindTime = task.remindTime()
+        if task.is_completed or remindTime is None:
+            reminderScheduler.cancel(task.id)
+        elif task.repeat or remindTime > datetime.now():
+            reminderScheduler.schedule(task.id, remindTime, task.repeat, task)
+        else:
+            reminderScheduler.cancel(task.id)
+
+    def _onReminderDue(self, reminder, occurrence, missed):
+        """任务提醒到期"""
+        task = reminder.payload
+        if task not in self.tasks:
+            return
+
+        due = occurrence + task.remind_before
+        if task.repeat:
+            # 重复任务的截止时间跟随下一次提醒
+            task.due_time = reminder.when + task.remind_before
+            self.updateTaskList()
+
+        notificationService.warning(
+            title=self.tr("错过的提醒") if missed else self.tr("任务提醒"),
+            content=self.tr("{0}（截止 {1}）").format(task.name, f"{due:%m-%d %H:%M}"),
+            position=InfoBarPosition.TOP_RIGHT,
+            duration=10000,
+            parent=self,
+            key="taskReminder",
+            summary=self.tr("{count} 个任务提醒")
+        )
+
+    def addRecurringTask(self, rule):
+        """添加重复任务规则，并展开今天的任务"""
+        self.rules[rule.id] = rule
+        self.expandRules(force=True)
+
+    def stopRecurringTask(self, index):
+        """停止重复，保留今天的任务作为普通任务"""
+        if 0 <= index < len(self.tasks):
+            task = self.tasks[index]
+            rule = self.rules.pop(task.rule_id, None)
+            if rule is None:
+                return
+
+            for t in self.tasks:
+                if t.rule_id == rule.id:
+                    t.rule_id = None
+            self.updateTaskList()
+
+            notificationService.info(
+                title=self.tr("已停止重复"),
+                content=rule.name,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=2000,
+                parent=self
+            )
+
+    def expandRules(self, day=None, force=False):
+        """把重复规则展开为指定日期（默认今天）的任务
+
+        只生成显示日期当天的任务，前一天未清理的重复任务在换日时移除。
+        """
+        day = day or date.today()
+        if day == self.expandedDate and not force:
+            return
+        self.expandedDate = day
+
+        # 移除其他日期展开出来的任务
+        stale = [t for t in self.tasks if t.rule_id is not None and t.occurrence_date != day]
+        for task in stale:
+            self._forgetTask(task, skipOccurrence=False)
+        self.tasks = [t for t in self.tasks if t.rule_id is None or t.occurrence_date == day]
+
+        existing = {t.rule_id for t in self.tasks if t.rule_id is not None}
+        for rule in self.rules.values():
+            if rule.id not in existing and rule.occursOn(day):
+                task = Task(rule.name)
+                task.rule_id = rule.id
+                task.occurrence_date = day
+                task.tags = set(rule.tags)
+                self._appendTask(task)
+
+        self.updateTaskList()
+
+    def _ruleToolTip(self, rule, day):
+        """重复任务卡片的提示：显示日期之后一周内的日期，没有时显示下一次日期"""
+        start = (day or date.today()) + timedelta(days=1)
+        days = list(rule.occurrences(start, start + timedelta(days=self.RULE_PREVIEW_DAYS - 1)))
+        if not days:
+            nextDay = rule.nextOccurrence(start)
+            days = [nextDay] if nextDay else []
+        if not days:
+            return self.tr("没有后续日期")
+        return self.tr("接下来：{0}").format(", ".join(f"{d:%m-%d}" for d in days))
+
+    def _forgetTask(self, task, skipOccurrence=True):
+        """任务被移除：取消提醒、解除专注绑定
+
+        skipOccurrence 为真（用户删除）时，重复任务记住被删除的日期，避免再次展开；
+        换日时清理前一天展开的任务不需要记住。
+        """
+        reminderScheduler.cancel(task.id)
+        self.tagIndex.remove(task.id, task.tags)
+        if task is self.focusTask:
+            self.focusTask = None  # 已专注的时间随任务一起删除，专注本身继续
+        rule = self.rules.get(task.rule_id)
+        if rule and skipOccurrence:
+            rule.skipped.add(task.occurrence_date)
+
+    # ================ 任务归档相关方法 ================
+    def archiveCompletedTasks(self):
+        """把完成超过设定天数的任务移到归档，一次写入、列表只刷新一次"""
+        days = cfg.get(cfg.archiveAfterDays)
+        if not days:
+            return
+
+        cutoff = datetime.now() - timedelta(days=days)
+        old = [task for task in self.tasks
+               if task.is_completed and (task.completed_time or task.created_time) <= cutoff]
+        if old:
+            self.archive.append([TaskArchive.record(task) for task in old])
+            self.removeTasks(old)
+
+    def showArchiveDialog(self):
+        """显示已归档任务"""
+        ArchiveMessageBox(self.archive, self.window()).exec()
+
     def showTaskMenu(self):
         """显示任务菜单"""
-        menu = RoundMenu()
-        
-        # 添加菜单项
-        clearCompletedAction = Action(FluentIcon.BROOM, "清除已完成任务", self)
-        clearCompletedAction.triggered.connect(self.clearCompletedTasks)
-        
-        clearAllAction = Action(FluentIcon.DELETE, "清除所有任务", self)
-        clearAllAction.triggered.connect(self.clearAllTasks)
-        
-        menu.addAction(clearCompletedAction)
-        menu.addAction(clearAllAction)
-        
-        # 显示菜单
-        menu.exec(self.moreTaskButton.mapToGlobal(self.moreTaskButton.rect().bottomRight()))
+        self.taskMenu.exec(self.moreTaskButton.mapToGlobal(self.moreTaskButton.rect().bottomRight()))
 
     def clearCompletedTasks(self):
         """清除已完成任务"""
         completed_count = sum(1 for task in self.tasks if task.is_completed)
         if completed_count == 0:
-            InfoBar.info(
-                title="提示",
-                content="没有已完成的任务",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
+            notificationService.info(
+                title=self.tr("提示"),
+                content=self.tr("没有已完成的任务"),
                 position=InfoBarPosition.TOP_RIGHT,
                 duration=3000,
                 parent=self
             )
             return
             
-        self.tasks = [task for task in self.tasks if not task.is_completed]
-        self.updateTaskList()
+        self.removeTasks([task for task in self.tasks if task.is_completed])
         
-        InfoBar.success(
-            title="清理成功",
-            content=f"已清除 {completed_count} 个已完成任务",
-            orient=Qt.Orientation.Horizontal,
-            isClosable=True,
+        notificationService.success(
+            title=self.tr("清理成功"),
+            content=self.tr("已清除 {0} 个已完成任务").format(completed_count),
             position=InfoBarPosition.TOP_RIGHT,
             duration=3000,
             parent=self
@@ -610,11 +1966,9 @@ class FocusInterface(QWidget, Ui_FocusInterface):
     def clearAllTasks(self):
         """清除所有任务"""
         if not self.tasks:
-            InfoBar.information(
-                title="提示",
-                content="任务列表为空",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
+            notificationService.info(
+                title=self.tr("提示"),
+                content=self.tr("任务列表为空"),
                 position=InfoBarPosition.TOP_RIGHT,
                 duration=3000,
                 parent=self
@@ -622,113 +1976,189 @@ class FocusInterface(QWidget, Ui_FocusInterface):
             return
             
         dialog = MessageBox(
-            "清除所有任务",
-            "确定要清除所有任务吗？此操作不可撤销。",
+            self.tr("清除所有任务"),
+            self.tr("确定要清除所有任务吗？此操作不可撤销。"),
             self.window()
         )
         
         if dialog.exec():
             task_count = len(self.tasks)
+            for task in self.tasks:
+                self._forgetTask(task)
             self.tasks.clear()
             self.updateTaskList()
             
-            InfoBar.success(
-                title="清理成功",
-                content=f"已清除所有 {task_count} 个任务",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
+            notificationService.success(
+                title=self.tr("清理成功"),
+                content=self.tr("已清除所有 {0} 个任务").format(task_count),
                 position=InfoBarPosition.TOP_RIGHT,
                 duration=3000,
                 parent=self
             )
     
     def updateTaskList(self):
-        """更新任务列表显示"""
-        # 清空任务区域
-        self._clearTaskArea()
-        
-        # 重新创建任务卡片
-        self._createTaskCards()
-        
+        """更新任务列表显示，批量操作期间推迟到操作结束时刷新一次"""
+        if self._transactionDepth:
+            self._taskListDirty = True
+            return
+
+        if self.selectedTaskIds:
+            self.selectedTaskIds &= {task.id for task in self.tasks}
+
+        # 卡片已随窗口隐藏回收：提醒、跨零点等触发的刷新不重建卡片，恢复显示时再重建一次
+        if self._resourcesReleased:
+            self.tasksChanged.emit()
+            return
+
+        self._updateSelectionBar()
+        self._updateTagFilterBar()
+        visible = self.visibleTasks()
+
+        # 复用已有卡片，数量不足时补充，多余的隐藏回收
+        self._syncTaskCards(len(visible))
+
+        # 按排序键顺序绑定任务到卡片
+        for card, (i, task) in zip(self._taskCards, visible):
+            self._bindTaskCard(card, i, task)
+
         # 更新提示文本
         self._updateTaskHint()
-    
+        self.tasksChanged.emit()
+
     def _clearTaskArea(self):
-        """清空任务区域"""
+        """清空任务区域（包括界面文件中的示例卡片）"""
         # 获取滚动区域的内容布局
         layout = self.scrollAreaWidgetContents.layout()
-        
-        # 移除所有卡片组件
+
+        # 移除所有组件和弹性空间
         while layout.count():
             item = layout.takeAt(0)
             widget = item.widget()
             if widget:
                 widget.deleteLater()
-        
-        # 确保弹性空间也被移除
-        layout.removeItem(layout.itemAt(0) if layout.count() > 0 else None)
-            
-    def _createTaskCards(self):
-        """创建所有任务卡片"""
-        from qfluentwidgets import ElevatedCardWidget, BodyLabel, IconWidget
-        from PyQt6.QtWidgets import QHBoxLayout
-        
-        # 倒序创建
-        for i, task in reversed(list(enumerate(self.tasks))):
-            # 创建任务卡片
-            card = self._createTaskCard(i, task)
-            # 添加到滚动区域
-            self.scrollAreaWidgetContents.layout().addWidget(card)
-        
-        # 添加弹性空间
-        self.scrollAreaWidgetContents.layout().addStretch(1)
-    
-    def _createTaskCard(self, index, task):
+
+        # 回收池中的卡片不在布局里，一并释放
+        for card in getattr(self, '_taskCardPool', ()):
+            card.deleteLater()
+
+        # 卡片之后保留一个弹性空间
+        layout.addStretch(1)
+        self._taskCards = []
+        self._taskCardPool = []  # 隐藏的空闲卡片，任务增多时优先取用
+
+        # 拖动排序：内容区域接收放下的卡片，插入位置用一条细线指示
+        contents = self.scrollAreaWidgetContents
+        if not contents.acceptDrops():
+            contents.setAcceptDrops(True)
+            contents.installEventFilter(self)
+            self._dropIndicator = QWidget(contents)
+            self._dropIndicator.setFixedHeight(2)
+            self._dropIndicator.setStyleSheet(f"background: {themeColor().name()}")
+            self._dropIndicator.hide()
+
+    def _syncTaskCards(self, count):
+        """使卡片数量与显示的任务数量一致"""
+        if not hasattr(self, '_taskCards'):
+            self._clearTaskArea()
+
+        layout = self.scrollAreaWidgetContents.layout()
+        while len(self._taskCards) < count:
+            card = self._taskCardPool.pop() if self._taskCardPool else self._createTaskCard()
+            # 插入到弹性空间之前
+            layout.insertWidget(len(self._taskCards), card)
+            card.show()
+            self._taskCards.append(card)
+
+        # 多余的卡片只隐藏并放回池中，任务增删反复时不会重复创建和销毁
+        while len(self._taskCards) > count:
+            card = self._taskCards.pop()
+            layout.removeWidget(card)
+            card.hide()
+            self._taskCardPool.append(card)
+
+    def _createTaskCard(self):
         """创建单个任务卡片"""
         from qfluentwidgets import ElevatedCardWidget, BodyLabel, IconWidget
         from PyQt6.QtWidgets import QHBoxLayout
-        
+
         card = ElevatedCardWidget(self.scrollAreaWidgetContents)
         layout = QHBoxLayout(card)
         layout.setContentsMargins(15, 8, 15, 8)
         layout.setSpacing(10)
-        
+
         # 创建任务图标
-        icon = IconWidget(card)
-        icon.setMinimumSize(16, 16)
-        icon.setMaximumSize(16, 16)
-        
-        # 根据任务状态设置图标
-        icon.setIcon(InfoBarIcon.SUCCESS if task.is_completed else InfoBarIcon.WARNING)
-        
+        card.iconWidget = IconWidget(card)
+        card.iconWidget.setMinimumSize(16, 16)
+        card.iconWidget.setMaximumSize(16, 16)
+
         # 创建任务标签
-        label = BodyLabel(task.name, card)
-        
-        # 如果任务已完成，添加删除线
-        if task.is_completed:
-            label.setProperty("strikeOut", True)
-            label.style().polish(label)
-        
+        card.label = BodyLabel(card)
+
+        # 多选时显示的复选框
+        card.checkBox = CheckBox(card)
+        card.checkBox.setFixedWidth(28)
+        card.checkBox.hide()
+        card.checkBox.clicked.connect(lambda _, c=card: self.toggleTaskSelected(c.taskIndex))
+
         # 添加组件到布局
-        layout.addWidget(icon)
-        layout.addWidget(label)
-        
+        layout.addWidget(card.checkBox)
+        layout.addWidget(card.iconWidget)
+        layout.addWidget(card.label)
+
         # 设置最小高度
         card.setMinimumHeight(44)
-        
-        # 连接点击事件
-        card.mousePressEvent = lambda event, idx=index: self.onTaskClicked(event, idx)
-        
+
+        # 连接点击和拖动事件，索引在绑定时更新
+        card.taskIndex = -1
+        card.mousePressEvent = lambda event, c=card: self._onTaskCardPressed(event, c)
+        card.mouseMoveEvent = lambda event, c=card: self._onTaskCardMoved(event, c)
+        card.mouseReleaseEvent = lambda event, c=card: self._onTaskCardReleased(event, c)
+
         return card
-    
+
+    def _bindTaskCard(self, card, index, task):
+        """将任务绑定到卡片"""
+        card.taskIndex = index
+        card.checkBox.setVisible(bool(self.selectedTaskIds))
+        card.checkBox.setChecked(task.id in self.selectedTaskIds)
+
+        # 根据任务状态设置图标
+        if task is self.focusTask:
+            card.iconWidget.setIcon(FluentIcon.STOP_WATCH)
+        else:
+            card.iconWidget.setIcon(InfoBarIcon.SUCCESS if task.is_completed else InfoBarIcon.WARNING)
+        text = task.name
+        rule = self.rules.get(task.rule_id)
+        if rule:
+            text += f"  ·  {rule.describe()}"
+        card.setToolTip(self._ruleToolTip(rule, task.occurrence_date) if rule else "")
+        if task.due_time:
+            text += "  ·  " + self.tr("截止 {0}").format(f"{task.due_time:%m-%d %H:%M}")
+        if task.totalCount:
+            text += f"  ·  {task.doneCount}/{task.totalCount}"
+        if task.focusedSeconds or task.estimateMinutes:
+            text += "  ·  " + self._taskTimeText(task)
+        if task.tags:
+            text += "  " + " ".join(f"#{tag}" for tag in sorted(task.tags))
+        card.label.setText(text)
+
+        # 如果任务已完成，添加删除线
+        if card.label.property("strikeOut") != task.is_completed:
+            card.label.setProperty("strikeOut", task.is_completed)
+            card.label.style().polish(card.label)
+
     def _updateTaskHint(self):
         """更新任务提示文本"""
         if not self.tasks:
-            self.hintLabel_2.setText("没有任务，点击 + 添加新任务")
+            self.hintLabel_2.setText(self.tr("没有任务，点击 + 添加新任务"))
         else:
             total = len(self.tasks)
             completed = sum(1 for task in self.tasks if task.is_completed)
-            self.hintLabel_2.setText(f"共 {total} 个任务，已完成 {completed} 个")
+            if self.tagFilter:
+                self.hintLabel_2.setText(self.tr("筛选出 {0} 个任务（共 {1} 个，已完成 {2} 个）").format(
+                    len(self._taskCards), total, completed))
+            else:
+                self.hintLabel_2.setText(self.tr("共 {0} 个任务，已完成 {1} 个").format(total, completed))
 
     # ================ 图片卡片相关方法 ================
     def onImageClicked(self, event):
@@ -745,11 +2175,9 @@ class FocusInterface(QWidget, Ui_FocusInterface):
             title = f"🐧"
             content = f"Resting."
 
-        InfoBar.success(
+        notificationService.success(
             title=title,
             content=content,
-            orient=Qt.Orientation.Horizontal,
-            isClosable=True,
             position=InfoBarPosition.TOP_RIGHT,
             duration=2000,
             parent=self
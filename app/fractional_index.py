@@ -0,0 +1,66 @@
+""" 分数排序键
+
+用字符串表示 (0, 1) 之间的 62 进制小数，字符串的字典序就是数值顺序。
+在两个键之间总能生成一个新键，移动一条记录只需要改写它自己的键，其余记录不变。
+反复在同一位置插入会让键逐渐变长，超过一定长度时用 evenKeys() 整体重排一次。
+"""
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+_VALUES = {digit: value for value, digit in enumerate(DIGITS)}
+
+
+def _midpoint(a, b):
+    """ a < b 之间的键，b 为 None 表示 1 """
+    if b is not None:
+        # 跳过公共前缀（a 较短时按补 0 比较）
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else "0") == b[n]:
+            n += 1
+        if n:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digitA = _VALUES[a[0]] if a else 0
+    digitB = _VALUES[b[0]] if b is not None else BASE
+    if digitB - digitA > 1:
+        return DIGITS[(digitA + digitB + 1) // 2]
+
+    # 首位相邻：b 更长时取 b 的首位即可，否则在 a 的首位之后继续二分
+    if b is not None and len(b) > 1:
+        return b[0]
+    return DIGITS[digitA] + _midpoint(a[1:], None)
+
+
+def keyBetween(a=None, b=None):
+    """ 生成 a 与 b 之间的键，None 表示开区间的一端 """
+    if a is not None and b is not None and a >= b:
+        raise ValueError(f"{a!r} >= {b!r}")
+    if (a and a[-1] == "0") or (b and b[-1] == "0"):
+        raise ValueError("排序键不能以 0 结尾")
+    return _midpoint(a or "", b)
+
+
+def evenKeys(count):
+    """ 生成 count 个均匀分布的键，用于重排 """
+    width = 1
+    while BASE ** width <= count:
+        width += 1
+    width += 1  # 留出插入空间
+
+    keys = []
+    for i in range(1, count + 1):
+        value = i * BASE ** width // (count + 1)
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        keys.append("".join(reversed(digits)).rstrip("0"))
+    return keys
+
+
+def keysBetween(a, b, count):
+    """ 生成 a 与 b 之间 count 个递增的键，二分生成，键长只随 count 对数增长 """
+    if count <= 0:
+        return []
+    mid = keyBetween(a, b)
+    left = count // 2
+    return keysBetween(a, mid, left) + [mid] + keysBetween(mid, b, count - left - 1)
@@ -0,0 +1,149 @@
+""" 模糊匹配
+
+候选项按来源分组（页面、动作、任务……），每个候选项预处理（大小写折叠）后的文本按键缓存，
+某个来源变化时只重新处理文本变了的候选项。所有候选文本用换行拼接成一个字符串，
+匹配时把查询编译成正则表达式，由 re 在 C 层扫描整个字符串，而不是在 Python 中逐个打分：
+
+1. 前缀匹配；
+2. 连续子串匹配；
+3. 子序列匹配（按匹配片段的长短排序，越紧凑越靠前）。
+
+前缀匹配用“换行 + 查询”表达（字符串以换行开头），避免 `^` 在每个位置都做一次行首判断；
+子序列用 `a[^b\n]*+b[^c\n]*+c` 这样的占有量词表达，每个位置只有一种匹配方式，不会回溯；
+每个模式都吞掉匹配所在行的剩余部分，扫描直接跳到下一行。每一级收集到足够的结果就停止扫描。
+
+连续输入时，如果上一个查询的全部匹配数较少，新查询只在这些匹配项中查找；
+最近的查询结果也会缓存，候选项变化时失效。
+"""
+import re
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+
+CACHE_SIZE = 64
+FUZZY_POOL = 4   # 子序列匹配先收集 limit 的几倍，再按紧凑程度排序
+
+
+def fold(text):
+    """ 预处理候选文本或查询 """
+    return text.casefold().replace("\n", " ")
+
+
+def _skipTo(c):
+    """ 跳过 c 之前的字符（不跨行、不回溯） """
+    return "[^" + ("\\" + c if c in "\\]^-" else c) + "\n]*+"
+
+
+class _Haystack:
+    """ 一组候选文本拼接成的字符串（每行以换行开头），以及每行的起始偏移和候选序号 """
+    __slots__ = ("text", "starts", "ids")
+
+    def __init__(self, lines, ids):
+        self.text = "".join("\n" + line for line in lines)
+        self.starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=1))
+        self.ids = ids
+
+    def lineAt(self, offset):
+        return self.ids[bisect_right(self.starts, offset) - 1]
+
+
+class FuzzyMatcher:
+    """ 带缓存的模糊匹配器 """
+
+    def __init__(self):
+        self._sources = OrderedDict()   # 来源 -> {键: (原文, 折叠后的文本)}，按加入顺序排列
+        self._candidates = None         # [(来源, 键)]，与拼接字符串中的行一一对应
+        self._haystack = None
+        self._cache = OrderedDict()     # 查询 -> 结果
+        self._last = None               # (上一个查询, 它的全部匹配行号)，匹配数较多时为 None
+
+    def setCandidates(self, source, items):
+        """ 设置某个来源的候选项 [(键, 文本)]，只重新处理文本变了的项 """
+        old = self._sources.get(source, {})
+        new = {}
+        for key, text in items:
+            entry = old.get(key)
+            new[key] = entry if entry is not None and entry[0] == text else (text, fold(text))
+        self._sources[source] = new
+        self._invalidate()
+
+    def removeSource(self, source):
+        if self._sources.pop(source, None) is not None:
+            self._invalidate()
+
+    def __len__(self):
+        return sum(len(items) for items in self._sources.values())
+
+    def _invalidate(self):
+        self._candidates = self._haystack = self._last = None
+        self._cache.clear()
+
+    def _build(self):
+        if self._haystack is None:
+            self._candidates = [(source, key) for source, items in self._sources.items() for key in items]
+            lines = [folded for items in self._sources.values() for _, folded in items.values()]
+            self._haystack = _Haystack(lines, range(len(lines)))
+
+    # ================ 匹配 ================
+    def match(self, query, limit=50):
+        """ 返回最多 limit 个匹配的 (来源, 键)，按匹配程度排序 """
+        query = fold(query.strip())
+        self._build()
+        if not query:
+            return self._candidates[:limit]
+
+        cached = self._cache.get((query, limit))
+        if cached is not None:
+            self._cache.move_to_end((query, limit))
+            return cached
+
+        # 在上一个查询的匹配项中继续查找
+        haystack = self._haystack
+        if self._last and query.startswith(self._last[0]):
+            ids = self._last[1]
+            haystack = _Haystack([self._lineAt(i) for i in ids], ids)
+
+        ids, matched = self._search(haystack, query, limit)
+        self._last = (query, matched) if matched is not None else None
+
+        result = [self._candidates[i] for i in ids]
+        self._cache[(query, limit)] = result
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    def _lineAt(self, index):
+        source, key = self._candidates[index]
+        return self._sources[source][key][1]
+
+    def _search(self, haystack, query, limit):
+        """ 分级匹配，返回 (结果行号, 全部匹配行号)，全部匹配数超过收集上限时后者为 None """
+        found, seen = [], set()
+
+        def collect(pattern, count):
+            for m in re.finditer(pattern, haystack.text):
+                line = haystack.lineAt(m.end())
+                if line not in seen:
+                    yield line, m
+                    count -= 1
+                    if count <= 0:
+                        return
+
+        # 1. 前缀 2. 连续子串
+        escaped = re.escape(query)
+        for pattern in ("\n" + escaped + r"[^\n]*", escaped + r"[^\n]*"):
+            for line, _ in collect(pattern, limit - len(found)):
+                seen.add(line)
+                found.append(line)
+            if len(found) >= limit:
+                return found, None
+
+        # 3. 子序列，按匹配片段长度排序
+        pool = limit * FUZZY_POOL
+        pattern = "(" + re.escape(query[0]) + "".join(_skipTo(c) + re.escape(c) for c in query[1:]) + r")[^\n]*"
+        fuzzy = [(m.end(1) - m.start(1), line) for line, m in collect(pattern, pool)]
+        fuzzy.sort()
+        exhaustive = len(fuzzy) < pool
+        matched = found + [line for _, line in fuzzy] if exhaustive else None
+        found += [line for _, line in fuzzy[:limit - len(found)]]
+        return found, matched
@@ -0,0 +1,126 @@
+""" 界面翻译
+
+翻译源文件是 resource/i18n 下的 Qt .ts 文件（用 pylupdate6 从源码中提取），
+运行 `python i18n.py` 把它们编译成 QTranslator 可直接加载的 .qm 文件。
+运行时由 languageManager 按语言惰性加载并缓存翻译器，切换语言只是替换已安装的翻译器，
+Qt 会向所有窗口发送 LanguageChange 事件，各页面在 changeEvent 中就地重设文本，不需要重启。
+"""
+import os
+import struct
+import xml.etree.ElementTree as ET
+
+from PyQt6.QtCore import QObject, QLocale, QTranslator, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from paths import i18n_path
+
+CATALOG_NAME = "penguin_stride"
+
+# .qm 文件格式（与 lrelease 输出一致的最小子集）
+QM_MAGIC = bytes([0x3C, 0xB8, 0x64, 0x18, 0xCA, 0xEF, 0x9C, 0x95,
+                  0xCD, 0x21, 0x1C, 0xBF, 0x60, 0xA1, 0xBD, 0xDD])
+TAG_HASHES, TAG_MESSAGES = 0x42, 0x69
+TAG_END, TAG_TRANSLATION, TAG_SOURCE, TAG_CONTEXT, TAG_COMMENT = 1, 3, 6, 7, 8
+
+
+def elfHash(data):
+    """ QTranslator 查找消息使用的哈希 """
+    h = 0
+    for byte in data:
+        h = ((h << 4) + byte) & 0xFFFFFFFF
+        g = h & 0xF0000000
+        if g:
+            h ^= g >> 24
+        h &= ~g & 0xFFFFFFFF
+    return h or 1
+
+
+def _field(tag, data):
+    return struct.pack(">BI", tag, len(data)) + data
+
+
+def compileCatalog(tsPath, qmPath):
+    """ 把 .ts 文件编译为 .qm 文件，返回写入的消息数，未翻译和已废弃的条目会被跳过 """
+    messages, hashes = bytearray(), []
+    for context in ET.parse(tsPath).getroot().iter("context"):
+        contextName = context.findtext("name", "").encode("utf-8")
+        for message in context.iter("message"):
+            translation = message.find("translation")
+            if translation is None or translation.get("type") in ("unfinished", "obsolete", "vanished"):
+                continue
+            if not translation.text:
+                continue
+
+            source = message.findtext("source", "").encode("utf-8")
+            comment = message.findtext("comment", "").encode("utf-8")
+            hashes.append((elfHash(source + comment), len(messages)))
+            messages += _field(TAG_TRANSLATION, translation.text.encode("utf-16-be"))
+            messages += _field(TAG_SOURCE, source)
+            messages += _field(TAG_CONTEXT, contextName)
+            messages += _field(TAG_COMMENT, comment)
+            messages.append(TAG_END)
+
+    hashes.sort()
+    with open(qmPath, "wb") as f:
+        f.write(QM_MAGIC)
+        f.write(_field(TAG_HASHES, b"".join(struct.pack(">II", h, o) for h, o in hashes)))
+        f.write(_field(TAG_MESSAGES, bytes(messages)))
+    return len(hashes)
+
+
+class LanguageManager(QObject):
+    """ 语言管理器
+
+    每种语言的翻译器（组件库的 FluentTranslator 和本应用的目录）在第一次使用时加载，
+    之后缓存复用，来回切换语言不会重复读取文件。
+    """
+    languageChanged = pyqtSignal(QLocale)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._translators = {}  # 语言名称 -> [翻译器]
+        self._installed = []
+        self.locale = None
+
+    def translators(self, locale):
+        """ 获取某种语言的翻译器，首次使用时加载 """
+        name = locale.name()
+        translators = self._translators.get(name)
+        if translators is None:
+            from qfluentwidgets import FluentTranslator
+
+            translators = [FluentTranslator(locale, self)]
+            catalog = QTranslator(self)
+            if catalog.load(locale, CATALOG_NAME, ".", i18n_path):
+                translators.append(catalog)
+            self._translators[name] = translators
+        return translators
+
+    def setLanguage(self, language):
+        """ 切换界面语言，language 为 config.Language 或 QLocale """
+        locale = getattr(language, "value", language)
+        if self.locale is not None and locale.name() == self.locale.name():
+            return
+
+        app = QApplication.instance()
+        for translator in self._installed:
+            app.removeTranslator(translator)
+
+        self._installed = self.translators(locale)
+        for translator in self._installed:
+            app.installTranslator(translator)
+
+        self.locale = locale
+        self.languageChanged.emit(locale)
+
+
+languageManager = LanguageManager()
+
+
+if __name__ == '__main__':
+    # 编译 resource/i18n 下的所有翻译源文件
+    for file in sorted(os.listdir(i18n_path)):
+        if file.endswith(".ts"):
+            tsPath = os.path.join(i18n_path, file)
+            count = compileCatalog(tsPath, os.path.splitext(tsPath)[0] + ".qm")
+            print(f"{file}: {count} 条翻译")
@@ -0,0 +1,56 @@
+from PyQt6.QtCore import QEvent
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyInterface(QWidget):
+    """ 延迟创建的子页面
+
+    作为导航栏中的占位页面，真正的页面在第一次显示时才通过 factory 创建，
+    并且可以在不可见时销毁，下次显示时重新创建。
+    """
+
+    def __init__(self, factory, objectName, parent=None):
+        super().__init__(parent=parent)
+        self.setObjectName(objectName)
+        self._factory = factory
+        self.widget = None
+
+        self.vBoxLayout = QVBoxLayout(self)
+        self.vBoxLayout.setContentsMargins(0, 0, 0, 0)
+
+    def ensureWidget(self):
+        """ 创建真正的页面 """
+        if self.widget is None:
+            self.widget = self._factory(self)
+            self.vBoxLayout.addWidget(self.widget)
+        return self.widget
+
+    def release(self):
+        """ 销毁不可见的页面，返回是否销毁 """
+        if self.widget is None or self.isVisible():
+            return False
+
+        self.vBoxLayout.removeWidget(self.widget)
+        self.widget.deleteLater()
+        self.widget = None
+        return True
+
+    def rebuild(self):
+        """ 重新创建页面，不可见时直接销毁，下次显示时再创建 """
+        if self.release() or self.widget is None:
+            return
+
+        self.vBoxLayout.removeWidget(self.widget)
+        self.widget.deleteLater()
+        self.widget = None
+        self.ensureWidget()
+
+    def showEvent(self, e):
+        self.ensureWidget()
+        super().showEvent(e)
+
+    def changeEvent(self, e):
+        # 页面本身没有状态，切换语言时重新创建比逐个重设文本简单
+        if e.type() == QEvent.Type.LanguageChange:
+            self.rebuild()
+        super().changeEvent(e)
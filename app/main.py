@@ -1,15 +1,17 @@
+import logging
 import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
 
-from MainWindow import MainWindow
-from Login_page import LoginWindow
-from qfluentwidgets import FluentTranslator
+from single_instance import sendCommand, printReply
 
-from config import cfg
 
 class AppController:
-    def __init__(self):
+    def __init__(self, argv=None):
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import Qt
+        from Login_page import LoginWindow
+        from commands import CommandDispatcher
+        from single_instance import InstanceServer
+
         self.app = QApplication(sys.argv)
         self.app.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings) # 禁用Qt的原生窗口
         
@@ -21,6 +23,20 @@ class AppController:
 
         self.login_window = LoginWindow()
         self.main_window = None
+
+        # 单实例服务，接收后续启动转发过来的命令
+        self.dispatcher = CommandDispatcher(self)
+        self.instanceServer = InstanceServer(self.dispatcher, self.app)
+        if not self.instanceServer.listen():
+            # 另一个同时启动的实例先开始了监听：转发参数后退出，不再启动第二个界面
+            reply = sendCommand(list(argv or []))
+            if reply is None:
+                print("无法启动单实例服务，也无法连接正在运行的实例")
+                sys.exit(1)
+            sys.exit(printReply(reply))
+
+        # 启动参数中的命令等登录后再执行
+        self.pendingArgv = list(argv or [])
         
         # 显示登录窗口
         self.login_window.show()
@@ -28,19 +44,65 @@ class AppController:
 
     def show_main_window(self, username):
         """显示主窗口"""
+        from MainWindow import MainWindow
+        from automation_api import AutomationService
+        from config import cfg
+        from utils import signalBus
+
         self.main_window = MainWindow(username)
         self.main_window.show()
         self.login_window.close()
 
+        # 本地自动化接口（默认关闭）
+        self.automation = AutomationService(
+            self.dispatcher, self.main_window.focusInterface, cfg.get(cfg.automationPort), self.app)
+        self.automation.setEnabled(cfg.get(cfg.automationEnabled))
+        signalBus.automationEnabledChanged.connect(self.automation.setEnabled)
+        self.app.aboutToQuit.connect(lambda: self.automation.setEnabled(False))
+
+        # 上次的专注被崩溃或断电中断时询问恢复
+        self.main_window.focusInterface.recoverInterruptedSession()
+
+        if self.pendingArgv:
+            argv, self.pendingArgv = self.pendingArgv, []
+            self._execute_pending_argv(argv)
+
+    def _execute_pending_argv(self, argv):
+        """执行登录前转发来的命令
+
+        在 Qt 槽中调用，与 InstanceServer.handle 一样捕获所有异常，失败时在主窗口上提示：
+        PyQt6 中槽里未捕获的异常会直接终止应用。
+        """
+        from commands import CommandError
+        from notification import notificationService
+
+        try:
+            self.dispatcher.execute(argv)
+        except CommandError as e:
+            notificationService.error("无法执行命令", str(e), self.main_window, duration=5000)
+        except Exception as e:
+            notificationService.error("命令执行失败", str(e), self.main_window, duration=5000)
+
     def run(self):
         sys.exit(self.app.exec())
     
     def internationalization(self):
         """翻译"""
-        locale = cfg.get(cfg.language).value
-        translator = FluentTranslator(locale)
-        self.app.installTranslator(translator)
+        from config import cfg
+        from i18n import languageManager
+
+        # 语言设置即时生效，翻译器按语言缓存
+        languageManager.setLanguage(cfg.get(cfg.language))
+        cfg.language.valueChanged.connect(languageManager.setLanguage)
 
 if __name__ == '__main__':
-    controller = AppController()
-    controller.run()
\ No newline at end of file
+    # 诊断信息（如内存回收前后的 RSS）输出到 stderr
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+
+    # 已有实例在运行时只转发参数，不再启动新的 Qt 界面
+    reply = sendCommand(sys.argv[1:])
+    if reply is not None:
+        sys.exit(printReply(reply))
+
+    controller = AppController(sys.argv[1:])
+    controller.run()
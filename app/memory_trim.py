@@ -0,0 +1,102 @@
+import gc
+import os
+import sys
+
+from PyQt6.QtCore import QObject, QTimer, QCoreApplication, QEvent, pyqtSignal
+from PyQt6.QtGui import QPixmapCache
+
+from utils import signalBus
+
+
+def readRss():
+    """ 读取当前进程常驻内存（字节） """
+    if sys.platform == 'win32':
+        try:
+            import win32api, win32process
+            info = win32process.GetProcessMemoryInfo(win32api.GetCurrentProcess())
+            return info['WorkingSetSize']
+        except ImportError:
+            return 0
+
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def releaseHeap():
+    """ 回收 Python 垃圾并把空闲堆内存归还给系统 """
+    gc.collect()
+    try:
+        import ctypes
+        if sys.platform == 'win32':
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            ctypes.windll.psapi.EmptyWorkingSet(handle)
+        elif sys.platform.startswith('linux'):
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+class MemoryTrimmer(QObject):
+    """ 内存回收策略
+
+    窗口最小化或隐藏到托盘一段时间后，依次调用注册的释放函数，
+    清空 QPixmapCache 并归还堆内存；窗口恢复时调用恢复函数，
+    各页面在真正显示时再按需重建。
+    """
+    TRIM_DELAY = 10000  # 进入后台多久后回收（毫秒）
+
+    trimmed = pyqtSignal(int, int)  # 回收前后的常驻内存（字节）
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.isTrimmed = False
+        self._targets = []  # (释放函数, 恢复函数)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.trim)
+
+        signalBus.backgroundModeChanged.connect(self._onBackgroundModeChanged)
+
+    def addTarget(self, release, restore=None):
+        """ 注册释放/恢复函数 """
+        self._targets.append((release, restore))
+
+    def trim(self):
+        """ 回收内存，返回回收前后的常驻内存（字节） """
+        before = readRss()
+        for release, _ in self._targets:
+            release()
+
+        QPixmapCache.clear()
+
+        # 释放函数中 deleteLater 的部件在这里真正销毁
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        releaseHeap()
+
+        after = readRss()
+        self.isTrimmed = True
+        self.trimmed.emit(before, after)
+        return before, after
+
+    def restore(self):
+        """ 恢复被回收的资源 """
+        if not self.isTrimmed:
+            return
+
+        self.isTrimmed = False
+        for _, restore in self._targets:
+            if restore:
+                restore()
+
+    def _onBackgroundModeChanged(self, background):
+        if background:
+            self.timer.start(self.TRIM_DELAY)
+        else:
+            self.timer.stop()
+            self.restore()
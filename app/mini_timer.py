@@ -0,0 +1,239 @@
+""" 迷你计时器
+
+专注卡片的固定按钮弹出的置顶小窗，只显示当前专注/休息的剩余时间和开始/结束、返回主窗口两个按钮。
+整个窗口在 paintEvent 中自绘，不复用 FocusInterface 的部件；时间和状态文本用 QStaticText 缓存排版，
+文本没有变化时每秒的刷新不会重新排版，也不会重绘。
+
+迷你计时器是唯一可见的窗口（主窗口最小化或隐藏）时，主窗口的绘制被完全关闭，
+直到主窗口重新显示。
+"""
+from PyQt6.QtCore import Qt, QEvent, QPointF, QRect, QRectF
+from PyQt6.QtGui import QColor, QFont, QPainter, QStaticText
+from PyQt6.QtWidgets import QWidget
+from qfluentwidgets import FluentIcon, isDarkTheme, themeColor
+
+from clock_service import clockService
+from cycle_plan import SegmentKind
+
+WINDOW_SIZE = (232, 64)
+BUTTON_SIZE = 28
+MARGIN = 12
+
+
+class MiniTimerWindow(QWidget):
+    """ 置顶的迷你计时器窗口 """
+
+    def __init__(self, focusInterface):
+        # 不设父对象：有父窗口的工具窗口会随主窗口一起最小化
+        super().__init__(None, Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint
+                         | Qt.WindowType.WindowStaysOnTopHint)
+        self.focusInterface = focusInterface
+        self.mainWindow = focusInterface.window()
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_QuitOnClose, False)
+        self.setMouseTracking(True)
+        self.setFixedSize(*WINDOW_SIZE)
+
+        self.tickSubscription = None
+        self._dragOffset = None   # 拖动窗口时鼠标相对窗口左上角的位置
+        self._hovered = None      # 鼠标所在的按钮
+        self._placed = False      # 是否已经放到过屏幕上
+
+        # 缓存排版的文本
+        self._timeText = QStaticText()
+        self._stateText = QStaticText()
+        self._timeFont = QFont(self.font())
+        self._timeFont.setPixelSize(24)
+        self._timeFont.setWeight(QFont.Weight.DemiBold)
+        self._stateFont = QFont(self.font())
+        self._stateFont.setPixelSize(12)
+
+        # 按钮区域
+        width, height = WINDOW_SIZE
+        top = (height - BUTTON_SIZE) // 2
+        self._buttons = {
+            "toggle": QRect(width - MARGIN - 2 * BUTTON_SIZE - 4, top, BUTTON_SIZE, BUTTON_SIZE),
+            "restore": QRect(width - MARGIN - BUTTON_SIZE, top, BUTTON_SIZE, BUTTON_SIZE),
+        }
+
+        focusInterface.sessionStateChanged.connect(self._onSessionStateChanged)
+        focusInterface.destroyed.connect(self.deleteLater)
+        self.mainWindow.installEventFilter(self)
+
+    # ================ 显示 ================
+    def popOut(self):
+        """ 显示迷你计时器并最小化主窗口 """
+        if not self._placed:
+            # 第一次显示时放在屏幕右上角，之后保留拖动到的位置
+            screen = self.mainWindow.screen().availableGeometry()
+            self.move(screen.right() - self.width() - 24, screen.top() + 24)
+            self._placed = True
+        self.show()
+        self.mainWindow.showMinimized()
+
+    def restoreMainWindow(self):
+        """ 关闭迷你计时器，回到主窗口 """
+        self.hide()
+        window = self.mainWindow
+        window.setUpdatesEnabled(True)
+        window.showNormal()
+        window.raise_()
+        window.activateWindow()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._onSessionStateChanged()
+        self._updateMainWindowPainting()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        clockService.unsubscribe(self.tickSubscription)
+        self.tickSubscription = None
+        self._updateMainWindowPainting()
+
+    def changeEvent(self, e):
+        if e.type() == QEvent.Type.LanguageChange:
+            self._stateText.setText(self._stateString())
+            self.update()
+        super().changeEvent(e)
+
+    def eventFilter(self, obj, e):
+        if obj is self.mainWindow and e.type() in (
+                QEvent.Type.Show, QEvent.Type.Hide, QEvent.Type.WindowStateChange):
+            self._updateMainWindowPainting()
+        return super().eventFilter(obj, e)
+
+    def _updateMainWindowPainting(self):
+        """ 迷你计时器是唯一可见的窗口时关闭主窗口的绘制 """
+        window = self.mainWindow
+        onlyVisible = self.isVisible() and (window.isHidden() or window.isMinimized())
+        if window.updatesEnabled() == onlyVisible:
+            window.setUpdatesEnabled(not onlyVisible)
+
+    # ================ 计时 ================
+    def _onSessionStateChanged(self):
+        """ 专注开始/结束或段切换：调整时钟订阅并刷新 """
+        if not self.isVisible():
+            return
+
+        focusing = self.focusInterface.isFocusing
+        if focusing and self.tickSubscription is None:
+            self.tickSubscription = clockService.subscribe(self.updateTime, clockService.HZ_1)
+        elif not focusing:
+            clockService.unsubscribe(self.tickSubscription)
+            self.tickSubscription = None
+
+        self._stateText.setText(self._stateString())
+        self.updateTime()
+        self.update()
+
+    def _stateString(self):
+        focus = self.focusInterface
+        if not focus.isFocusing:
+            return self.tr("准备专注")
+
+        timeline = focus.timeline
+        cycle = self.tr("第 {0}/{1} 轮").format(timeline.cycles[focus.segmentIndex], timeline.plan.cycles)
+        kind = timeline.kinds[focus.segmentIndex]
+        if kind is SegmentKind.LONG_BREAK:
+            return self.tr("长休息") + " · " + cycle
+        if kind is SegmentKind.SHORT_BREAK:
+            return self.tr("休息") + " · " + cycle
+        return self.tr("专注") + " · " + cycle
+
+    def updateTime(self):
+        """ 每秒刷新剩余时间，文本没有变化时不重绘 """
+        focus = self.focusInterface
+        if focus.isFocusing:
+            seconds = int(focus.remainingSeconds())
+        else:
+            seconds = focus.timeline.plan.focusSeconds
+
+        hours, remainder = divmod(seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        text = f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+        if text != self._timeText.text():
+            self._timeText.setText(text)
+            self.update()
+
+    # ================ 绘制 ================
+    def paintEvent(self, e):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        dark = isDarkTheme()
+        focus = self.focusInterface
+
+        # 背景和左侧的状态色条
+        painter.setPen(QColor(255, 255, 255, 20) if dark else QColor(0, 0, 0, 25))
+        painter.setBrush(QColor(39, 39, 39) if dark else QColor(249, 249, 249))
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(16, 137, 62) if focus.isBreaking else themeColor())
+        painter.drawRoundedRect(QRectF(6, 12, 4, self.height() - 24), 2, 2)
+
+        # 文本
+        painter.setPen(QColor(255, 255, 255, 150) if dark else QColor(0, 0, 0, 140))
+        painter.setFont(self._stateFont)
+        painter.drawStaticText(QPointF(MARGIN + 6, 9), self._stateText)
+        painter.setPen(Qt.GlobalColor.white if dark else Qt.GlobalColor.black)
+        painter.setFont(self._timeFont)
+        painter.drawStaticText(QPointF(MARGIN + 6, 25), self._timeText)
+
+        # 按钮
+        icons = {
+            "toggle": FluentIcon.CANCEL if focus.isFocusing else FluentIcon.PLAY,
+            "restore": FluentIcon.BACK_TO_WINDOW,
+        }
+        for name, rect in self._buttons.items():
+            if name == self._hovered:
+                painter.setBrush(QColor(255, 255, 255, 15) if dark else QColor(0, 0, 0, 10))
+                painter.drawRoundedRect(QRectF(rect), 4, 4)
+            icons[name].render(painter, QRectF(rect).adjusted(7, 7, -7, -7))
+
+    # ================ 鼠标 ================
+    def _buttonAt(self, pos):
+        return next((name for name, rect in self._buttons.items() if rect.contains(pos)), None)
+
+    def mousePressEvent(self, e):
+        if e.button() == Qt.MouseButton.LeftButton and self._buttonAt(e.position().toPoint()) is None:
+            self._dragOffset = e.globalPosition().toPoint() - self.pos()
+
+    def mouseMoveEvent(self, e):
+        if self._dragOffset is not None:
+            self.move(e.globalPosition().toPoint() - self._dragOffset)
+            return
+
+        hovered = self._buttonAt(e.position().toPoint())
+        if hovered != self._hovered:
+            self._hovered = hovered
+            self.update()
+
+    def mouseReleaseEvent(self, e):
+        if self._dragOffset is not None:
+            self._dragOffset = None
+            return
+
+        button = self._buttonAt(e.position().toPoint())
+        if button == "toggle":
+            self.toggleFocus()
+        elif button == "restore":
+            self.restoreMainWindow()
+
+    def mouseDoubleClickEvent(self, e):
+        if self._buttonAt(e.position().toPoint()) is None:
+            self.restoreMainWindow()
+
+    def leaveEvent(self, e):
+        if self._hovered is not None:
+            self._hovered = None
+            self.update()
+        super().leaveEvent(e)
+
+    def toggleFocus(self):
+        """ 开始专注，或直接结束（主窗口不可见，不弹确认框） """
+        focus = self.focusInterface
+        if focus.isFocusing:
+            focus.endFocus()
+        else:
+            focus.startFocus()
@@ -0,0 +1,265 @@
+from collections import deque
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QFrame
+
+from qfluentwidgets import InfoBar, InfoBarIcon, InfoBarPosition
+from qfluentwidgets.components.widgets.info_bar import InfoBarManager
+
+
+class PooledInfoBar(InfoBar):
+    """ 可回收的消息条
+
+    InfoBar 关闭时会 deleteLater，并且每次显示都会挂一个一次性定时器。
+    这里改为关闭后隐藏并回收到对象池，淡出定时器也只创建一次。
+    """
+    recycled = pyqtSignal()  # 回收信号
+
+    def __init__(self, icon, title, content, position=InfoBarPosition.TOP_RIGHT, parent=None):
+        super().__init__(icon, title, content, Qt.Orientation.Horizontal, True, -1, position, parent)
+        self.fadeTimer = QTimer(self)
+        self.fadeTimer.setSingleShot(True)
+        self.fadeTimer.timeout.connect(self._fadeOut)
+        self.opacityAni.finished.connect(self.close)
+
+    def rebind(self, icon, title, content, duration):
+        """ 重新设置图标、文本和显示时长 """
+        self.duration = duration
+        self.title = title
+        self.content = content
+        self.titleLabel.setVisible(bool(title))
+        self.contentLabel.setVisible(bool(content))
+
+        if self.icon != icon:
+            self.icon = icon
+            self.iconWidget.icon = icon
+            self.iconWidget.update()
+            self.setProperty('type', icon.value)
+            self.style().unpolish(self)
+            self.style().polish(self)
+
+        # 停止正在进行的淡出
+        self.opacityAni.stop()
+        self.opacityEffect.setOpacity(1)
+        self._adjustText()
+
+        # 显示中的消息条重新计时
+        if self.isVisible() and duration >= 0:
+            self.fadeTimer.start(duration)
+
+    def showEvent(self, e):
+        self._adjustText()
+        QFrame.showEvent(self, e)
+
+        if self.duration >= 0:
+            self.fadeTimer.start(self.duration)
+
+        if self.position != InfoBarPosition.NONE:
+            InfoBarManager.make(self.position).add(self)
+
+        if self.parent():
+            self.parent().installEventFilter(self)
+
+    def closeEvent(self, e):
+        e.accept()
+        if self.isHidden():
+            return
+
+        self.fadeTimer.stop()
+        self.opacityAni.stop()
+
+        # InfoBarManager 每次 add 都会连接一个槽，回收前全部断开
+        self.closedSignal.emit()
+        try:
+            self.closedSignal.disconnect()
+        except TypeError:
+            pass
+
+        # 动画由管理器在下次 add 时重新创建，旧的引用不能带到下一次显示
+        self.setProperty('dropAni', None)
+        self.setProperty('slideAni', None)
+
+        self.hide()
+        self.recycled.emit()
+
+    def _fadeOut(self):
+        """ 淡出 """
+        self.opacityAni.setDuration(200)
+        self.opacityAni.setStartValue(1)
+        self.opacityAni.setEndValue(0)
+        self.opacityAni.start()
+
+
+class NotificationService(QObject):
+    """ 通知服务
+
+    统一管理所有页面的 InfoBar：
+    - 同一 key 的连续通知合并到同一个消息条，例如 "已记录 12 个标记"
+    - 每个父部件同时显示的消息条数量有上限，超出的排队并限速显示
+    - 消息条关闭后回收到对象池，下次直接复用
+    """
+    MAX_VISIBLE = 3         # 每个父部件同时显示的消息条上限
+    MAX_QUEUED = 10         # 排队的通知上限，超出时丢弃最早的
+    RATE_INTERVAL = 150     # 排队通知的最小显示间隔（毫秒）
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pools = {}     # (父部件, 位置) -> 空闲消息条列表
+        self._visible = {}   # 父部件 -> 显示中的消息条列表
+        self._bursts = {}    # (父部件, key) -> [消息条, 次数]
+        self._queue = deque(maxlen=self.MAX_QUEUED)
+        self._queueTimer = None
+
+    def info(self, title, content, parent, **kwargs):
+        return self.notify(InfoBarIcon.INFORMATION, title, content, parent, **kwargs)
+
+    def success(self, title, content, parent, **kwargs):
+        return self.notify(InfoBarIcon.SUCCESS, title, content, parent, **kwargs)
+
+    def warning(self, title, content, parent, **kwargs):
+        return self.notify(InfoBarIcon.WARNING, title, content, parent, **kwargs)
+
+    def error(self, title, content, parent, **kwargs):
+        return self.notify(InfoBarIcon.ERROR, title, content, parent, **kwargs)
+
+    def notify(self, icon, title, content, parent, duration=2000,
+               position=InfoBarPosition.TOP_RIGHT, key=None, summary=None):
+        """ 显示通知
+
+        Parameters
+        ----------
+        key: str
+            合并键，同一父部件下 key 相同且消息条仍在显示时，合并为一条
+
+        summary: str
+            合并后的标题模板，可使用 {count}，例如 "已记录 {count} 个标记"
+        """
+        if key is not None:
+            bar = self._mergeBurst(icon, title, content, parent, duration, key, summary, 1)
+            if bar is not None:
+                return bar
+
+            # 同一 key 的通知还在排队时合并到排队项，显示时标题带上合并的次数
+            for item in self._queue:
+                if item[3] is parent and item[6] == key:
+                    item[0:3] = icon, title, content
+                    item[4], item[7] = duration, summary
+                    item[8] += 1
+                    return None
+
+        # 已有排队的通知时也要排队，保证同一父部件下的显示顺序
+        queued = any(item[3] is parent for item in self._queue)
+        if queued or len(self._liveBars(parent)) >= self.MAX_VISIBLE:
+            self._queue.append([icon, title, content, parent, duration, position, key, summary, 1])
+            self._startQueueTimer()
+            return None
+
+        return self._show(icon, title, content, parent, duration, position, key, summary, 1)
+
+    def _mergeBurst(self, icon, title, content, parent, duration, key, summary, count):
+        """ 合并到同一 key 显示中的消息条，没有时返回 None """
+        burst = self._bursts.get((parent, key))
+        if not burst or burst[0].isHidden():
+            return None
+
+        burst[1] += count
+        if summary:
+            title = summary.format(count=burst[1])
+        burst[0].rebind(icon, title, content, duration)
+        return burst[0]
+
+    def _show(self, icon, title, content, parent, duration, position, key, summary, count):
+        """ 从对象池取出消息条并显示，count 为排队期间合并的通知条数 """
+        if count > 1 and summary:
+            title = summary.format(count=count)
+
+        bar = self._acquire(parent, position)
+        bar.rebind(icon, title, content, duration)
+        bar.show()
+        bar.raise_()
+
+        self._liveBars(parent).append(bar)
+        if key is not None:
+            self._bursts[(parent, key)] = [bar, count]
+        return bar
+
+    def _acquire(self, parent, position):
+        """ 取出空闲消息条，池为空时创建 """
+        pool = self._pools.setdefault((parent, position), [])
+        while pool:
+            bar = pool.pop()
+            if not sip.isdeleted(bar):
+                return bar
+
+        bar = PooledInfoBar(InfoBarIcon.INFORMATION, "", "", position, parent)
+        bar.recycled.connect(lambda b=bar, k=(parent, position): self._release(b, k))
+        return bar
+
+    def _release(self, bar, poolKey):
+        """ 回收消息条 """
+        parent = poolKey[0]
+        bars = self._liveBars(parent)
+        if bar in bars:
+            bars.remove(bar)
+
+        for burstKey, burst in list(self._bursts.items()):
+            if burst[0] is bar:
+                del self._bursts[burstKey]
+
+        pool = self._pools.setdefault(poolKey, [])
+        if bar not in pool:
+            pool.append(bar)
+        self._startQueueTimer()
+
+    def _liveBars(self, parent):
+        """ 父部件下显示中的消息条 """
+        bars = self._visible.setdefault(parent, [])
+        bars[:] = [b for b in bars if not sip.isdeleted(b)]
+        return bars
+
+    def _startQueueTimer(self):
+        """ 限速处理排队的通知 """
+        if not self._queue:
+            return
+
+        if self._queueTimer is None:
+            self._queueTimer = QTimer(self)
+            self._queueTimer.setSingleShot(True)
+            self._queueTimer.timeout.connect(self._drainQueue)
+
+        if not self._queueTimer.isActive():
+            self._queueTimer.start(self.RATE_INTERVAL)
+
+    def _drainQueue(self):
+        """ 显示一条排队的通知，没有空位时等待消息条回收后再处理 """
+        for i, item in enumerate(self._queue):
+            parent = item[3]
+            if sip.isdeleted(parent):
+                del self._queue[i]
+                break
+
+            # 排队期间同一 key 的消息条又显示出来时直接合并，不占用新的位置
+            icon, title, content, parent, duration, position, key, summary, count = item
+            if key is not None and self._mergeBurst(icon, title, content, parent, duration, key, summary, count):
+                del self._queue[i]
+                break
+
+            if len(self._liveBars(parent)) < self.MAX_VISIBLE:
+                del self._queue[i]
+                self._show(*item)
+                break
+        else:
+            return
+
+        self._startQueueTimer()
+
+    def clear(self):
+        """ 关闭所有显示中的消息条并清空队列 """
+        self._queue.clear()
+        for parent in list(self._visible):
+            for bar in list(self._liveBars(parent)):
+                bar.close()
+
+
+notificationService = NotificationService()
@@ -11,4 +11,8 @@ print("gif_path:", gif_path)
 qss_path = os.path.join(script_path, "resource", "qss")
 print("qss_path:", qss_path)
 icon_path = os.path.join(script_path, "resource", "images", "penguin.ico")
-print ("icon_path:", icon_path)
\ No newline at end of file
+print ("icon_path:", icon_path)
+data_path = os.path.join(script_path, "data") # 用户数据目录
+print("data_path:", data_path)
+i18n_path = os.path.join(script_path, "resource", "i18n") # 翻译目录
+print("i18n_path:", i18n_path)
\ No newline at end of file
@@ -0,0 +1,115 @@
+import calendar
+import itertools
+from datetime import date, timedelta
+from enum import Enum
+
+from PyQt6.QtCore import QCoreApplication
+
+
+class Frequency(Enum):
+    """ 重复方式 """
+    DAILY = "daily"          # 每天
+    WEEKDAYS = "weekdays"    # 工作日（周一至周五）
+    EVERY_N_DAYS = "every"   # 每 N 天
+    MONTHLY = "monthly"      # 每月某日，当月没有该日时取月末
+
+
+class RecurrenceRule:
+    """ 重复任务规则
+
+    只保存规则本身，不保存展开后的每一天；需要某个日期范围内的任务时
+    再调用 occurrences() 按需生成，规则跨度再长也不占用额外空间。
+    """
+    __slots__ = ("id", "name", "frequency", "start", "interval", "day", "until", "skipped", "tags")
+    _ids = itertools.count(1)
+
+    def __init__(self, name, frequency, start=None, interval=1, day=None, until=None):
+        self.id = next(RecurrenceRule._ids)
+        self.name = name
+        self.frequency = frequency
+        self.start = start or date.today()
+        self.interval = max(int(interval), 1)  # 每 N 天的 N
+        self.day = day or self.start.day       # 每月的第几天
+        self.until = until                     # 结束日期（包含），None 表示不结束
+        self.skipped = set()                   # 单独删除的日期
+        self.tags = set()                      # 展开出的任务带有的标签
+
+    def occursOn(self, day):
+        """ 某一天是否有任务，O(1) """
+        if day < self.start or (self.until and day > self.until) or day in self.skipped:
+            return False
+
+        if self.frequency == Frequency.DAILY:
+            return True
+        if self.frequency == Frequency.WEEKDAYS:
+            return day.weekday() < 5
+        if self.frequency == Frequency.EVERY_N_DAYS:
+            return (day - self.start).days % self.interval == 0
+        return day.day == self._monthDay(day.year, day.month)
+
+    def occurrences(self, start, end):
+        """ 按需生成 [start, end] 范围内的日期（惰性生成器） """
+        start = max(start, self.start)
+        if self.until:
+            end = min(end, self.until)
+
+        for day in self._candidates(start, end):
+            if day not in self.skipped and (self.frequency != Frequency.WEEKDAYS or day.weekday() < 5):
+                yield day
+
+    def _candidates(self, start, end):
+        """ 跳过不可能的日期，直接枚举候选日期 """
+        if start > end:
+            return
+
+        if self.frequency == Frequency.EVERY_N_DAYS:
+            # 对齐到第一个满足间隔的日期
+            offset = -(start - self.start).days % self.interval
+            if offset > (end - start).days:
+                return
+            step = timedelta(days=self.interval)
+            day = start + timedelta(days=offset)
+            while day <= end:
+                yield day
+                if end - day < step:  # 下一步越过 end（也避免越过 date.max）
+                    return
+                day += step
+
+        elif self.frequency == Frequency.MONTHLY:
+            year, month = start.year, start.month
+            while (year, month) <= (end.year, end.month):
+                day = date(year, month, self._monthDay(year, month))
+                if day > end:
+                    return
+                if day >= start:
+                    yield day
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        else:
+            step = timedelta(days=1)
+            day = start
+            while day <= end:
+                yield day
+                if end - day < step:  # 下一步越过 end（也避免越过 date.max）
+                    return
+                day += step
+
+    def _monthDay(self, year, month):
+        """ 当月实际的提醒日，超过月末时取月末 """
+        return min(self.day, calendar.monthrange(year, month)[1])
+
+    def nextOccurrence(self, after):
+        """ after 之后（不含）的下一次日期，没有时返回 None """
+        if after >= date.max:
+            return None
+        return next(self.occurrences(after + timedelta(days=1), date.max), None)
+
+    def describe(self):
+        """ 规则的描述，使用当前界面语言 """
+        if self.frequency == Frequency.DAILY:
+            return QCoreApplication.translate("RecurrenceRule", "每天")
+        if self.frequency == Frequency.WEEKDAYS:
+            return QCoreApplication.translate("RecurrenceRule", "工作日")
+        if self.frequency == Frequency.EVERY_N_DAYS:
+            return QCoreApplication.translate("RecurrenceRule", "每 {0} 天").format(self.interval)
+        return QCoreApplication.translate("RecurrenceRule", "每月 {0} 日").format(self.day)
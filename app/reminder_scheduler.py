@@ -0,0 +1,146 @@
+import heapq
+import itertools
+from datetime import datetime, timedelta
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+from timekeeper import timekeeper
+
+
+class Reminder:
+    """ 提醒项 """
+    __slots__ = ("key", "when", "repeat", "payload", "cancelled")
+
+    def __init__(self, key, when, repeat=None, payload=None):
+        self.key = key
+        self.when = when          # 下一次提醒时间
+        self.repeat = repeat      # 重复间隔（timedelta），None 表示只提醒一次
+        self.payload = payload    # 附带的数据，例如任务
+        self.cancelled = False
+
+
+class ReminderScheduler(QObject):
+    """ 提醒调度器
+
+    所有提醒放在一个按时间排序的小根堆中，只为堆顶的提醒设置一个单次定时器。
+    插入 O(log n)；取消时只做标记（惰性删除），堆中失效项过多时再整体重建。
+
+    系统睡眠期间单调时钟不前进，定时器会比预期晚触发；墙上时钟跳变时定时器也不会跟着调整。
+    计时基准检测到这两种情况时立即用墙上时钟重新检查；此外每次最多等待 MAX_SLEEP 就重新设置一次定时器，
+    即使没有收到通知，唤醒后的补发最多也只晚几分钟。没有待触发的提醒时不设置定时器。
+    唤醒后把所有过期的提醒一次补发，重复提醒错过的多次只补发一次并跳到下一个未来时间点。
+    """
+    reminderDue = pyqtSignal(object, object, bool)  # (提醒, 本次提醒时间, 是否为错过后的补发)
+
+    MAX_SLEEP = 5 * 60 * 1000   # 最长等待时间（毫秒），到期后按墙上时钟重新设置
+    GRACE = timedelta(minutes=1)  # 超过该时长才算错过
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._heap = []          # [(提醒时间, 序号, 提醒)]
+        self._reminders = {}     # key -> 提醒
+        self._counter = itertools.count()
+        self._timer = None
+        timekeeper.suspended.connect(self._onClockChanged)
+        timekeeper.clockJumped.connect(self._onClockChanged)
+
+    def schedule(self, key, when, repeat=None, payload=None):
+        """ 添加提醒，同一 key 的旧提醒会被替换 """
+        self._cancel(key)
+        reminder = Reminder(key, when, repeat, payload)
+        self._reminders[key] = reminder
+        self._push(reminder)
+        self._arm()
+        return reminder
+
+    def cancel(self, key):
+        """ 取消提醒 """
+        if self._cancel(key):
+            self._arm()
+
+    def get(self, key):
+        return self._reminders.get(key)
+
+    def pending(self):
+        """ 未触发的提醒数量 """
+        return len(self._reminders)
+
+    def nextDue(self):
+        """ 最近一次提醒时间 """
+        self._dropCancelled()
+        return self._heap[0][0] if self._heap else None
+
+    def clear(self):
+        self._heap.clear()
+        self._reminders.clear()
+        self._arm()
+
+    # ================ 堆维护 ================
+    def _push(self, reminder):
+        heapq.heappush(self._heap, (reminder.when, next(self._counter), reminder))
+
+    def _cancel(self, key):
+        reminder = self._reminders.pop(key, None)
+        if reminder is None:
+            return False
+
+        reminder.cancelled = True
+        # 失效项超过一半时重建堆，保证堆大小与有效提醒数同阶
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._reminders):
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+        return True
+
+    def _dropCancelled(self):
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+
+    # ================ 定时器 ================
+    def _arm(self):
+        """ 只为堆顶提醒设置定时器 """
+        due = self.nextDue()
+        if due is None:
+            if self._timer:
+                self._timer.stop()
+            return
+
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._timer.timeout.connect(self._onTimeout)
+
+        delay = (due - datetime.now()).total_seconds() * 1000
+        self._timer.start(int(min(max(delay, 0), self.MAX_SLEEP)))
+
+    def _onClockChanged(self, seconds):
+        """ 睡眠或时钟跳变：补发已到期的提醒，并按墙上时钟重新设置定时器 """
+        if self._heap:
+            self._onTimeout()
+
+    def _onTimeout(self):
+        """ 补发所有已到期的提醒 """
+        now = datetime.now()
+        fired = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, reminder = heapq.heappop(self._heap)
+            if reminder.cancelled:
+                continue
+
+            occurrence = reminder.when
+            missed = now - occurrence > self.GRACE
+            if reminder.repeat:
+                # 跳过睡眠期间错过的多次，直接计算下一个未来时间点
+                skipped = (now - occurrence) // reminder.repeat + 1
+                reminder.when = occurrence + skipped * reminder.repeat
+                self._push(reminder)
+            else:
+                del self._reminders[reminder.key]
+            fired.append((reminder, occurrence, missed))
+
+        self._arm()
+        for reminder, occurrence, missed in fired:
+            self.reminderDue.emit(reminder, occurrence, missed)
+
+
+reminderScheduler = ReminderScheduler()
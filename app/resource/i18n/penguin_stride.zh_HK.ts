@@ -0,0 +1,1461 @@
+<?xml version='1.0' encoding='utf-8'?>
+<TS version="2.1">
+  <context>
+    <name>AddTaskMessageBox</name>
+    <message>
+      <location filename="../../focus_interface.py" line="60" />
+      <source>不重复</source>
+      <translation>不重複</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="61" />
+      <source>每天</source>
+      <translation>每天</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="62" />
+      <source>工作日</source>
+      <translation>工作日</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="63" />
+      <source>每 N 天</source>
+      <translation>每 N 天</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="64" />
+      <source>每月今天</source>
+      <translation>每月今天</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="68" />
+      <source>添加任务</source>
+      <translation>新增任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="70" />
+      <source>输入任务名称</source>
+      <translation>輸入任務名稱</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="73" />
+      <source>标签（可选，用空格或逗号分隔）</source>
+      <translation>標籤（可選，用空格或逗號分隔）</translation>
+    </message>
+  </context>
+  <context>
+    <name>ArchiveMessageBox</name>
+    <message>
+      <location filename="../../focus_interface.py" line="239" />
+      <source>已归档任务</source>
+      <translation>已封存任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="240" />
+      <source>共 {0} 个任务</source>
+      <translation>共 {0} 個任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="252" />
+      <source>关闭</source>
+      <translation>關閉</translation>
+    </message>
+  </context>
+  <context>
+    <name>ArchiveModel</name>
+    <message>
+      <location filename="../../task_archive.py" line="139" />
+      <source>完成于 {0}</source>
+      <translation>完成於 {0}</translation>
+    </message>
+    <message>
+      <location filename="../../task_archive.py" line="142" />
+      <source>专注 {0} 分钟</source>
+      <translation>專注 {0} 分鐘</translation>
+    </message>
+  </context>
+  <context>
+    <name>BulkTagMessageBox</name>
+    <message>
+      <location filename="../../focus_interface.py" line="209" />
+      <source>修改标签</source>
+      <translation>修改標籤</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="210" />
+      <source>已选择 {0} 个任务</source>
+      <translation>已選取 {0} 個任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="212" />
+      <source>添加的标签（用空格或逗号分隔）</source>
+      <translation>新增的標籤（用空格或逗號分隔）</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="215" />
+      <source>移除的标签（用空格或逗号分隔）</source>
+      <translation>移除的標籤（用空格或逗號分隔）</translation>
+    </message>
+  </context>
+  <context>
+    <name>CommandPalette</name>
+    <message>
+      <location filename="../../command_palette.py" line="37" />
+      <source>Search pages, actions and tasks</source>
+      <translation>搜尋頁面、操作和任務</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="91" />
+      <source>Focus Time</source>
+      <translation>專注時段</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="93" />
+      <source>Stop Watch</source>
+      <translation>碼錶</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="95" />
+      <source>Settings</source>
+      <translation>設定</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="100" />
+      <source>End focus</source>
+      <translation>結束專注</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="100" />
+      <source>Start focus</source>
+      <translation>開始專注</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="102" />
+      <source>Add task</source>
+      <translation>新增任務</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="104" />
+      <source>Clear completed tasks</source>
+      <translation>清除已完成任務</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="106" />
+      <source>View archived tasks</source>
+      <translation>檢視已封存任務</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="108" />
+      <source>Start or pause stopwatch</source>
+      <translation>開始或暫停碼錶</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="110" />
+      <source>Record lap</source>
+      <translation>記錄標記</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="112" />
+      <source>Reset stopwatch</source>
+      <translation>重設碼錶</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="114" />
+      <source>Help</source>
+      <translation>說明</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="120" />
+      <source>Light theme</source>
+      <translation>淺色主題</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="121" />
+      <source>Dark theme</source>
+      <translation>深色主題</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="122" />
+      <source>Use system theme</source>
+      <translation>跟隨系統主題</translation>
+    </message>
+    <message>
+      <location filename="../../command_palette.py" line="132" />
+      <source>Use system language</source>
+      <translation>跟隨系統語言</translation>
+    </message>
+  </context>
+  <context>
+    <name>EditDailyTargetMB</name>
+    <message>
+      <location filename="../../focus_interface.py" line="47" />
+      <source>每日目标分钟数</source>
+      <translation>每日目標分鐘數</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="52" />
+      <source>确定</source>
+      <translation>確定</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="53" />
+      <source>取消</source>
+      <translation>取消</translation>
+    </message>
+  </context>
+  <context>
+    <name>EditTaskMessageBox</name>
+    <message>
+      <location filename="../../focus_interface.py" line="116" />
+      <source>编辑任务</source>
+      <translation>編輯任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="121" />
+      <source>标签（用空格或逗号分隔）</source>
+      <translation>標籤（用空格或逗號分隔）</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="129" />
+      <source>不预估时长</source>
+      <translation>不預估時長</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="130" />
+      <source> 分钟</source>
+      <translation> 分鐘</translation>
+    </message>
+  </context>
+  <context>
+    <name>FocusInterface</name>
+    <message>
+      <location filename="../../focus_interface.py" line="868" />
+      <location filename="../../focus_interface.py" line="505" />
+      <source>迷你计时器</source>
+      <translation>迷你計時器</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1152" />
+      <location filename="../../focus_interface.py" line="1110" />
+      <location filename="../../focus_interface.py" line="874" />
+      <location filename="../../focus_interface.py" line="524" />
+      <source>已完成：{0} 分钟</source>
+      <translation>已完成：{0} 分鐘</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="530" />
+      <source>完成专注功能开发</source>
+      <translation>完成專注功能開發</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="531" />
+      <source>阅读《深度工作》一章</source>
+      <translation>閱讀《深度工作》一章</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="532" />
+      <source>整理今日笔记</source>
+      <translation>整理今日筆記</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="878" />
+      <location filename="../../focus_interface.py" line="542" />
+      <source>修改</source>
+      <translation>修改</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1450" />
+      <location filename="../../focus_interface.py" line="886" />
+      <location filename="../../focus_interface.py" line="879" />
+      <location filename="../../focus_interface.py" line="545" />
+      <source>删除</source>
+      <translation>刪除</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="880" />
+      <location filename="../../focus_interface.py" line="548" />
+      <source>设置提醒</source>
+      <translation>設定提醒</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="881" />
+      <location filename="../../focus_interface.py" line="551" />
+      <source>取消提醒</source>
+      <translation>取消提醒</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="884" />
+      <location filename="../../focus_interface.py" line="554" />
+      <source>专注此任务</source>
+      <translation>專注此任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="883" />
+      <location filename="../../focus_interface.py" line="557" />
+      <source>子任务</source>
+      <translation>子任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="882" />
+      <location filename="../../focus_interface.py" line="560" />
+      <source>停止重复</source>
+      <translation>停止重複</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="890" />
+      <location filename="../../focus_interface.py" line="563" />
+      <source>帮助</source>
+      <translation>說明</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="891" />
+      <location filename="../../focus_interface.py" line="582" />
+      <source>清除已完成任务</source>
+      <translation>清除已完成任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1942" />
+      <location filename="../../focus_interface.py" line="892" />
+      <location filename="../../focus_interface.py" line="585" />
+      <source>清除所有任务</source>
+      <translation>清除所有任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="893" />
+      <location filename="../../focus_interface.py" line="588" />
+      <source>已归档任务</source>
+      <translation>已封存任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="663" />
+      <source>{0} 分 {1} 秒</source>
+      <translation>{0} 分 {1} 秒</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1741" />
+      <location filename="../../focus_interface.py" line="664" />
+      <source>{0} 分钟</source>
+      <translation>{0} 分鐘</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="675" />
+      <source>第 {0}/{1} 轮专注</source>
+      <translation>第 {0}/{1} 輪專注</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="677" />
+      <source>第 {0}/{1} 轮后的长休息</source>
+      <translation>第 {0}/{1} 輪後的長休息</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="679" />
+      <source>第 {0}/{1} 轮后的休息</source>
+      <translation>第 {0}/{1} 輪後的休息</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="681" />
+      <source>{0}，预计 {1} 结束。</source>
+      <translation>{0}，預計 {1} 結束。</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="684" />
+      <source>共 {0} 轮，每轮专注 {1}，你将没有休息时间。</source>
+      <translation>共 {0} 輪，每輪專注 {1}，你將沒有休息時間。</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="687" />
+      <source>共 {0} 轮，每轮专注 {1}，休息 {2} 分钟，每 {3} 轮长休息 {4} 分钟。</source>
+      <translation>共 {0} 輪，每輪專注 {1}，休息 {2} 分鐘，每 {3} 輪長休息 {4} 分鐘。</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="692" />
+      <source>共 {0} 轮，每轮专注 {1}，休息 {2} 分钟。</source>
+      <translation>共 {0} 輪，每輪專注 {1}，休息 {2} 分鐘。</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="709" />
+      <source>错误</source>
+      <translation>錯誤</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="710" />
+      <source>请设置有效的专注时间</source>
+      <translation>請設定有效的專注時間</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1035" />
+      <location filename="../../focus_interface.py" line="875" />
+      <location filename="../../focus_interface.py" line="723" />
+      <source>结束专注</source>
+      <translation>結束專注</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="781" />
+      <location filename="../../focus_interface.py" line="733" />
+      <source>专注进行中</source>
+      <translation>專注進行中</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="733" />
+      <source>保持专注，不要分心</source>
+      <translation>保持專注，不要分心</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="757" />
+      <source>剩余休息时间: {0}</source>
+      <translation>剩餘休息時間: {0}</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="762" />
+      <source>已专注: {0}</source>
+      <translation>已專注: {0}</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="777" />
+      <source>长休息时间</source>
+      <translation>長休息時間</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="777" />
+      <source>离开屏幕走一走，好好恢复精力</source>
+      <translation>離開螢幕走一走，好好恢復精力</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="779" />
+      <source>休息时间</source>
+      <translation>休息時間</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="779" />
+      <source>站起来活动一下，放松眼睛</source>
+      <translation>站起來活動一下，放鬆眼睛</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="781" />
+      <source>休息结束，继续专注</source>
+      <translation>休息結束，繼續專注</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="857" />
+      <source>每日进度</source>
+      <translation>每日進度</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="858" />
+      <source>昨天</source>
+      <translation>昨天</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="859" />
+      <source>分钟</source>
+      <translation>分鐘</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="860" />
+      <source>今日计划</source>
+      <translation>今日計劃</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="861" />
+      <source>连续达标日</source>
+      <translation>連續達標日</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="862" />
+      <source>天</source>
+      <translation>天</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="863" />
+      <source>任务</source>
+      <translation>任務</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="864" />
+      <source>专注时段</source>
+      <translation>專注時段</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="865" />
+      <source>准备专注</source>
+      <translation>準備專注</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="866" />
+      <source>我们将在每个会话期间关闭通知和应用警报。对于较长的会话，我们将添加简短的休息时间，以便你可以恢复精力。</source>
+      <translation>我們將在每個工作階段期間關閉通知和應用程式警示。對於較長的工作階段，我們將新增簡短的休息時間，以便你可以恢復精力。</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="867" />
+      <source>跳过休息</source>
+      <translation>跳過休息</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1170" />
+      <location filename="../../focus_interface.py" line="871" />
+      <source>目标 {0} 分钟</source>
+      <translation>目標 {0} 分鐘</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <location filename="../../focus_interface.py" line="1064" />
+      <location filename="../../focus_interface.py" line="875" />
+      <source>启动专注时段</source>
+      <translation>啟動專注時段</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1445" />
+      <location filename="../../focus_interface.py" line="885" />
+      <source>标记完成</source>
+      <translation>標記完成</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1446" />
+      <location filename="../../focus_interface.py" line="885" />
+      <source>重新打开</source>
+      <translation>重新開啟</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1447" />
+      <location filename="../../focus_interface.py" line="885" />
+      <source>修改标签</source>
+      <translation>修改標籤</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1448" />
+      <location filename="../../focus_interface.py" line="886" />
+      <source>移到顶部</source>
+      <translation>移到頂部</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1449" />
+      <location filename="../../focus_interface.py" line="886" />
+      <source>移到底部</source>
+      <translation>移到底部</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1451" />
+      <location filename="../../focus_interface.py" line="887" />
+      <source>取消选择</source>
+      <translation>取消選取</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1629" />
+      <location filename="../../focus_interface.py" line="894" />
+      <source>全部匹配</source>
+      <translation>全部符合</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1629" />
+      <location filename="../../focus_interface.py" line="895" />
+      <source>任一匹配</source>
+      <translation>任一符合</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="967" />
+      <source>专注被中断</source>
+      <translation>專注被中斷</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="968" />
+      <source>上次的专注在 {0} 意外中断，已专注 {1}。要继续这次专注，还是把已专注的时间计入今天？</source>
+      <translation>上次的專注在 {0} 意外中斷，已專注 {1}。要繼續這次專注，還是把已專注的時間計入今天？</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="972" />
+      <source>继续专注</source>
+      <translation>繼續專注</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="973" />
+      <source>计入已完成</source>
+      <translation>計入已完成</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1036" />
+      <source>确定要结束当前的专注吗？</source>
+      <translation>確定要結束目前的專注嗎？</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1039" />
+      <source>是，结束专注</source>
+      <translation>是，結束專注</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1040" />
+      <source>不，继续专注</source>
+      <translation>不，繼續專注</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1086" />
+      <source>本次专注时长: {0}</source>
+      <translation>本次專注時長: {0}</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1088" />
+      <source>{0} 累计专注 {1}</source>
+      <translation>{0} 累計專注 {1}</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1091" />
+      <source>专注完成</source>
+      <translation>專注完成</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1116" />
+      <source>目标达成</source>
+      <translation>目標達成</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1117" />
+      <source>恭喜你完成了今日 {0} 分钟的专注目标！</source>
+      <translation>恭喜你完成了今日 {0} 分鐘的專注目標！</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1162" />
+      <source>设置每日目标</source>
+      <translation>設定每日目標</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1163" />
+      <source>当前目标为 {0} 分钟，请输入新的每日专注目标分钟数</source>
+      <translation>目前目標為 {0} 分鐘，請輸入新的每日專注目標分鐘數</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1176" />
+      <source>目标已更新</source>
+      <translation>目標已更新</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1177" />
+      <source>每日目标已设置为 {0} 分钟</source>
+      <translation>每日目標已設定為 {0} 分鐘</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1297" />
+      <source>任务已完成</source>
+      <translation>任務已完成</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1313" />
+      <location filename="../../focus_interface.py" line="1303" />
+      <source>已更新 {count} 个任务状态</source>
+      <translation>已更新 {count} 個任務狀態</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1307" />
+      <source>任务未完成</source>
+      <translation>任務未完成</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1340" />
+      <source>修改成功</source>
+      <translation>修改成功</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1341" />
+      <source>任务已修改为：{0}</source>
+      <translation>任務已修改為：{0}</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1578" />
+      <location filename="../../focus_interface.py" line="1355" />
+      <source>删除成功</source>
+      <translation>刪除成功</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1356" />
+      <source>已删除任务：{0}</source>
+      <translation>已刪除任務：{0}</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1361" />
+      <source>已删除 {count} 个任务</source>
+      <translation>已刪除 {count} 個任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1373" />
+      <source>重复任务已添加</source>
+      <translation>重複任務已新增</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1381" />
+      <source>任务已添加</source>
+      <translation>任務已新增</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1382" />
+      <source>已添加任务：{0}</source>
+      <translation>已新增任務：{0}</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1387" />
+      <source>已添加 {count} 个任务</source>
+      <translation>已新增 {count} 個任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1469" />
+      <source>已选择 {0} 项</source>
+      <translation>已選取 {0} 項</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1563" />
+      <source>批量操作完成</source>
+      <translation>批次操作完成</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1564" />
+      <source>已完成 {0} 个任务</source>
+      <translation>已完成 {0} 個任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1564" />
+      <source>已重新打开 {0} 个任务</source>
+      <translation>已重新開啟 {0} 個任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1579" />
+      <source>已删除 {0} 个任务</source>
+      <translation>已刪除 {0} 個任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1716" />
+      <source>已切换专注任务</source>
+      <translation>已切換專注任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1740" />
+      <source>{0}/{1} 分钟</source>
+      <translation>{0}/{1} 分鐘</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1758" />
+      <source>提醒已设置</source>
+      <translation>提醒已設定</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1805" />
+      <source>错过的提醒</source>
+      <translation>錯過的提醒</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1805" />
+      <source>任务提醒</source>
+      <translation>任務提醒</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1806" />
+      <source>{0}（截止 {1}）</source>
+      <translation>{0}（截止 {1}）</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1811" />
+      <source>{count} 个任务提醒</source>
+      <translation>{count} 個任務提醒</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1833" />
+      <source>已停止重复</source>
+      <translation>已停止重複</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1933" />
+      <location filename="../../focus_interface.py" line="1911" />
+      <source>提示</source>
+      <translation>提示</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1912" />
+      <source>没有已完成的任务</source>
+      <translation>沒有已完成的任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1955" />
+      <location filename="../../focus_interface.py" line="1922" />
+      <source>清理成功</source>
+      <translation>清理成功</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1923" />
+      <source>已清除 {0} 个已完成任务</source>
+      <translation>已清除 {0} 個已完成任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1934" />
+      <source>任务列表为空</source>
+      <translation>任務清單為空</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1943" />
+      <source>确定要清除所有任务吗？此操作不可撤销。</source>
+      <translation>確定要清除所有任務嗎？此操作無法復原。</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1956" />
+      <source>已清除所有 {0} 个任务</source>
+      <translation>已清除所有 {0} 個任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1891" />
+      <source>没有后续日期</source>
+      <translation>沒有後續日期</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="1892" />
+      <source>接下来：{0}</source>
+      <translation>接下來：{0}</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="2084" />
+      <source>截止 {0}</source>
+      <translation>截止 {0}</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="2101" />
+      <source>没有任务，点击 + 添加新任务</source>
+      <translation>沒有任務，點擊 + 新增任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="2106" />
+      <source>筛选出 {0} 个任务（共 {1} 个，已完成 {2} 个）</source>
+      <translation>篩選出 {0} 個任務（共 {1} 個，已完成 {2} 個）</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="2109" />
+      <source>共 {0} 个任务，已完成 {1} 个</source>
+      <translation>共 {0} 個任務，已完成 {1} 個</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>Form</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>3</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>目标 120 分钟</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>已完成：0 分钟</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>5</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>为会话选择任务</source>
+      <translation>為工作階段選擇任務</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>下载我家 aiko 的新歌『荒れた唇は恋を失くす』</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>上传我家 aiko 的 MV『シアワセ』</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>全军出🐔，誓死保卫鸽鸽🏀！！</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>你将没有休息时间。</source>
+      <translation>你將沒有休息時間。</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>Mr.Xia</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>Just</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>Drinking</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>Tea</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/FocusInterface.ui" line="0" />
+      <source>🍵🍵🍵</source>
+      <translation type="unfinished" />
+    </message>
+  </context>
+  <context>
+    <name>Form</name>
+    <message>
+      <location filename="../../interfaces/login.ui" line="0" />
+      <location filename="../../interfaces/login.ui" line="0" />
+      <source>Log In</source>
+      <translation>登入</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/login.ui" line="0" />
+      <source>Login Here</source>
+      <translation>在此登入</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/login.ui" line="0" />
+      <source>Username</source>
+      <translation>使用者名稱</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/login.ui" line="0" />
+      <source>Password</source>
+      <translation>密碼</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/login.ui" line="0" />
+      <source>Remember me</source>
+      <translation>記住我</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/login.ui" line="0" />
+      <source>Guest Mode</source>
+      <translation>訪客模式</translation>
+    </message>
+  </context>
+  <context>
+    <name>LoginWindow</name>
+    <message>
+      <location filename="../../Login_page.py" line="88" />
+      <source>访客</source>
+      <translation>訪客</translation>
+    </message>
+    <message>
+      <location filename="../../Login_page.py" line="97" />
+      <source>请输入用户名</source>
+      <translation>請輸入使用者名稱</translation>
+    </message>
+    <message>
+      <location filename="../../Login_page.py" line="101" />
+      <source>请输入密码</source>
+      <translation>請輸入密碼</translation>
+    </message>
+    <message>
+      <location filename="../../Login_page.py" line="108" />
+      <source>用户名或密码错误</source>
+      <translation>使用者名稱或密碼錯誤</translation>
+    </message>
+    <message>
+      <location filename="../../Login_page.py" line="113" />
+      <source>登录失败</source>
+      <translation>登入失敗</translation>
+    </message>
+  </context>
+  <context>
+    <name>MainWindow</name>
+    <message>
+      <location filename="../../MainWindow.py" line="324" />
+      <location filename="../../MainWindow.py" line="96" />
+      <source>Focus Time</source>
+      <translation>專注時段</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="325" />
+      <location filename="../../MainWindow.py" line="99" />
+      <source>Stop Watch</source>
+      <translation>碼錶</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="326" />
+      <location filename="../../MainWindow.py" line="103" />
+      <source>Settings</source>
+      <translation>設定</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="334" />
+      <location filename="../../MainWindow.py" line="330" />
+      <location filename="../../MainWindow.py" line="285" />
+      <location filename="../../MainWindow.py" line="116" />
+      <source>Help</source>
+      <translation>說明</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="125" />
+      <source>Welcome</source>
+      <translation>歡迎</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="126" />
+      <source>Welcome back, {0}!</source>
+      <translation>歡迎回來，{0}！</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="332" />
+      <location filename="../../MainWindow.py" line="195" />
+      <source>Show main window</source>
+      <translation>顯示主視窗</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="333" />
+      <location filename="../../MainWindow.py" line="197" />
+      <source>Quit</source>
+      <translation>結束</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="211" />
+      <source>Missed reminder</source>
+      <translation>錯過的提醒</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="211" />
+      <source>Task reminder</source>
+      <translation>任務提醒</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="247" />
+      <location filename="../../MainWindow.py" line="245" />
+      <source>Focusing</source>
+      <translation>專注中</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="247" />
+      <source>On break</source>
+      <translation>休息中</translation>
+    </message>
+    <message>
+      <location filename="../../MainWindow.py" line="249" />
+      <source>{0} until {1}</source>
+      <translation>{0}，至 {1}</translation>
+    </message>
+  </context>
+  <context>
+    <name>MiniTimerWindow</name>
+    <message>
+      <location filename="../../mini_timer.py" line="133" />
+      <source>准备专注</source>
+      <translation>準備專注</translation>
+    </message>
+    <message>
+      <location filename="../../mini_timer.py" line="136" />
+      <source>第 {0}/{1} 轮</source>
+      <translation>第 {0}/{1} 輪</translation>
+    </message>
+    <message>
+      <location filename="../../mini_timer.py" line="139" />
+      <source>长休息</source>
+      <translation>長休息</translation>
+    </message>
+    <message>
+      <location filename="../../mini_timer.py" line="141" />
+      <source>休息</source>
+      <translation>休息</translation>
+    </message>
+    <message>
+      <location filename="../../mini_timer.py" line="142" />
+      <source>专注</source>
+      <translation>專注</translation>
+    </message>
+  </context>
+  <context>
+    <name>RecurrenceRule</name>
+    <message>
+      <location filename="../../recurrence.py" line="102" />
+      <source>每天</source>
+      <translation>每天</translation>
+    </message>
+    <message>
+      <location filename="../../recurrence.py" line="104" />
+      <source>工作日</source>
+      <translation>工作日</translation>
+    </message>
+    <message>
+      <location filename="../../recurrence.py" line="106" />
+      <source>每 {0} 天</source>
+      <translation>每 {0} 天</translation>
+    </message>
+    <message>
+      <location filename="../../recurrence.py" line="107" />
+      <source>每月 {0} 日</source>
+      <translation>每月 {0} 日</translation>
+    </message>
+  </context>
+  <context>
+    <name>ReminderMessageBox</name>
+    <message>
+      <location filename="../../focus_interface.py" line="258" />
+      <source>准时提醒</source>
+      <translation>準時提醒</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="259" />
+      <source>提前 5 分钟</source>
+      <translation>提前 5 分鐘</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="260" />
+      <source>提前 15 分钟</source>
+      <translation>提前 15 分鐘</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="261" />
+      <source>提前 1 小时</source>
+      <translation>提前 1 小時</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="262" />
+      <source>不重复</source>
+      <translation>不重複</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="263" />
+      <source>每天</source>
+      <translation>每天</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="264" />
+      <source>每周</source>
+      <translation>每週</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="268" />
+      <source>设置提醒</source>
+      <translation>設定提醒</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="296" />
+      <source>确定</source>
+      <translation>確定</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="297" />
+      <source>取消</source>
+      <translation>取消</translation>
+    </message>
+  </context>
+  <context>
+    <name>SettingInterface</name>
+    <message>
+      <location filename="../../setting_interface.py" line="25" />
+      <source>Settings</source>
+      <translation>設定</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="28" />
+      <source>Personalization</source>
+      <translation>個人化</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="31" />
+      <source>Mica effect</source>
+      <translation>雲母效果</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="32" />
+      <source>Apply semi transparent to windows and surfaces</source>
+      <translation>視窗和表面顯示半透明</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="39" />
+      <source>Application theme</source>
+      <translation>應用程式主題</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="40" />
+      <source>Change the appearance of your application</source>
+      <translation>調整你的應用程式外觀</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="42" />
+      <source>Light</source>
+      <translation>淺色</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="42" />
+      <source>Dark</source>
+      <translation>深色</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="61" />
+      <location filename="../../setting_interface.py" line="43" />
+      <source>Use system setting</source>
+      <translation>跟隨系統設定</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="51" />
+      <source>Theme color</source>
+      <translation>主題色</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="52" />
+      <source>Change the theme color of you application</source>
+      <translation>調整你的應用程式主題色</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="59" />
+      <source>Language</source>
+      <translation>語言</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="60" />
+      <source>Set your preferred language for UI</source>
+      <translation>設定介面的偏好語言</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="66" />
+      <source>Main Panel</source>
+      <translation>主介面</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="69" />
+      <source>Minimize to tray after closing</source>
+      <translation>關閉後最小化到系統匣</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="70" />
+      <source>PyQt-Fluent-Widgets will continue to run in the background</source>
+      <translation>PyQt-Fluent-Widgets 將在背景繼續執行</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="76" />
+      <source>Local automation API</source>
+      <translation>本機自動化介面</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="77" />
+      <source>Serve JSON-RPC and focus events on 127.0.0.1 for scripts and tools</source>
+      <translation>在 127.0.0.1 上為腳本和工具提供 JSON-RPC 和專注事件</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="84" />
+      <source>Archive completed tasks after days</source>
+      <translation>已完成任務封存天數</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="85" />
+      <source>Completed tasks older than this move to the archive, 0 keeps them in the list</source>
+      <translation>完成超過該天數的任務移到封存，0 表示保留在清單中</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="90" />
+      <source>Focus sessions</source>
+      <translation>專注時段</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="94" />
+      <source>Focus cycles</source>
+      <translation>專注輪數</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="95" />
+      <source>Number of focus rounds in one session</source>
+      <translation>一次專注包含的輪數</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="101" />
+      <source>Short break minutes</source>
+      <translation>短休息分鐘數</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="102" />
+      <source>Break after each focus round</source>
+      <translation>每輪專注之後的休息</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="108" />
+      <source>Long break minutes</source>
+      <translation>長休息分鐘數</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="109" />
+      <source>Longer break that replaces the short one every few rounds</source>
+      <translation>每隔幾輪用較長的休息代替短休息</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="115" />
+      <source>Long break every rounds</source>
+      <translation>長休息間隔輪數</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="116" />
+      <source>Take a long break after this many focus rounds</source>
+      <translation>每專注這麼多輪後長休息一次</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="121" />
+      <source>About</source>
+      <translation>關於</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="124" />
+      <source>Open help page</source>
+      <translation>開啟說明頁面</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="126" />
+      <source>Help</source>
+      <translation>說明</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="127" />
+      <source>Discover new features and learn useful tips about PyQt-Fluent-Widgets</source>
+      <translation>探索新功能並了解 PyQt-Fluent-Widgets 的使用技巧</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="199" />
+      <source>Updated successfully</source>
+      <translation>更新成功</translation>
+    </message>
+    <message>
+      <location filename="../../setting_interface.py" line="200" />
+      <source>Configuration takes effect after restart</source>
+      <translation>設定在重新啟動後生效</translation>
+    </message>
+  </context>
+  <context>
+    <name>StopWatchGroup</name>
+    <message>
+      <location filename="../../stopwatch_group.py" line="80" />
+      <source>秒表 {0}</source>
+      <translation>碼錶 {0}</translation>
+    </message>
+  </context>
+  <context>
+    <name>StopWatchInterface</name>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="288" />
+      <location filename="../../stop_watch_interface.py" line="98" />
+      <source>Recordings</source>
+      <translation>記錄</translation>
+    </message>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="289" />
+      <location filename="../../stop_watch_interface.py" line="111" />
+      <source>添加秒表</source>
+      <translation>新增碼錶</translation>
+    </message>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="234" />
+      <source>（最佳 {0}）</source>
+      <translation>（最佳 {0}）</translation>
+    </message>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="240" />
+      <source>标记 #{0}</source>
+      <translation>標記 #{0}</translation>
+    </message>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="246" />
+      <source>已记录 {count} 个标记</source>
+      <translation>已記錄 {count} 個標記</translation>
+    </message>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="268" />
+      <source>计时器已重置</source>
+      <translation>計時器已重設</translation>
+    </message>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="269" />
+      <source>计时器已重置为零</source>
+      <translation>計時器已重設為零</translation>
+    </message>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="374" />
+      <source>时间记录</source>
+      <translation>時間記錄</translation>
+    </message>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="375" />
+      <source>记录的时间点列表</source>
+      <translation>記錄的時間點清單</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/StopWatchInterface.ui" line="0" />
+      <source>Form</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/StopWatchInterface.ui" line="0" />
+      <source>00:00:00</source>
+      <translation type="unfinished" />
+    </message>
+    <message>
+      <location filename="../../interfaces/StopWatchInterface.ui" line="0" />
+      <source>小时</source>
+      <translation>小時</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/StopWatchInterface.ui" line="0" />
+      <source>分钟</source>
+      <translation>分鐘</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/StopWatchInterface.ui" line="0" />
+      <source>秒</source>
+      <translation>秒</translation>
+    </message>
+    <message>
+      <location filename="../../interfaces/StopWatchInterface.ui" line="0" />
+      <source>PushButton</source>
+      <translation type="unfinished" />
+    </message>
+  </context>
+  <context>
+    <name>StopWatchRow</name>
+    <message>
+      <location filename="../../stop_watch_interface.py" line="67" />
+      <source>{0} 个标记</source>
+      <translation>{0} 個標記</translation>
+    </message>
+  </context>
+  <context>
+    <name>SubtaskMessageBox</name>
+    <message>
+      <location filename="../../focus_interface.py" line="152" />
+      <source>子任务</source>
+      <translation>子任務</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="164" />
+      <source>输入子任务名称，添加到选中的任务下</source>
+      <translation>輸入子任務名稱，新增到選取的任務下</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="167" />
+      <source>添加</source>
+      <translation>新增</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="169" />
+      <source>删除</source>
+      <translation>刪除</translation>
+    </message>
+    <message>
+      <location filename="../../focus_interface.py" line="183" />
+      <source>完成</source>
+      <translation>完成</translation>
+    </message>
+  </context>
+</TS>
\ No newline at end of file
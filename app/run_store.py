@@ -0,0 +1,166 @@
+""" 秒表历史记录
+
+每次重置有标记的秒表时，把这一轮的标记偏移量追加到二进制日志 runs.bin（小端）：
+    <d 时间戳> <Q 总时长> <H 名称字节数> <H 标记数> <名称 UTF-8> <Q 标记偏移量 * 标记数>
+时长和偏移量都是毫秒，64 位不会在 49 天后溢出。
+上次写到一半的记录在下一次追加前截断，不会挡住之后追加的记录。
+
+另外维护一个最佳分段索引 best.json：按秒表名称保存每个标记序号的最短累计时间。
+启动时只读取索引，记录新一轮时增量更新索引，查询某个标记与最佳成绩的差值是 O(1)，
+与历史记录的条数无关。索引丢失或损坏时从日志重建。
+"""
+import json
+import os
+import struct
+import time
+from array import array
+
+HEADER = struct.Struct("<dQHH")
+MAX_LAPS = 0xFFFF
+
+
+class StopWatchRun:
+    """ 一轮秒表记录 """
+    __slots__ = ("timestamp", "total", "name", "laps")
+
+    def __init__(self, timestamp, total, name, laps):
+        self.timestamp = timestamp
+        self.total = total
+        self.name = name
+        self.laps = laps   # array('Q')，累计毫秒
+
+
+class RunStore:
+    """ 秒表历史记录存储 """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.logPath = os.path.join(directory, "runs.bin")
+        self.indexPath = os.path.join(directory, "best.json")
+        self._best = None   # 名称 -> array('Q')，第 k 个标记的最短累计时间
+        self._count = 0     # 已记录的轮数
+        self._end = 0       # 最后一条完整记录的结束偏移，追加前截断到这里
+
+    # ================ 最佳分段索引 ================
+    def _index(self):
+        """ 首次使用时加载索引 """
+        if self._best is None:
+            if not self._loadIndex():
+                self.rebuildIndex()
+        return self._best
+
+    def _loadIndex(self):
+        try:
+            with open(self.indexPath, encoding='utf-8') as f:
+                data = json.load(f)
+            # 日志大小不一致说明索引过期
+            if data.get("logSize") != self._logSize():
+                return False
+            self._count = data["count"]
+            self._best = {name: array('Q', laps) for name, laps in data["best"].items()}
+            self._end = data["logSize"]
+            return True
+        except (OSError, ValueError, KeyError, TypeError, OverflowError):
+            return False
+
+    def _saveIndex(self):
+        os.makedirs(self.directory, exist_ok=True)
+        data = {
+            "logSize": self._logSize(),
+            "count": self._count,
+            "best": {name: laps.tolist() for name, laps in self._best.items()},
+        }
+        tmpPath = self.indexPath + ".tmp"
+        with open(tmpPath, "w", encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmpPath, self.indexPath)
+
+    def _logSize(self):
+        try:
+            return os.path.getsize(self.logPath)
+        except OSError:
+            return 0
+
+    def _merge(self, name, laps):
+        """ 用一轮记录更新最佳分段 """
+        best = self._best.setdefault(name, array('Q'))
+        for k, value in enumerate(laps):
+            if k < len(best):
+                if value < best[k]:
+                    best[k] = value
+            else:
+                best.append(value)
+
+    def rebuildIndex(self):
+        """ 扫描整个日志重建索引 """
+        self._best = {}
+        self._count = 0
+        self._end = 0
+        for run, end in self._scan():
+            self._merge(run.name, run.laps)
+            self._count += 1
+            self._end = end
+        if self._count:
+            self._saveIndex()
+
+    def best(self, name, lapIndex):
+        """ 第 lapIndex 个标记（从 0 开始）的最短累计时间，没有记录时返回 None """
+        best = self._index().get(name)
+        if best is None or lapIndex >= len(best):
+            return None
+        return best[lapIndex]
+
+    def delta(self, name, lapIndex, elapsed):
+        """ 与最佳成绩的差值（毫秒），负数表示更快 """
+        best = self.best(name, lapIndex)
+        return None if best is None else elapsed - best
+
+    def count(self):
+        self._index()
+        return self._count
+
+    # ================ 日志 ================
+    def append(self, name, laps, total):
+        """ 追加一轮记录并更新索引 """
+        laps = array('Q', laps[:MAX_LAPS])
+        nameBytes = name.encode('utf-8')[:0xFFFF]
+        self._index()
+
+        os.makedirs(self.directory, exist_ok=True)
+        record = HEADER.pack(time.time(), total, len(nameBytes), len(laps)) + nameBytes + struct.pack(f"<{len(laps)}Q", *laps)
+        with open(self.logPath, "ab") as f:
+            # 上次写到一半的记录从最后一条完整记录的末尾截断重写
+            f.truncate(self._end)
+            f.write(record)
+        self._end += len(record)
+
+        self._merge(name, laps)
+        self._count += 1
+        self._saveIndex()
+
+    def runs(self):
+        """ 依次读取所有记录，日志末尾不完整的记录会被忽略 """
+        for run, _ in self._scan():
+            yield run
+
+    def _scan(self):
+        """ 依次读取记录，同时给出每条记录的结束偏移 """
+        try:
+            f = open(self.logPath, "rb")
+        except OSError:
+            return
+
+        with f:
+            while True:
+                data = f.read(HEADER.size)
+                if len(data) < HEADER.size:
+                    return
+                timestamp, total, nameSize, lapCount = HEADER.unpack(data)
+                lapStruct = struct.Struct(f"<{lapCount}Q")
+                nameBytes = f.read(nameSize)
+                data = f.read(lapStruct.size)
+                if len(nameBytes) < nameSize or len(data) < lapStruct.size:
+                    return
+                laps = array('Q', lapStruct.unpack(data))
+                yield StopWatchRun(timestamp, total, nameBytes.decode('utf-8', 'replace'), laps), f.tell()
+
@@ -0,0 +1,128 @@
+""" 专注会话检查点
+
+专注进行中时定期把会话状态写入一个很小的内存映射文件，程序崩溃或机器断电后，
+下次启动可以发现被中断的会话并恢复或计入已完成时间。
+
+文件固定 128 字节，分成两个 64 字节的槽，按序号交替覆盖写入：
+    <4s 魔数> <I 序号> <H 版本> <H 标志> <d 开始时间> <d 休息结束时间> <d 保存时间>
+    <I 每段专注秒数> <I 计划时长秒数> <I CRC32>
+写到一半被中断的槽 CRC 校验失败，读取时取另一个槽，因此任何时刻至少有一份完整的记录。
+定期保存只是改写映射的内存页，由系统择机写回；只有开始、休息切换等状态变化时才同步到磁盘。
+"""
+import mmap
+import os
+import struct
+import zlib
+from typing import NamedTuple
+
+MAGIC = b"PSCK"
+VERSION = 1
+SLOT = struct.Struct("<4sIHHdddIII")
+SLOT_SIZE = 64
+FILE_SIZE = SLOT_SIZE * 2
+
+FLAG_ACTIVE = 1
+FLAG_BREAKING = 2
+FLAG_SKIP_BREAK = 4
+
+
+class SessionSnapshot(NamedTuple):
+    """ 会话状态，时间均为墙上时钟的时间戳（秒） """
+    startedAt: float
+    breakEndAt: float       # 0 表示不在休息
+    savedAt: float
+    periodSeconds: int      # 每段专注的时长
+    plannedSeconds: int     # 时间选择器上设置的时长
+    skipBreak: bool
+
+    @property
+    def isBreaking(self):
+        return self.breakEndAt > 0
+
+    @property
+    def focusedSeconds(self):
+        """ 中断前已经专注的秒数 """
+        return max(int(self.savedAt - self.startedAt), 0)
+
+
+class SessionCheckpoint:
+    """ 会话检查点文件 """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._map = None
+        self._seq = 0
+
+    def _open(self):
+        """ 第一次保存时创建并映射文件 """
+        if self._map is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._seq = self._latest()[0]
+            self._file = open(self.path, "a+b")
+            if os.path.getsize(self.path) < FILE_SIZE:
+                self._file.truncate(FILE_SIZE)
+            self._map = mmap.mmap(self._file.fileno(), FILE_SIZE)
+        return self._map
+
+    def save(self, snapshot, sync=False):
+        """ 覆盖较旧的槽，sync 时同步到磁盘 """
+        flags = FLAG_ACTIVE | (FLAG_BREAKING if snapshot.isBreaking else 0) \
+            | (FLAG_SKIP_BREAK if snapshot.skipBreak else 0)
+        self._write(flags, snapshot, sync)
+
+    def clear(self):
+        """ 会话正常结束，写入一条非活动记录 """
+        if self._map is None and not os.path.exists(self.path):
+            return
+        self._write(0, SessionSnapshot(0, 0, 0, 0, 0, False), True)
+
+    def load(self):
+        """ 读取被中断的会话，没有时返回 None """
+        _, data = self._latest()
+        if data is None:
+            return None
+
+        _, _, _, flags, startedAt, breakEndAt, savedAt, period, planned, _ = data
+        if not flags & FLAG_ACTIVE:
+            return None
+        return SessionSnapshot(startedAt, breakEndAt if flags & FLAG_BREAKING else 0,
+                               savedAt, period, planned, bool(flags & FLAG_SKIP_BREAK))
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+    # ================ 槽读写 ================
+    def _write(self, flags, snapshot, sync):
+        mm = self._open()
+        self._seq += 1
+        body = SLOT.pack(MAGIC, self._seq, VERSION, flags, snapshot.startedAt, snapshot.breakEndAt,
+                         snapshot.savedAt, snapshot.periodSeconds, snapshot.plannedSeconds, 0)
+        record = body[:-4] + struct.pack("<I", zlib.crc32(body[:-4]))
+        offset = (self._seq % 2) * SLOT_SIZE
+        mm[offset:offset + len(record)] = record
+        if sync:
+            mm.flush()
+
+    def _latest(self):
+        """ 返回 (序号, 字段) ，取两个有效槽中序号较大的一个 """
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read(FILE_SIZE)
+        except OSError:
+            return 0, None
+
+        best = (0, None)
+        for offset in (0, SLOT_SIZE):
+            chunk = raw[offset:offset + SLOT.size]
+            if len(chunk) < SLOT.size:
+                continue
+            data = SLOT.unpack(chunk)
+            if data[0] != MAGIC or data[2] != VERSION or data[-1] != zlib.crc32(chunk[:-4]):
+                continue
+            if data[1] >= best[0]:
+                best = (data[1], data)
+        return best
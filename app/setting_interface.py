@@ -3,13 +3,14 @@ from config import cfg, HELP_URL, isWin11
 from qfluentwidgets import (
     SettingCardGroup, SwitchSettingCard, OptionsSettingCard,
     ComboBoxSettingCard, ExpandLayout, CustomColorSettingCard,
-    setTheme, setThemeColor, isDarkTheme, ScrollArea, HyperlinkCard,
-    LargeTitleLabel, InfoBar, FluentIcon
+    setThemeColor, ScrollArea, HyperlinkCard,
+    LargeTitleLabel, InfoBar, FluentIcon, RangeSettingCard
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import QWidget
 
 from utils import signalBus
+from style_sheet import styleSheetManager
 
 from paths import *
 
@@ -70,6 +71,51 @@ class SettingInterface(ScrollArea):
             configItem=cfg.minimizeToTray,
             parent=self.mainPanelGroup
         )
+        self.automationCard = SwitchSettingCard( # 本地自动化接口开关设置卡
+            FluentIcon.CODE,
+            self.tr('Local automation API'),
+            self.tr('Serve JSON-RPC and focus events on 127.0.0.1 for scripts and tools'),
+            configItem=cfg.automationEnabled,
+            parent=self.mainPanelGroup
+        )
+        self.archiveCard = RangeSettingCard( # 已完成任务归档天数设置卡
+            cfg.archiveAfterDays,
+            FluentIcon.HISTORY,
+            self.tr('Archive completed tasks after days'),
+            self.tr('Completed tasks older than this move to the archive, 0 keeps them in the list'),
+            parent=self.mainPanelGroup
+        )
+
+        # 专注时段
+        self.focusGroup = SettingCardGroup(self.tr('Focus sessions'), self.scrollWidget)
+        self.cyclesCard = RangeSettingCard( # 专注轮数设置卡
+            cfg.focusCycles,
+            FluentIcon.SYNC,
+            self.tr('Focus cycles'),
+            self.tr('Number of focus rounds in one session'),
+            parent=self.focusGroup
+        )
+        self.shortBreakCard = RangeSettingCard( # 短休息设置卡
+            cfg.shortBreakMinutes,
+            FluentIcon.CAFE,
+            self.tr('Short break minutes'),
+            self.tr('Break after each focus round'),
+            parent=self.focusGroup
+        )
+        self.longBreakCard = RangeSettingCard( # 长休息设置卡
+            cfg.longBreakMinutes,
+            FluentIcon.CAFE,
+            self.tr('Long break minutes'),
+            self.tr('Longer break that replaces the short one every few rounds'),
+            parent=self.focusGroup
+        )
+        self.longBreakIntervalCard = RangeSettingCard( # 长休息间隔设置卡
+            cfg.longBreakInterval,
+            FluentIcon.RINGER,
+            self.tr('Long break every rounds'),
+            self.tr('Take a long break after this many focus rounds'),
+            parent=self.focusGroup
+        )
 
         # 关于
         self.aboutGroup = SettingCardGroup(self.tr('About'), self.scrollWidget)
@@ -111,6 +157,13 @@ class SettingInterface(ScrollArea):
         self.personalGroup.addSettingCard(self.languageCard)
 
         self.mainPanelGroup.addSettingCard(self.minimizeToTrayCard)
+        self.mainPanelGroup.addSettingCard(self.automationCard)
+        self.mainPanelGroup.addSettingCard(self.archiveCard)
+
+        self.focusGroup.addSettingCard(self.cyclesCard)
+        self.focusGroup.addSettingCard(self.shortBreakCard)
+        self.focusGroup.addSettingCard(self.longBreakCard)
+        self.focusGroup.addSettingCard(self.longBreakIntervalCard)
 
         self.aboutGroup.addSettingCard(self.helpCard)
 
@@ -119,6 +172,7 @@ class SettingInterface(ScrollArea):
         self.expandLayout.setContentsMargins(60, 0, 60, 0) # 设置组的边距
         self.expandLayout.addWidget(self.personalGroup) # 添加个性化组
         self.expandLayout.addWidget(self.mainPanelGroup) # 添加主面板组
+        self.expandLayout.addWidget(self.focusGroup) # 添加专注时段组
         self.expandLayout.addWidget(self.aboutGroup) # 添加关于组
 
     def _initSignal(self): # 初始化信号槽
@@ -129,13 +183,13 @@ class SettingInterface(ScrollArea):
         # 个性化组
         self.micaCard.checkedChanged.connect(signalBus.micaEnableChanged) # 亚克力效果开关改变信号
 
-        cfg.themeChanged.connect(setTheme) # 主题改变信号
-    
         self.themeColorCard.colorChanged.connect(setThemeColor) # 主题颜色改变信号
 
         # 主面板组
         self.minimizeToTrayCard.checkedChanged.connect( # 最小化到托盘开关改变信号
             signalBus.minimizeToTrayChanged)
+        self.automationCard.checkedChanged.connect( # 自动化接口开关改变信号
+            signalBus.automationEnabledChanged)
 
         # 关于组
 
@@ -153,11 +207,9 @@ class SettingInterface(ScrollArea):
         self.settingLabel.setObjectName('settingLabel') # 设置标签对象名
         self.personalGroup.setObjectName('personalGroup') # 设置个性化组对象名
         self.scrollWidget.setObjectName('scrollWidget') # 设置滚动部件对象名
-        
-        theme = 'dark' if isDarkTheme() else 'light'
-        theme_path = os.path.join(qss_path, theme, "setting_interface.qss")
-        with open(theme_path, encoding='utf-8') as f: # 打开样式表文件
-            self.setStyleSheet(f.read()) # 设置样式表     
+
+        # 样式表由管理器缓存，主题切换时自动更新
+        styleSheetManager.register(self, "setting_interface")
         self.micaCard.setEnabled(isWin11())
 
            
@@ -0,0 +1,134 @@
+import getpass
+import json
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+from commands import CommandError
+
+SERVER_NAME = f"PenguinStride-{getpass.getuser()}"  # 每个用户一个实例
+CONNECT_TIMEOUT = 200   # 连接已运行实例的超时（毫秒）
+REPLY_TIMEOUT = 5000    # 等待回复的超时（毫秒）
+
+
+def sendCommand(argv, serverName=SERVER_NAME):
+    """ 把参数发送给已运行的实例
+
+    返回回复字典 {"ok": bool, "result"/"error": ...}，没有运行中的实例时返回 None。
+    只依赖 QtCore/QtNetwork，不需要创建 QApplication。
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(serverName)
+    if not socket.waitForConnected(CONNECT_TIMEOUT):
+        return None
+
+    socket.write(json.dumps({"argv": list(argv)}).encode('utf-8') + b"\n")
+    socket.waitForBytesWritten(REPLY_TIMEOUT)
+
+    data = b""
+    while not data.endswith(b"\n"):
+        if not socket.waitForReadyRead(REPLY_TIMEOUT):
+            break
+        data += bytes(socket.readAll())
+
+    socket.disconnectFromServer()
+    if not data:
+        return {"ok": False, "error": "运行中的实例没有回复"}
+
+    try:
+        reply = json.loads(data.decode('utf-8'))
+    except ValueError:
+        reply = None
+    if not isinstance(reply, dict):
+        return {"ok": False, "error": "运行中的实例回复无效"}
+    return reply
+
+
+def printReply(reply):
+    """ 打印回复，返回退出码 """
+    if not reply.get("ok"):
+        print(reply.get("error"))
+        return 1
+
+    result = reply.get("result")
+    if isinstance(result, str):
+        print(result)
+    else:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+class InstanceServer(QObject):
+    """ 单实例服务端
+
+    监听本地套接字，接收后续启动的实例或命令行转发的参数，
+    每行一个 JSON 请求，交给命令分发器执行后按行回复。
+    """
+
+    def __init__(self, dispatcher, parent=None, serverName=SERVER_NAME):
+        super().__init__(parent)
+        self.dispatcher = dispatcher
+        self.serverName = serverName
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self._onNewConnection)
+
+    def listen(self):
+        """ 开始监听，返回是否成功
+
+        名字被占用且无法连上时才视为上次异常退出留下的套接字文件，清理后重试；
+        能连上说明另一个实例已在监听，不能删除它的套接字。
+        """
+        if self.server.listen(self.serverName):
+            return True
+        if self.server.serverError() != QAbstractSocket.SocketError.AddressInUseError:
+            return False
+        if self._isServerAlive():
+            return False
+
+        QLocalServer.removeServer(self.serverName)
+        return self.server.listen(self.serverName)
+
+    def _isServerAlive(self):
+        """ 探测是否有实例正在该名字上监听 """
+        socket = QLocalSocket()
+        socket.connectToServer(self.serverName)
+        alive = socket.waitForConnected(CONNECT_TIMEOUT)
+        socket.abort()
+        return alive
+
+    def _onNewConnection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.setProperty("buffer", b"")
+            socket.readyRead.connect(lambda s=socket: self._onReadyRead(s))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _onReadyRead(self, socket):
+        buffer = socket.property("buffer") + bytes(socket.readAll())
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            reply = self.handle(line)
+            socket.write(json.dumps(reply, ensure_ascii=False, default=str).encode('utf-8') + b"\n")
+        socket.setProperty("buffer", buffer)
+
+    def handle(self, line):
+        """ 处理一行请求
+
+        在 Qt 槽中调用，任何异常都必须转成错误回复：
+        PyQt6 中槽里未捕获的异常会直接终止正在运行的实例。
+        """
+        try:
+            request = json.loads(line.decode('utf-8'))
+        except ValueError as e:
+            return {"ok": False, "error": f"无效的请求: {e}"}
+
+        argv = request.get("argv", []) if isinstance(request, dict) else None
+        if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+            return {"ok": False, "error": "无效的请求: 需要 {\"argv\": [字符串, ...]}"}
+
+        try:
+            return {"ok": True, "result": self.dispatcher.execute(argv)}
+        except CommandError as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            return {"ok": False, "error": f"命令执行失败: {e}"}
@@ -0,0 +1,247 @@
+""" 长时间运行压力测试（soak）
+
+在 offscreen 平台下驱动 FocusInterface 与 StopWatchInterface，模拟数小时的
+专注/休息/结束循环、任务增删、右键菜单与 InfoBar 通知，周期性采样
+RSS、tracemalloc 与 Qt 对象数量，任一指标持续上涨超过容差即返回非零退出码。
+
+用法:
+    python app/soak.py [--hours 8] [--samples 16] [--right-clicks 10000]
+"""
+# 标准库导入
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 第三方库导入
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QCoreApplication, QEvent
+
+# 本地模块导入
+from qfluentwidgets import InfoBar, Flyout
+from notification import notificationService
+from memory_trim import readRss
+
+
+def countQObjects(window):
+    """统计窗口下的 QObject 与应用内所有部件数量"""
+    return len(window.findChildren(QObject)) + len(QApplication.allWidgets())
+
+
+def slope(values):
+    """最小二乘斜率（每个采样点的增量）"""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    meanX = (n - 1) / 2
+    meanY = sum(values) / n
+    num = sum((i - meanX) * (v - meanY) for i, v in enumerate(values))
+    den = sum((i - meanX) ** 2 for i in range(n))
+    return num / den
+
+
+class SoakRunner:
+    """ 压力测试驱动器 """
+    def __init__(self, window, rightClicks=10000):
+        self.window = window
+        self.focusInterface = window.focusInterface
+        self.stopWatchInterface = window.stopWatchInterface
+        self.rightClicks = rightClicks
+        self.samples = {"rss": [], "tracemalloc": [], "qobjects": []}
+
+    # ================ 事件处理 ================
+    def flush(self):
+        """关闭所有通知和弹窗，并处理延迟删除事件"""
+        notificationService.clear()
+        for bar in self.window.findChildren(InfoBar):
+            bar.close()
+        for flyout in self.window.findChildren(Flyout):
+            flyout.close()
+        QApplication.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        QApplication.processEvents()
+
+    # ================ 场景 ================
+    def focusCycle(self):
+        """按时间线模拟一小时：逐段切换专注/休息，满一小时后结束"""
+        f = self.focusInterface
+        f.startFocus()
+        hour = 60 * 60
+
+        # 依次跳到每一段的结束，经过段切换
+        for end in f.timeline.ends:
+            if end >= hour or not f.isFocusing:
+                break
+            f.focusStartActive -= end - f.focusElapsed()
+            f.updateFocusTime()
+
+        if f.isFocusing:
+            f.focusStartActive -= hour - f.focusElapsed()
+            f.updateFocusTime()
+        f.endFocus()
+        self.flush()
+
+    def taskChurn(self):
+        """任务增删改"""
+        f = self.focusInterface
+        for i in range(5):
+            f.addTask(f"soak 任务 {i}")
+        for i in range(len(f.tasks)):
+            f.toggleTaskStatus(i)
+        f.clearCompletedTasks()
+        for i in range(3):
+            f.addTask(f"soak 任务 {i}")
+        while len(f.tasks) > 3:
+            f.deleteTask(len(f.tasks) - 1)
+        self.flush()
+
+    def stopWatchCycle(self):
+        """秒表：开始、标记、暂停、查看记录、重置"""
+        s = self.stopWatchInterface
+        s.toggleTimer()
+        for _ in range(10):
+            s.baseTime += 60000
+            s.updateTime()
+            s.recordFlag()
+        s.toggleTimer()
+        s.showRecordings()
+        self.flush()
+        s.resetTimer()
+        self.flush()
+
+    def menuCycle(self, count):
+        """右键菜单反复弹出"""
+        f = self.focusInterface
+        for i in range(count):
+            f.showRoundTaskMenu(i % max(len(f.tasks), 1))
+            f.roundTaskMenu.close()
+            self.window.contextMenu.exec(self.window.pos())
+            self.window.contextMenu.close()
+            if i % 100 == 0:
+                QApplication.processEvents()
+        self.flush()
+
+    def notificationCycle(self):
+        """图片卡片通知"""
+        for _ in range(10):
+            self.focusInterface.showImageMessage()
+        self.flush()
+
+    def trimCycle(self):
+        """隐藏窗口、回收内存再恢复，返回回收前后的常驻内存（字节）"""
+        self.window.show()
+        QApplication.processEvents()
+        self.window.hide()
+        QApplication.processEvents()
+        before, after = self.window.memoryTrimmer.trim()
+        self.window.show()
+        self.flush()
+        return before, after
+
+    # ================ 采样 ================
+    def sample(self):
+        """采样资源指标"""
+        gc.collect()
+        self.flush()
+        current, _ = tracemalloc.get_traced_memory()
+        self.samples["rss"].append(readRss())
+        self.samples["tracemalloc"].append(current)
+        self.samples["qobjects"].append(countQObjects(self.window))
+
+    def run(self, hours, sampleCount):
+        """运行压力测试，hours 个模拟小时均匀分到各个采样区间"""
+        clicksPerSample = self.rightClicks // sampleCount
+
+        # 预热，排除首次创建的缓存对象；
+        # 专注到达成每日目标，目标提示与专注完成提示同时显示时需要的第二个消息条也在这里创建
+        f = self.focusInterface
+        self.focusCycle()
+        while f.dailyCompleted < f.dailyTarget:
+            self.focusCycle()
+        self.taskChurn()
+        self.stopWatchCycle()
+        self.menuCycle(10)
+        self.notificationCycle()
+
+        for i in range(sampleCount):
+            for _ in range(hours * (i + 1) // sampleCount - hours * i // sampleCount):
+                self.focusCycle()
+                self.taskChurn()
+                self.stopWatchCycle()
+                self.notificationCycle()
+            self.menuCycle(clicksPerSample)
+            self.sample()
+            print(f"[{i + 1}/{sampleCount}] rss={self.samples['rss'][-1] / 1048576:.1f} MiB "
+                  f"traced={self.samples['tracemalloc'][-1] / 1024:.0f} KiB "
+                  f"qobjects={self.samples['qobjects'][-1]}")
+
+        before, after = self.trimCycle()
+        print(f"trim: rss {before / 1048576:.1f} MiB -> {after / 1048576:.1f} MiB "
+              f"(freed {(before - after) / 1048576:.1f} MiB)")
+
+    def check(self, tolerances):
+        """检查各指标的增长趋势，返回失败信息列表
+
+        tolerances 为每个采样区间允许的平均增量（最小二乘斜率），与运行时长无关，
+        缓慢的泄漏在长时间运行中不会被放宽的总量容差掩盖。
+        """
+        failures = []
+        for name, values in self.samples.items():
+            perSample = slope(values)
+            if perSample > tolerances[name]:
+                failures.append(f"{name} 每次采样增长 {perSample:.1f} 超出容差 {tolerances[name]}")
+        return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PenguinStride soak test")
+    parser.add_argument("--hours", type=int, default=8, help="模拟的专注小时数")
+    parser.add_argument("--samples", type=int, default=16, help="采样次数")
+    parser.add_argument("--right-clicks", type=int, default=10000, help="右键菜单弹出次数")
+    args = parser.parse_args(argv)
+
+    # 配置文件按相对路径加载
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.getcwd())
+
+    app = QApplication(sys.argv)
+    from MainWindow import MainWindow
+    window = MainWindow("soak")
+    QApplication.processEvents()
+
+    # 秒表历史写到临时目录，不污染用户数据
+    from run_store import RunStore
+    from session_checkpoint import SessionCheckpoint
+    from task_archive import TaskArchive
+    storeDir = tempfile.TemporaryDirectory()
+    window.stopWatchInterface.group.store = RunStore(storeDir.name)
+    window.focusInterface.checkpoint = SessionCheckpoint(os.path.join(storeDir.name, "session.ckpt"))
+    window.focusInterface.archive = TaskArchive(storeDir.name)
+
+    tracemalloc.start()
+    runner = SoakRunner(window, args.right_clicks)
+    runner.run(args.hours, args.samples)
+
+    failures = runner.check({
+        "rss": 256 * 1024,          # RSS 每次采样最多增长 256 KiB（分配器缓存有波动）
+        "tracemalloc": 4 * 1024,    # Python 分配每次采样最多增长 4 KiB
+        "qobjects": 0,              # Qt 对象数量必须保持平稳
+    })
+    for failure in failures:
+        print("FAIL:", failure)
+    if not failures:
+        print("OK: 资源占用保持平稳")
+
+    window.close()
+    app.quit()
+    window.focusInterface.checkpoint.close()
+    storeDir.cleanup()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
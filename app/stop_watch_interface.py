@@ -1,13 +1,79 @@
+import os
 import sys
-from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal
 from PyQt6.QtGui import QIcon
 
 from qfluentwidgets import (
-    FluentIcon, InfoBar, InfoBarPosition, SingleDirectionScrollArea, 
-    Flyout, CaptionLabel, FlyoutView
+    FluentIcon, InfoBarPosition, SingleDirectionScrollArea, 
+    Flyout, CaptionLabel, FlyoutView, CardWidget, BodyLabel,
+    StrongBodyLabel, TransparentToolButton, PillPushButton, FlyoutAnimationType
 )
+from qfluentwidgets.components.widgets.flyout import FlyoutAnimationManager
 from interfaces.StopWatchInterface_ui import Ui_StopWatchInterface
+from notification import notificationService
+from utils import signalBus
+from stopwatch_group import StopWatchGroup, formatTime, formatDelta
+from run_store import RunStore
+
+from paths import data_path
+
+
+class StopWatchRow(CardWidget):
+    """ 附加秒表的一行：名称、时间、标记数和操作按钮 """
+    toggleClicked = pyqtSignal()
+    lapClicked = pyqtSignal()
+    resetClicked = pyqtSignal()
+    removeClicked = pyqtSignal()
+
+    def __init__(self, name, parent=None):
+        super().__init__(parent)
+        self.nameLabel = StrongBodyLabel(name, self)
+        self.timeLabel = BodyLabel("00:00:00", self)
+        self.lapLabel = CaptionLabel("", self)
+        self.toggleButton = TransparentToolButton(FluentIcon.PLAY, self)
+        self.lapButton = TransparentToolButton(FluentIcon.FLAG, self)
+        self.resetButton = TransparentToolButton(FluentIcon.CANCEL, self)
+        self.removeButton = TransparentToolButton(FluentIcon.DELETE, self)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(16, 6, 8, 6)
+        layout.addWidget(self.nameLabel)
+        layout.addStretch(1)
+        layout.addWidget(self.lapLabel)
+        layout.addWidget(self.timeLabel)
+        layout.addWidget(self.toggleButton)
+        layout.addWidget(self.lapButton)
+        layout.addWidget(self.resetButton)
+        layout.addWidget(self.removeButton)
+        self.setFixedHeight(48)
+
+        self.toggleButton.clicked.connect(self.toggleClicked)
+        self.lapButton.clicked.connect(self.lapClicked)
+        self.resetButton.clicked.connect(self.resetClicked)
+        self.removeButton.clicked.connect(self.removeClicked)
+
+    def setTimeText(self, text):
+        """ 文本变化时才更新，避免每次时钟唤醒都重绘 """
+        if self.timeLabel.text() != text:
+            self.timeLabel.setText(text)
+
+    def bind(self, watch, elapsed, deltas):
+        """ 根据秒表状态更新按钮和标记，deltas 为最近标记与最佳成绩的差值 """
+        self.nameLabel.setText(watch.name)
+        self.setTimeText(formatTime(elapsed))
+        self.toggleButton.setIcon(FluentIcon.PAUSE if watch.isRunning else FluentIcon.PLAY)
+        self.lapButton.setEnabled(watch.isRunning)
+
+        text = self.tr("{0} 个标记").format(len(watch.laps)) if watch.laps else ""
+        if deltas and deltas[-1] is not None:
+            text += f" · {formatDelta(deltas[-1])}"
+        self.lapLabel.setText(text)
+
+        first = len(watch.laps) - len(deltas) + 1
+        self.lapLabel.setToolTip("\n".join(
+            f"{i}. {formatTime(t, True)}" + (f"  {formatDelta(d)}" if d is not None else "")
+            for i, (t, d) in enumerate(zip(watch.laps[-len(deltas):] if deltas else [], deltas), first)))
 
 
 class StopWatchInterface(QWidget, Ui_StopWatchInterface):
@@ -16,6 +82,7 @@ class StopWatchInterface(QWidget, Ui_StopWatchInterface):
         self.setupUi(self)
         self._initUI()
         self._initVariables()
+        self._initWatchList()
         self._connectSignals()
     
     def _initUI(self):
@@ -29,7 +96,7 @@ class StopWatchInterface(QWidget, Ui_StopWatchInterface):
         self.flagButton.setIcon(FluentIcon.FLAG)
         self.restartButton.setIcon(FluentIcon.CANCEL)
         self.RecordingButton.setIcon(FluentIcon.ALIGNMENT)
-        self.RecordingButton.setText("Recordings")
+        self.RecordingButton.setText(self.tr("Recordings"))
 
         # 设置按钮属性
         self.flagButton.setCheckable(False)
@@ -40,18 +107,36 @@ class StopWatchInterface(QWidget, Ui_StopWatchInterface):
         self.flagButton.setEnabled(False)
         self.restartButton.setEnabled(False)
         self.RecordingButton.setEnabled(False)
+
+        # 添加秒表按钮
+        self.addWatchButton = PillPushButton(self.tr("添加秒表"), self, FluentIcon.ADD)
+        self.addWatchButton.setCheckable(False)
+        self.horizontalLayout_4.insertWidget(2, self.addWatchButton)
     
     def _initVariables(self):
         """初始化变量"""
-        self.isRunning = False  # 是否正在计时
-        self.elapsedTime = 0    # 已经过的时间（毫秒）
-        self.flagCount = 0      # 标记计数
-        self.flagRecords = []   # 标记记录列表
-        
-        # 创建计时器
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.updateTime)
-        self.timer.setInterval(10)  # 10毫秒更新一次
+        # 所有秒表共用一个时钟订阅，第 0 个是页面上方的主秒表
+        self.group = StopWatchGroup(RunStore(os.path.join(data_path, "stopwatch")), self)
+        self.group.add("秒表")
+        self.primary = self.group.watches[0]
+        self.isBackground = False  # 窗口是否不可见
+        self._rows = []  # 附加秒表的行，与 group.watches[1:] 一一对应
+        self.recordingsFlyout = None  # 时间记录弹窗，第一次查看时创建
+
+    def _initWatchList(self):
+        """初始化附加秒表列表"""
+        self.watchScrollArea = SingleDirectionScrollArea(self, orient=Qt.Orientation.Vertical)
+        self.watchScrollArea.setWidgetResizable(True)
+        self.watchScrollArea.setStyleSheet("QScrollArea{background: transparent; border: none}")
+        self.watchListWidget = QWidget()
+        self.watchListWidget.setStyleSheet("QWidget{background: transparent}")
+        self.watchListLayout = QVBoxLayout(self.watchListWidget)
+        self.watchListLayout.setContentsMargins(36, 0, 36, 0)
+        self.watchListLayout.setSpacing(6)
+        self.watchListLayout.addStretch(1)
+        self.watchScrollArea.setWidget(self.watchListWidget)
+        self.watchScrollArea.setVisible(False)
+        self.verticalLayout_2.insertWidget(self.verticalLayout_2.count() - 1, self.watchScrollArea, 1)
     
     def _connectSignals(self):
         """连接信号和槽"""
@@ -59,6 +144,38 @@ class StopWatchInterface(QWidget, Ui_StopWatchInterface):
         self.flagButton.clicked.connect(self.recordFlag)
         self.restartButton.clicked.connect(self.resetTimer)
         self.RecordingButton.clicked.connect(self.showRecordings)
+        self.addWatchButton.clicked.connect(lambda: self.addStopWatch())
+        self.group.ticked.connect(self._onTick)
+        self.group.watchChanged.connect(self._onWatchChanged)
+        signalBus.backgroundModeChanged.connect(self.setBackgroundMode)
+
+    # ================ 主秒表状态 ================
+    @property
+    def isRunning(self):
+        return self.primary.isRunning
+
+    @property
+    def elapsedTime(self):
+        """已经过的时间（毫秒），由单调时钟计算"""
+        return self.primary.elapsed(self.group.now())
+
+    @property
+    def baseTime(self):
+        return self.primary.baseTime
+
+    @baseTime.setter
+    def baseTime(self, value):
+        self.primary.baseTime = value
+
+    @property
+    def flagCount(self):
+        return len(self.primary.laps)
+
+    @property
+    def flagRecords(self):
+        """标记记录列表"""
+        return [{'index': i, 'time': formatTime(ms, True), 'milliseconds': ms}
+                for i, ms in enumerate(self.primary.laps, 1)]
     
     def toggleTimer(self):
         """切换计时器状态（开始/暂停）"""
@@ -69,83 +186,71 @@ class StopWatchInterface(QWidget, Ui_StopWatchInterface):
     
     def _startTimer(self):
         """开始计时"""
-        self.isRunning = True
         self.startButton.setIcon(FluentIcon.PAUSE)
         self.flagButton.setEnabled(True)
         self.restartButton.setEnabled(False)
         self.RecordingButton.setEnabled(False)
-        self.timer.start()
+        self.group.start(0)
     
     def _pauseTimer(self):
         """暂停计时"""
-        self.isRunning = False
+        self.group.pause(0)
         self.startButton.setIcon(FluentIcon.POWER_BUTTON)
         self.flagButton.setEnabled(False)
         self.restartButton.setEnabled(True)
         
         # 只有在有记录时才启用记录按钮
-        if self.flagRecords:
+        if self.primary.laps:
             self.RecordingButton.setEnabled(True)
-            
-        self.timer.stop()
     
+    def setBackgroundMode(self, background):
+        """切换后台模式：窗口不可见时停止刷新显示，计时由单调时钟保证"""
+        self.isBackground = background
+        self.group.setBackgroundMode(background)
+
+    def _onTick(self, now):
+        """时钟唤醒：只刷新正在运行的秒表"""
+        if self.primary.isRunning:
+            self.updateTime()
+        for row, watch in zip(self._rows, self.group.watches[1:]):
+            if watch.isRunning:
+                row.setTimeText(formatTime(watch.elapsed(now)))
+
     def updateTime(self):
         """更新显示的时间"""
-        self.elapsedTime += 10  # 增加10毫秒
-        
-        # 计算时、分、秒
-        hours, remainder = divmod(self.elapsedTime, 3600000)
-        minutes, remainder = divmod(remainder, 60000)
-        seconds, _ = divmod(remainder, 1000)
-        
-        # 更新显示
-        self.timeLabel.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        text = formatTime(self.elapsedTime)
+        if self.timeLabel.text() != text:
+            self.timeLabel.setText(text)
     
     def recordFlag(self):
         """记录当前时间点"""
         if not self.isRunning:
             return
             
-        self.flagCount += 1
-        
-        # 计算时间
-        hours, remainder = divmod(self.elapsedTime, 3600000)
-        minutes, remainder = divmod(remainder, 60000)
-        seconds, remainder = divmod(remainder, 1000)
-        milliseconds = remainder // 10
-        
-        # 格式化时间字符串
-        timeStr = f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:02d}"
-        
-        # 保存记录
-        self.flagRecords.append({
-            'index': self.flagCount,
-            'time': timeStr,
-            'milliseconds': self.elapsedTime
-        })
-
-        # 显示标记信息
+        elapsed = self.group.lap(0)
+
+        # 显示标记信息，附带与历史最佳的差值
+        timeStr = formatTime(elapsed, True)
+        delta = self.group.lapDelta(0)
+        if delta is not None:
+            timeStr += self.tr("（最佳 {0}）").format(formatDelta(delta))
         self._showFlagInfo(timeStr)
     
     def _showFlagInfo(self, timeStr):
         """显示标记信息提示"""
-        InfoBar.success(
-            title=f"标记 #{self.flagCount}",
+        notificationService.success(
+            title=self.tr("标记 #{0}").format(self.flagCount),
             content=timeStr,
-            orient=Qt.Orientation.Horizontal,
-            isClosable=True,
             position=InfoBarPosition.TOP_RIGHT,
             duration=3000,
-            parent=self
+            parent=self,
+            key="flag",
+            summary=self.tr("已记录 {count} 个标记")
         )
     
     def resetTimer(self):
         """重置计时器"""
-        self.timer.stop()
-        self.isRunning = False
-        self.elapsedTime = 0
-        self.flagCount = 0
-        self.flagRecords.clear()
+        self.group.reset(0)
         
         self._resetUI()
         self._showResetInfo()
@@ -161,42 +266,126 @@ class StopWatchInterface(QWidget, Ui_StopWatchInterface):
     
     def _showResetInfo(self):
         """显示重置信息提示"""
-        InfoBar.info(
-            title="计时器已重置",
-            content="计时器已重置为零",
-            orient=Qt.Orientation.Horizontal,
-            isClosable=True,
+        notificationService.info(
+            title=self.tr("计时器已重置"),
+            content=self.tr("计时器已重置为零"),
             position=InfoBarPosition.BOTTOM,
             duration=2000,
             parent=self
         )
+
+    def changeEvent(self, e):
+        if e.type() == QEvent.Type.LanguageChange:
+            self.retranslateUi(self)
+        super().changeEvent(e)
+
+    def retranslateUi(self, StopWatchInterface):
+        """切换界面语言，界面文件会重设时间和按钮文本，需要恢复运行时的状态"""
+        super().retranslateUi(StopWatchInterface)
+        if not hasattr(self, 'group'):
+            # setupUi 期间
+            return
+
+        self.updateTime()
+        self.RecordingButton.setText(self.tr("Recordings"))
+        self.addWatchButton.setText(self.tr("添加秒表"))
+        if self.recordingsFlyout is not None:
+            self.recordingsView.titleLabel.setText(self.tr('时间记录'))
+            self.recordingsView.contentLabel.setText(self.tr("记录的时间点列表"))
+        for index in range(1, len(self.group.watches)):
+            self._onWatchChanged(index)
+
+    # ================ 附加秒表 ================
+    def addStopWatch(self, name=None):
+        """添加一个附加秒表，返回索引"""
+        index = self.group.add(name)
+        row = StopWatchRow(self.group.watches[index].name, self.watchListWidget)
+        row.toggleClicked.connect(lambda r=row: self.group.toggle(self._rowIndex(r)))
+        row.lapClicked.connect(lambda r=row: self.group.lap(self._rowIndex(r)))
+        row.resetClicked.connect(lambda r=row: self.group.reset(self._rowIndex(r)))
+        row.removeClicked.connect(lambda r=row: self.removeStopWatch(self._rowIndex(r)))
+        self.watchListLayout.insertWidget(len(self._rows), row)
+        self._rows.append(row)
+        self.watchScrollArea.setVisible(True)
+        return index
+
+    def removeStopWatch(self, index):
+        """移除附加秒表（主秒表不能移除）"""
+        if index < 1:
+            return
+        self.group.remove(index)
+        row = self._rows.pop(index - 1)
+        self.watchListLayout.removeWidget(row)
+        row.deleteLater()
+        self.watchScrollArea.setVisible(bool(self._rows))
+
+    def _rowIndex(self, row):
+        return self._rows.index(row) + 1
+
+    def _onWatchChanged(self, index):
+        """秒表开始、暂停、标记或重置后刷新对应的行"""
+        if index >= 1:
+            watch = self.group.watches[index]
+            deltas = [self.group.lapDelta(index, k) for k in range(max(len(watch.laps) - 10, 0), len(watch.laps))]
+            self._rows[index - 1].bind(watch, watch.elapsed(self.group.now()), deltas)
     
+    def releaseResources(self):
+        """关闭并销毁记录弹窗，下次查看记录时再重新创建"""
+        if self.recordingsFlyout is None:
+            return
+
+        self.recordingsFlyout.close()
+        self.recordingsFlyout.deleteLater()
+        self.recordingsFlyout = None
+        self.recordingsView = None
+        self.recordingsLabel = None
+
     def showRecordings(self):
-        """显示记录的时间点"""
+        """显示记录的时间点
+
+        弹出窗口只创建一次，关闭时隐藏，之后每次只更新记录文本：
+        Fluent 部件创建时会挂到全局的主题信号和样式表管理器上，反复新建的弹窗关闭后也释放不干净。
+        """
         if not self.flagRecords:
             return
 
-        # 创建滚动区域和内容视图
-        scrollArea, view = self._createRecordingsView()
-        
-        # 创建并显示弹出窗口
-        flyout_view = self._createFlyoutView(scrollArea)
-        w = Flyout.make(flyout_view, self.RecordingButton, self)
-        flyout_view.closed.connect(w.close)
+        if self.recordingsFlyout is None:
+            scrollArea, self.recordingsLabel = self._createRecordingsView()
+            self.recordingsView = self._createFlyoutView(scrollArea)
+            self.recordingsFlyout = Flyout(self.recordingsView, self, isDeleteOnClose=False)
+            self.recordingsView.closed.connect(self.recordingsFlyout.close)
+
+        self.recordingsLabel.setText(self._recordingsText())
+        self.recordingsLabel.adjustSize()
+
+        # 先显示以得到正确的尺寸，再移动到按钮上方（与 Flyout.make 相同）
+        flyout = self.recordingsFlyout
+        flyout.show()
+        flyout.exec(FlyoutAnimationManager.make(FlyoutAnimationType.PULL_UP, flyout).position(self.RecordingButton))
+
+    def _recordingsText(self):
+        """每行一个时间点，有历史最佳时附上与最佳的差值"""
+        lines = []
+        for record in self.flagRecords:
+            text = f"{record['index']}. {record['time']}"
+            delta = self.group.lapDelta(0, record['index'] - 1)
+            if delta is not None:
+                text += f"  {formatDelta(delta)}"
+            lines.append(text)
+        return "\n".join(lines)
     
     def _createRecordingsView(self):
-        """创建记录显示视图"""
+        """创建记录显示视图，返回滚动区域和显示记录的标签"""
         scrollArea = SingleDirectionScrollArea(orient=Qt.Orientation.Vertical)
         scrollArea.resize(300, 400)  # 设置合适的大小
 
         view = QWidget()
         layout = QVBoxLayout(view)
         
-        # 添加记录标签
-        for record in self.flagRecords:
-            label = CaptionLabel(f"{record['index']}. {record['time']}")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(label)
+        # 所有记录放在一个标签里
+        label = CaptionLabel()
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(label)
 
         scrollArea.setWidget(view)
         
@@ -204,13 +393,13 @@ class StopWatchInterface(QWidget, Ui_StopWatchInterface):
         scrollArea.setStyleSheet("QScrollArea{background: transparent; border: none}")
         view.setStyleSheet("QWidget{background: transparent}")
         
-        return scrollArea, view
+        return scrollArea, label
     
     def _createFlyoutView(self, content_widget):
         """创建弹出视图"""
         flyout_view = FlyoutView(
-            title='时间记录',
-            content="记录的时间点列表",
+            title=self.tr('时间记录'),
+            content=self.tr("记录的时间点列表"),
             isClosable=True,
         )
         
@@ -222,7 +411,6 @@ class StopWatchInterface(QWidget, Ui_StopWatchInterface):
         
         return flyout_view
 
-
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     w = StopWatchInterface()
@@ -0,0 +1,176 @@
+from PyQt6.QtCore import QCoreApplication, QObject, QElapsedTimer, pyqtSignal
+
+from clock_service import clockService
+
+
+def formatTime(milliseconds, precise=False):
+    """ 毫秒格式化为 时:分:秒，precise 时带两位百分秒 """
+    hours, remainder = divmod(milliseconds, 3600000)
+    minutes, remainder = divmod(remainder, 60000)
+    seconds, remainder = divmod(remainder, 1000)
+    text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{text}.{remainder // 10:02d}" if precise else text
+
+
+def formatDelta(milliseconds):
+    """ 与最佳成绩的差值，例如 +1.25、-0:03.40 """
+    sign = "-" if milliseconds < 0 else "+"
+    minutes, remainder = divmod(abs(milliseconds), 60000)
+    seconds = remainder / 1000
+    return f"{sign}{minutes}:{seconds:05.2f}" if minutes else f"{sign}{seconds:.2f}"
+
+
+class StopWatchState:
+    """ 单个秒表的状态
+
+    只保存名称、累计时间、开始时刻和标记偏移量（毫秒整数），
+    显示用的文本在需要时再格式化。
+    """
+    __slots__ = ("name", "baseTime", "startedAt", "laps")
+
+    def __init__(self, name):
+        self.name = name
+        self.baseTime = 0       # 本次开始前累计的时间（毫秒）
+        self.startedAt = None   # 本次开始时组时钟的读数，None 表示未运行
+        self.laps = []          # 标记时的累计时间（毫秒）
+
+    @property
+    def isRunning(self):
+        return self.startedAt is not None
+
+    def elapsed(self, now):
+        """ now 为组时钟读数 """
+        return self.baseTime + (now - self.startedAt if self.startedAt is not None else 0)
+
+
+class StopWatchGroup(QObject):
+    """ 一组秒表
+
+    所有秒表共用一个单调时钟和一个全局时钟订阅：
+    至少有一个秒表在运行且界面可见时才订阅，每次唤醒只发出一次 ticked，
+    秒表数量增加不会增加唤醒次数。
+    """
+    ticked = pyqtSignal(int)            # 组时钟读数（毫秒）
+    watchAdded = pyqtSignal(int)        # 新秒表的索引
+    watchRemoved = pyqtSignal(int)      # 被移除秒表的索引
+    watchChanged = pyqtSignal(int)      # 开始、暂停、标记或重置的秒表索引
+
+    def __init__(self, store=None, parent=None):
+        super().__init__(parent)
+        self.store = store      # RunStore，重置时保存有标记的一轮记录
+        self.watches = []
+        self.clock = QElapsedTimer()
+        self.clock.start()
+        self.isBackground = False
+        self._subscription = None
+        self._runningCount = 0
+        self._nameCounter = 0
+
+    def now(self):
+        return self.clock.elapsed()
+
+    # ================ 秒表管理 ================
+    def add(self, name=None):
+        """ 添加秒表，返回索引
+
+        名称同时是历史记录的键，默认名称在创建时按当前语言生成，之后不随语言变化
+        """
+        self._nameCounter += 1
+        if not name:
+            name = QCoreApplication.translate("StopWatchGroup", "秒表 {0}").format(self._nameCounter)
+        self.watches.append(StopWatchState(name))
+        index = len(self.watches) - 1
+        self.watchAdded.emit(index)
+        return index
+
+    def remove(self, index):
+        watch = self.watches.pop(index)
+        if watch.isRunning:
+            self._runningCount -= 1
+            self._updateSubscription()
+        self.watchRemoved.emit(index)
+
+    def indexOf(self, name):
+        """ 按名称查找秒表，找不到时返回 -1 """
+        return next((i for i, w in enumerate(self.watches) if w.name == name), -1)
+
+    def runningCount(self):
+        return self._runningCount
+
+    # ================ 计时 ================
+    def start(self, index):
+        watch = self.watches[index]
+        if watch.isRunning:
+            return
+        watch.startedAt = self.now()
+        self._runningCount += 1
+        self._updateSubscription()
+        self.watchChanged.emit(index)
+
+    def pause(self, index):
+        watch = self.watches[index]
+        if not watch.isRunning:
+            return
+        watch.baseTime = watch.elapsed(self.now())
+        watch.startedAt = None
+        self._runningCount -= 1
+        self._updateSubscription()
+        self.watchChanged.emit(index)
+
+    def toggle(self, index):
+        if self.watches[index].isRunning:
+            self.pause(index)
+        else:
+            self.start(index)
+
+    def lap(self, index):
+        """ 记录标记，返回累计时间（毫秒） """
+        watch = self.watches[index]
+        elapsed = watch.elapsed(self.now())
+        watch.laps.append(elapsed)
+        self.watchChanged.emit(index)
+        return elapsed
+
+    def lapDelta(self, index, lapIndex=-1):
+        """ 某个标记与历史最佳的差值（毫秒），没有历史记录时返回 None """
+        watch = self.watches[index]
+        if self.store is None or not watch.laps:
+            return None
+        lapIndex %= len(watch.laps)
+        return self.store.delta(watch.name, lapIndex, watch.laps[lapIndex])
+
+    def reset(self, index):
+        """ 重置秒表，有标记时先保存这一轮记录 """
+        watch = self.watches[index]
+        if self.store is not None and watch.laps:
+            self.store.append(watch.name, watch.laps, watch.elapsed(self.now()))
+        if watch.isRunning:
+            self._runningCount -= 1
+            self._updateSubscription()
+        watch.baseTime = 0
+        watch.startedAt = None
+        watch.laps = []
+        self.watchChanged.emit(index)
+
+    def elapsed(self, index):
+        return self.watches[index].elapsed(self.now())
+
+    # ================ 时钟 ================
+    def setBackgroundMode(self, background):
+        """ 后台时取消订阅，计时由单调时钟保证 """
+        self.isBackground = background
+        self._updateSubscription()
+        if not background and self._runningCount:
+            self._onTick()
+
+    def _updateSubscription(self):
+        """ 有秒表运行且界面可见时才订阅全局时钟（显示精确到秒，每秒十次足够及时） """
+        active = self._runningCount > 0 and not self.isBackground
+        if active and self._subscription is None:
+            self._subscription = clockService.subscribe(self._onTick, clockService.HZ_10)
+        elif not active and self._subscription is not None:
+            clockService.unsubscribe(self._subscription)
+            self._subscription = None
+
+    def _onTick(self):
+        self.ticked.emit(self.now())
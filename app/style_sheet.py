@@ -0,0 +1,137 @@
+import os
+import time
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from qfluentwidgets import isDarkTheme, qconfig
+from qfluentwidgets.common.style_sheet import (
+    styleSheetManager as fluentStyleSheetManager, StyleSheetCompose,
+    FluentStyleSheet, StyleSheetFile, applyThemeColor, getStyleSheetFromFile
+)
+
+from paths import qss_path
+
+
+class StyleSheetManager(QObject):
+    """ 样式表管理器
+
+    启动时一次性读入 resource/qss 下亮色、暗色两套样式表并缓存，
+    页面通过 register() 登记自己使用的样式表。切换主题时先暂停所有顶层窗口的绘制，
+    在一次遍历中更新组件库和本应用的样式表，最后统一恢复绘制，避免逐个重绘造成闪烁。
+
+    组件库自带的 updateStyleSheet 每个部件都会重新读取 qss 资源并做主题色替换，
+    这里按文件路径缓存读取结果、按内容缓存替换结果，样式没有变化的部件不再重新设置。
+    """
+    themeSwitched = pyqtSignal(float)  # 切换耗时（毫秒）
+
+    THEMES = ("light", "dark")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache = {}      # (名称, 主题) -> 样式表文本
+        self._widgets = {}    # 部件 -> 样式表名称
+        self._fileCache = {}  # 组件库 qss 路径 -> 文本
+        self._colorCache = {} # (文本, 是否暗色, 主题色) -> 替换主题色后的文本
+        self.lastSwitchTime = 0.0
+
+    def preload(self):
+        """ 读入所有主题的样式表 """
+        for theme in self.THEMES:
+            folder = os.path.join(qss_path, theme)
+            for file in os.listdir(folder):
+                name, ext = os.path.splitext(file)
+                if ext == ".qss":
+                    with open(os.path.join(folder, file), encoding='utf-8') as f:
+                        self._cache[(name, theme)] = f.read()
+
+    def styleSheet(self, name, theme=None):
+        """ 获取缓存的样式表，theme 默认为当前主题 """
+        if not self._cache:
+            self.preload()
+        theme = theme or ('dark' if isDarkTheme() else 'light')
+        return self._cache.get((name, theme), "")
+
+    def register(self, widget, name):
+        """ 登记部件并应用当前主题的样式表 """
+        self._widgets[widget] = name
+        widget.destroyed.connect(lambda *_, w=widget: self._widgets.pop(w, None))
+        widget.setStyleSheet(self.styleSheet(name))
+
+    def registeredCount(self):
+        return len(self._widgets)
+
+    def switchTheme(self, theme):
+        """ 批量切换主题，返回耗时（毫秒） """
+        start = time.perf_counter()
+        windows = [w for w in QApplication.topLevelWidgets() if w.isVisible() and w.updatesEnabled()]
+        for window in windows:
+            window.setUpdatesEnabled(False)
+
+        try:
+            # 组件库的样式表
+            qconfig.set(qconfig.themeMode, theme, False)
+            self._updateFluentStyleSheets()
+
+            # 本应用的样式表
+            themeName = 'dark' if isDarkTheme() else 'light'
+            for widget, name in list(self._widgets.items()):
+                if sip.isdeleted(widget):
+                    self._widgets.pop(widget, None)
+                    continue
+                widget.setStyleSheet(self.styleSheet(name, themeName))
+        finally:
+            for window in windows:
+                if not sip.isdeleted(window):
+                    window.setUpdatesEnabled(True)
+
+        # 与组件库的 setTheme 一致，通知窗口刷新云母等效果
+        qconfig.themeChangedFinished.emit()
+
+        self.lastSwitchTime = (time.perf_counter() - start) * 1000
+        self.themeSwitched.emit(self.lastSwitchTime)
+        return self.lastSwitchTime
+
+    # ================ 组件库样式表 ================
+    def _updateFluentStyleSheets(self):
+        """ 使用缓存更新组件库登记的所有部件 """
+        theme = qconfig.theme
+        colorKey = (isDarkTheme(), qconfig.get(qconfig.themeColor).name())
+        removes = []
+        for widget, source in list(fluentStyleSheetManager.items()):
+            try:
+                qss = self._themedStyleSheet(self._content(source, theme), colorKey)
+                if widget.styleSheet() != qss:
+                    widget.setStyleSheet(qss)
+            except RuntimeError:
+                removes.append(widget)
+
+        for widget in removes:
+            fluentStyleSheetManager.deregister(widget)
+
+    def _content(self, source, theme):
+        """ 样式表原文，来自文件的部分使用缓存 """
+        if isinstance(source, StyleSheetCompose):
+            return '\n'.join(self._content(s, theme) for s in source.sources)
+
+        if isinstance(source, (FluentStyleSheet, StyleSheetFile)):
+            path = source.path(theme)
+            qss = self._fileCache.get(path)
+            if qss is None:
+                qss = self._fileCache[path] = getStyleSheetFromFile(path)
+            return qss
+
+        # 自定义样式表保存在部件属性中，直接读取
+        return source.content(theme)
+
+    def _themedStyleSheet(self, qss, colorKey):
+        """ 替换主题色，结果按内容缓存 """
+        key = (qss, colorKey)
+        themed = self._colorCache.get(key)
+        if themed is None:
+            themed = self._colorCache[key] = applyThemeColor(qss)
+        return themed
+
+
+styleSheetManager = StyleSheetManager()
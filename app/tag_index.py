@@ -0,0 +1,113 @@
+""" 任务标签索引
+
+每个标签对应一个任务编号的位图，按标签筛选（全部匹配 / 任一匹配）只是位图之间的与、或运算，
+不需要遍历任务。位图按编号的高位分块（每块 65536 个编号），块内用 Python 整数的各个位表示，
+没有成员的块不存储，编号稀疏或集中在某一段时都只占用很少的内存。
+
+索引随任务的添加、修改和删除增量维护，不会整体重建。
+"""
+import re
+
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+
+def parseTags(text):
+    """ 把用户输入拆成标签集合，支持空格、逗号、顿号分隔，可以带 # 前缀 """
+    return {tag.lstrip("#") for tag in re.split(r"[\s,，、;；]+", text or "") if tag.lstrip("#")}
+
+
+class Bitmap:
+    """ 分块压缩的整数位图 """
+    __slots__ = ("chunks",)
+
+    def __init__(self, chunks=None):
+        self.chunks = chunks or {}  # 高位 -> 块内位图
+
+    def add(self, value):
+        high = value >> CHUNK_BITS
+        self.chunks[high] = self.chunks.get(high, 0) | (1 << (value & CHUNK_MASK))
+
+    def discard(self, value):
+        high = value >> CHUNK_BITS
+        bits = self.chunks.get(high, 0) & ~(1 << (value & CHUNK_MASK))
+        if bits:
+            self.chunks[high] = bits
+        else:
+            self.chunks.pop(high, None)
+
+    def __contains__(self, value):
+        return bool(self.chunks.get(value >> CHUNK_BITS, 0) >> (value & CHUNK_MASK) & 1)
+
+    def __and__(self, other):
+        small, large = sorted((self.chunks, other.chunks), key=len)
+        chunks = {}
+        for high, bits in small.items():
+            bits &= large.get(high, 0)
+            if bits:
+                chunks[high] = bits
+        return Bitmap(chunks)
+
+    def __or__(self, other):
+        chunks = dict(self.chunks)
+        for high, bits in other.chunks.items():
+            chunks[high] = chunks.get(high, 0) | bits
+        return Bitmap(chunks)
+
+    def __len__(self):
+        return sum(bits.bit_count() for bits in self.chunks.values())
+
+    def __bool__(self):
+        return bool(self.chunks)
+
+    def __iter__(self):
+        """ 按升序遍历成员 """
+        for high in sorted(self.chunks):
+            bits, base = self.chunks[high], high << CHUNK_BITS
+            while bits:
+                low = bits & -bits
+                yield base + low.bit_length() - 1
+                bits ^= low
+
+
+class TagIndex:
+    """ 标签 -> 任务编号位图 """
+
+    def __init__(self):
+        self._bitmaps = {}
+
+    def add(self, taskId, tags):
+        for tag in tags:
+            self._bitmaps.setdefault(tag, Bitmap()).add(taskId)
+
+    def remove(self, taskId, tags):
+        for tag in tags:
+            bitmap = self._bitmaps.get(tag)
+            if bitmap is None:
+                continue
+            bitmap.discard(taskId)
+            if not bitmap:
+                del self._bitmaps[tag]
+
+    def update(self, taskId, oldTags, newTags):
+        """ 任务的标签从 oldTags 改为 newTags，只改动有变化的标签 """
+        self.remove(taskId, set(oldTags) - set(newTags))
+        self.add(taskId, set(newTags) - set(oldTags))
+
+    def clear(self):
+        self._bitmaps.clear()
+
+    def tags(self):
+        """ 所有标签及其任务数，按名称排序 """
+        return [(tag, len(self._bitmaps[tag])) for tag in sorted(self._bitmaps)]
+
+    def match(self, tags, matchAll=True):
+        """ 带有全部（matchAll）或任一标签的任务编号位图 """
+        bitmaps = [self._bitmaps.get(tag, Bitmap()) for tag in tags]
+        if not bitmaps:
+            return Bitmap()
+
+        result = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            result = result & bitmap if matchAll else result | bitmap
+        return result
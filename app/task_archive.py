@@ -0,0 +1,146 @@
+""" 已归档任务
+
+完成较久的任务从任务列表移到归档日志 archive.jsonl，每行一条 JSON 记录，只追加不修改。
+任务列表因此只保留未完成和最近完成的任务，重建卡片的开销不随历史增长。
+
+查看归档时按固定大小分页读取：第一次读取时扫描一遍日志中的换行位置建立行偏移表
+（不解析 JSON），之后每一页只 seek 到对应偏移读取这一页的行。最新归档的任务在最前面。
+"""
+import json
+import os
+from array import array
+from datetime import datetime
+
+from PyQt6.QtCore import QAbstractListModel, QCoreApplication, QModelIndex, Qt
+
+CHUNK_SIZE = 1 << 20
+PAGE_SIZE = 50
+
+
+class TaskArchive:
+    """ 归档任务存储 """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.logPath = os.path.join(directory, "archive.jsonl")
+        self._offsets = None   # 每行的起始偏移，最后一项是日志大小
+
+    @staticmethod
+    def record(task):
+        """ 把任务转换为归档记录，子任务只保留统计数字 """
+        completed = task.completed_time or task.created_time
+        return {
+            "name": task.name,
+            "tags": sorted(task.tags),
+            "created": task.created_time.timestamp(),
+            "completed": completed.timestamp(),
+            "focusedSeconds": task.focusedSeconds,
+            "estimateMinutes": task.estimateMinutes,
+            "subtasks": [task.doneCount, task.totalCount],
+        }
+
+    # ================ 行偏移表 ================
+    def _index(self):
+        """ 首次使用时扫描日志建立行偏移表，末尾不完整的行会被忽略 """
+        if self._offsets is None:
+            offsets = array('Q', [0])
+            try:
+                with open(self.logPath, "rb") as f:
+                    position = 0
+                    while chunk := f.read(CHUNK_SIZE):
+                        start = chunk.find(b"\n")
+                        while start >= 0:
+                            offsets.append(position + start + 1)
+                            start = chunk.find(b"\n", start + 1)
+                        position += len(chunk)
+            except OSError:
+                pass
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self):
+        return len(self._index()) - 1
+
+    # ================ 读写 ================
+    def append(self, records):
+        """ 追加一批记录，一次写入 """
+        if not records:
+            return
+        offsets = self._index()
+        data = b"".join(json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n" for record in records)
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.logPath, "ab") as f:
+            # 上次写到一半的行从偏移表的末尾截断重写
+            f.truncate(offsets[-1])
+            f.write(data)
+
+        end = offsets[-1]
+        for line in data.splitlines(keepends=True):
+            end += len(line)
+            offsets.append(end)
+
+    def page(self, index, size):
+        """ 第 index 页（从 0 开始，最新的在前）的记录 """
+        offsets = self._index()
+        count = len(offsets) - 1
+        stop = count - index * size
+        start = max(stop - size, 0)
+        if stop <= 0:
+            return []
+
+        with open(self.logPath, "rb") as f:
+            f.seek(offsets[start])
+            data = f.read(offsets[stop] - offsets[start])
+
+        records = []
+        for line in reversed(data.splitlines()):
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        return records
+
+
+class ArchiveModel(QAbstractListModel):
+    """ 归档任务列表模型，滚动到底部时通过 fetchMore 读取下一页 """
+
+    def __init__(self, archive, parent=None):
+        super().__init__(parent)
+        self.archive = archive
+        self.total = len(archive)
+        self._records = []
+        self._pages = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and len(self._records) < self.total
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        records = self.archive.page(self._pages, PAGE_SIZE)
+        self._pages += 1
+        if not records:
+            self.total = len(self._records)
+            return
+        self.beginInsertRows(QModelIndex(), len(self._records), len(self._records) + len(records) - 1)
+        self._records.extend(records)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        record = self._records[index.row()]
+        completed = datetime.fromtimestamp(record["completed"])
+        text = record["name"] + "  ·  " + QCoreApplication.translate(
+            "ArchiveModel", "完成于 {0}").format(f"{completed:%Y-%m-%d}")
+        if record.get("focusedSeconds"):
+            text += "  ·  " + QCoreApplication.translate(
+                "ArchiveModel", "专注 {0} 分钟").format(record["focusedSeconds"] // 60)
+        if record.get("tags"):
+            text += "  " + " ".join(f"#{tag}" for tag in record["tags"])
+        return text
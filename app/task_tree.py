@@ -0,0 +1,165 @@
+""" 子任务树
+
+任务通过 parent / children 组成树，每个任务记录子树中的任务总数和已完成数（不含自身）。
+添加、删除或勾选任务时只把增量沿祖先链向上累加，不重新统计子树，层级再深也只是 O(深度)，
+且全程不用递归。
+
+TaskTreeModel 按需加载：某个任务的子任务在视图第一次展开它时才通过 fetchMore 插入模型，
+没有展开过的子树不会生成任何行。
+"""
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+
+def _propagate(task, total, done):
+    """ 把子树任务数和完成数的变化累加到 task 及其所有祖先 """
+    while task is not None:
+        task.totalCount += total
+        task.doneCount += done
+        task = task.parent
+
+
+def addSubtask(parent, child):
+    """ 把 child（可以带有子树）追加为 parent 的最后一个子任务 """
+    child.parent = parent
+    child.row = len(parent.children)
+    parent.children.append(child)
+    _propagate(parent, 1 + child.totalCount, int(child.is_completed) + child.doneCount)
+
+
+def removeSubtask(child):
+    """ 把 child 连同子树从父任务中移除 """
+    parent = child.parent
+    del parent.children[child.row]
+    for row in range(child.row, len(parent.children)):
+        parent.children[row].row = row
+    child.parent = None
+    _propagate(parent, -1 - child.totalCount, -int(child.is_completed) - child.doneCount)
+
+
+def setCompleted(task, completed):
+    """ 修改任务的完成状态，并更新祖先的完成数 """
+    if task.is_completed != completed:
+        task.is_completed = completed
+        _propagate(task.parent, 0, 1 if completed else -1)
+
+
+class TaskTreeModel(QAbstractItemModel):
+    """ 以 root 为根的子任务树模型，root 本身不显示 """
+
+    def __init__(self, root, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self._fetched = set()  # 子任务已经插入模型的任务编号
+
+    def taskAt(self, index):
+        return index.internalPointer() if index.isValid() else self.root
+
+    def indexOf(self, task):
+        if task is self.root:
+            return QModelIndex()
+        return self.createIndex(task.row, 0, task)
+
+    # ================ 结构 ================
+    def index(self, row, column, parent=QModelIndex()):
+        task = self.taskAt(parent)
+        if task.id not in self._fetched or not 0 <= row < len(task.children) or column != 0:
+            return QModelIndex()
+        return self.createIndex(row, column, task.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self.indexOf(index.internalPointer().parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        task = self.taskAt(parent)
+        return len(task.children) if task.id in self._fetched else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        return bool(self.taskAt(parent).children)
+
+    def canFetchMore(self, parent):
+        task = self.taskAt(parent)
+        return task.id not in self._fetched and bool(task.children)
+
+    def fetchMore(self, parent):
+        task = self.taskAt(parent)
+        if task.id in self._fetched:
+            return
+        self.beginInsertRows(parent, 0, len(task.children) - 1)
+        self._fetched.add(task.id)
+        self.endInsertRows()
+
+    # ================ 数据 ================
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        task = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if task.totalCount:
+                return f"{task.name}  ·  {task.doneCount}/{task.totalCount}"
+            return task.name
+        if role == Qt.ItemDataRole.EditRole:
+            return task.name
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if task.is_completed else Qt.CheckState.Unchecked
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable \
+            | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+
+        task = index.internalPointer()
+        if role == Qt.ItemDataRole.CheckStateRole:
+            setCompleted(task, Qt.CheckState(value) == Qt.CheckState.Checked)
+            self.dataChanged.emit(index, index)
+            self._refreshCounts(task.parent)
+            return True
+        if role == Qt.ItemDataRole.EditRole and str(value).strip():
+            task.name = str(value).strip()
+            self.dataChanged.emit(index, index)
+            return True
+        return False
+
+    # ================ 修改 ================
+    def addTask(self, parent, child):
+        """ 添加子任务，父任务已经加载过子任务时直接插入一行 """
+        index = self.indexOf(parent)
+        if not parent.children:
+            self._fetched.add(parent.id)  # 原本没有子任务，没有需要按需加载的内容
+        if parent.id in self._fetched:
+            row = len(parent.children)
+            self.beginInsertRows(index, row, row)
+            addSubtask(parent, child)
+            self.endInsertRows()
+        else:
+            addSubtask(parent, child)
+        self._refreshCounts(parent)
+
+    def removeTask(self, task):
+        """ 删除任务及其子树 """
+        parent = task.parent
+        if parent.id in self._fetched:
+            self.beginRemoveRows(self.indexOf(parent), task.row, task.row)
+            removeSubtask(task)
+            self.endRemoveRows()
+        else:
+            removeSubtask(task)
+        self._refreshCounts(parent)
+
+    def _refreshCounts(self, task):
+        """ task 及其祖先的统计数字变了，刷新它们的显示文本 """
+        while task is not None and task is not self.root:
+            index = self.indexOf(task)
+            self.dataChanged.emit(index, index)
+            task = task.parent
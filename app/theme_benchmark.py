@@ -0,0 +1,78 @@
+""" 主题切换基准测试
+
+在 offscreen 平台下创建主窗口并打开所有页面，反复在亮色和暗色之间切换，
+统计每次切换的耗时；--legacy 模拟旧的做法（每次从磁盘读取样式表、不暂停绘制）作为对照。
+
+用法:
+    python app/theme_benchmark.py [--switches 20] [--legacy]
+"""
+# 标准库导入
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 第三方库导入
+from PyQt6.QtWidgets import QApplication
+
+
+def legacySwitch(theme, settingInterface):
+    """旧的做法：组件库逐个刷新样式，设置页重新从磁盘读取样式表"""
+    from qfluentwidgets import setTheme, isDarkTheme
+    from paths import qss_path
+
+    start = time.perf_counter()
+    setTheme(theme)
+    name = 'dark' if isDarkTheme() else 'light'
+    with open(os.path.join(qss_path, name, "setting_interface.qss"), encoding='utf-8') as f:
+        settingInterface.setStyleSheet(f.read())
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PenguinStride theme switch benchmark")
+    parser.add_argument("--switches", type=int, default=20, help="切换次数")
+    parser.add_argument("--legacy", action="store_true", help="测量旧的切换方式")
+    args = parser.parse_args(argv)
+
+    # 配置文件按相对路径加载
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.getcwd())
+
+    app = QApplication(sys.argv)
+    from qfluentwidgets import Theme
+    from MainWindow import MainWindow
+    from style_sheet import styleSheetManager
+
+    window = MainWindow("benchmark")
+    # 打开所有页面，保证每个页面都参与切换
+    for page in (window.settingInterface, window.stopWatchInterface, window.focusInterface):
+        window.switchTo(page)
+        QApplication.processEvents()
+
+    timings = []
+    for i in range(args.switches):
+        theme = Theme.DARK if i % 2 == 0 else Theme.LIGHT
+        if args.legacy:
+            timings.append(legacySwitch(theme, window.settingInterface.ensureWidget()))
+        else:
+            timings.append(styleSheetManager.switchTheme(theme))
+        # 包含切换后的重绘
+        start = time.perf_counter()
+        QApplication.processEvents()
+        timings[-1] += (time.perf_counter() - start) * 1000
+
+    mode = "legacy" if args.legacy else "batched"
+    print(f"{mode}: {len(timings)} 次切换, 平均 {statistics.mean(timings):.1f} ms, "
+          f"中位数 {statistics.median(timings):.1f} ms, 最大 {max(timings):.1f} ms")
+
+    window.close()
+    app.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+""" 计时基准
+
+专注和休息的时长只用不含睡眠的单调时钟（activeTime）计算，不受 NTP 校时、
+手动改时间和夏令时影响，睡眠期间不算专注，休息倒计时也会暂停；墙上时钟只用来显示时刻和判断日期。
+
+每次全局时钟唤醒时顺便比较各个时钟的增量：
+- 含睡眠的单调时钟比清醒时钟多走的部分是睡眠时长；
+- 墙上时钟与含睡眠的单调时钟之差是墙上时钟的跳变。
+全局时钟只在有订阅者时唤醒，空闲时另有一个粗粒度的检查定时器（每 WATCH_INTERVAL 一次），
+应用重新激活时也检查一次，保证唤醒后最多几分钟就能发现睡眠。
+
+本地日期变化只设置一个截止到下一个零点的定时器；睡眠或时钟跳变后重新设置。
+"""
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+
+from clock_service import clockService
+
+
+def _platformClocks():
+    """ 返回 (清醒时钟, 含睡眠的单调时钟)，后者不可用时为 None
+
+    Linux：CLOCK_MONOTONIC 不含睡眠，CLOCK_BOOTTIME 含睡眠；
+    Windows：QueryUnbiasedInterruptTime 不含睡眠，time.monotonic 含睡眠；
+    macOS：time.monotonic 不含睡眠，没有可用的含睡眠单调时钟。
+    """
+    if hasattr(time, "CLOCK_BOOTTIME"):
+        return time.monotonic, lambda: time.clock_gettime(time.CLOCK_BOOTTIME)
+
+    if sys.platform == "win32":
+        import ctypes
+
+        counter = ctypes.c_ulonglong()
+        query = ctypes.windll.kernel32.QueryUnbiasedInterruptTime
+
+        def unbiased():
+            query(ctypes.byref(counter))
+            return counter.value / 1e7   # 100 纳秒为单位
+
+        return unbiased, time.monotonic
+
+    return time.monotonic, None
+
+
+_activeClock, _bootClock = _platformClocks()
+
+
+def splitByDay(start, end):
+    """ 把 [start, end] 墙上时间戳区间按本地零点切开，返回 [(日期, 秒数)] """
+    result = []
+    while start < end:
+        day = datetime.fromtimestamp(start).date()
+        midnight = datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+        stop = min(end, midnight)
+        result.append((day, stop - start))
+        start = stop
+    return result
+
+
+class Timekeeper(QObject):
+    """ 计时基准：单调的清醒时间、睡眠与时钟跳变检测、本地零点 """
+    suspended = pyqtSignal(float)     # 检测到系统睡眠，参数为睡眠秒数
+    clockJumped = pyqtSignal(float)   # 墙上时钟跳变，参数为跳变秒数（负数表示向后）
+    dayChanged = pyqtSignal(object)   # 本地日期变化，参数为新的日期
+
+    THRESHOLD = 2.0   # 两种时钟增量相差超过该秒数才认为发生了睡眠或跳变
+    WATCH_INTERVAL = 5 * 60 * 1000   # 空闲时检查睡眠和跳变的间隔（毫秒）
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._active = _activeClock()
+        self._wall = time.time()
+        self._boot = _bootClock() if _bootClock else None
+        self.today = date.today()
+        self._midnightTimer = None
+        self._watchTimer = None
+
+    def activeTime(self):
+        """ 不含睡眠的单调秒数，用于计算专注和休息时长 """
+        return _activeClock()
+
+    # ================ 时钟比较 ================
+    def sample(self):
+        """ 比较时钟增量，检测睡眠和跳变，返回是否检测到 """
+        active, wall = _activeClock(), time.time()
+        activeDelta, wallDelta = active - self._active, wall - self._wall
+        self._active, self._wall = active, wall
+
+        if _bootClock is not None:
+            boot = _bootClock()
+            bootDelta, self._boot = boot - self._boot, boot
+            sleep = bootDelta - activeDelta
+            jump = wallDelta - bootDelta
+        else:
+            # 向前的差值无法区分睡眠和调时，按睡眠处理
+            skew = wallDelta - activeDelta
+            sleep, jump = (skew, 0.0) if skew > 0 else (0.0, skew)
+
+        changed = False
+        if sleep > self.THRESHOLD:
+            self.suspended.emit(sleep)
+            changed = True
+        if abs(jump) > self.THRESHOLD:
+            self.clockJumped.emit(jump)
+            changed = True
+
+        if changed:
+            self._checkDay()
+        return changed
+
+    # ================ 本地零点 ================
+    def start(self):
+        """ 开始跟踪日期变化，检查睡眠和跳变
+
+        全局时钟唤醒时顺便检查；全局时钟没有订阅者时由检查定时器和应用激活兜底，
+        不依赖任何页面正在刷新。
+        """
+        if self._midnightTimer is None:
+            clockService.wokeUp.connect(self.sample)
+            self._midnightTimer = QTimer(self)
+            self._midnightTimer.setSingleShot(True)
+            self._midnightTimer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._midnightTimer.timeout.connect(self._onMidnight)
+
+            self._watchTimer = QTimer(self)
+            self._watchTimer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+            self._watchTimer.timeout.connect(self._onMidnight)
+            self._watchTimer.start(self.WATCH_INTERVAL)
+
+            app = QGuiApplication.instance()
+            if app is not None:
+                app.applicationStateChanged.connect(self._onApplicationStateChanged)
+        self._armMidnight()
+
+    def nextMidnight(self):
+        """ 下一个本地零点的时间戳，夏令时切换日也是准确的 """
+        return datetime.combine(self.today + timedelta(days=1), datetime.min.time()).timestamp()
+
+    def _armMidnight(self):
+        if self._midnightTimer is None:
+            return
+        delay = (self.nextMidnight() - time.time()) * 1000
+        self._midnightTimer.start(int(min(max(delay, 0) + 1, 2 ** 31 - 1)))
+
+    def _onMidnight(self):
+        """ 零点定时器或检查定时器到期：检查睡眠和跳变，日期变化时发出 dayChanged """
+        self.sample()
+        self._checkDay()
+
+    def _onApplicationStateChanged(self, state):
+        if state == Qt.ApplicationState.ApplicationActive:
+            self._onMidnight()
+
+    def _checkDay(self):
+        """ 日期变化时发出 dayChanged（跨多天只发一次），并重新设置零点定时器 """
+        today = date.today()
+        if today != self.today:
+            self.today = today
+            self.dayChanged.emit(today)
+        self._armMidnight()
+
+
+timekeeper = Timekeeper()
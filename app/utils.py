@@ -6,6 +6,8 @@ class SignalBus(QObject):
     """ 信号总线 """
     micaEnableChanged = pyqtSignal(bool) # 亚克力效果开关信号
     minimizeToTrayChanged = pyqtSignal(bool)  # 最小化到托盘信号
+    backgroundModeChanged = pyqtSignal(bool)  # 后台模式信号（窗口最小化或隐藏到托盘）
+    automationEnabledChanged = pyqtSignal(bool)  # 本地自动化接口开关信号
 
 signalBus = SignalBus()
 def showHelpMessageBox(window):